@@ -0,0 +1,16 @@
+"""
+Loads convert-pulse2easy.py as a module for the benchmark scripts.
+The hyphen in the script name rules out a plain import.
+"""
+import importlib.util
+import os
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(REPO_DIR, "convert-pulse2easy.py")
+
+
+def load_converter():
+    spec = importlib.util.spec_from_file_location("pulse2easy", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
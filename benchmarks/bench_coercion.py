@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the type coercion step on EQ-heavy presets.
+
+Compares the old path (copy.deepcopy followed by the exception-driven
+convert_value) with the current single-pass convert_value.
+
+Usage: python3 benchmarks/bench_coercion.py [--bands 32] [--repeat 5]
+"""
+import argparse
+import copy
+import random
+import timeit
+
+from _loader import load_converter
+from generate_corpus import make_equalizer
+
+
+def legacy_convert_value(v):
+    """
+    convert_value() as it was before the single-pass rewrite.
+    """
+    if isinstance(v, str):
+        v_low = v.lower()
+        if v_low == "true":
+            return True
+        if v_low == "false":
+            return False
+        try:
+            if "." in v or "e" in v.lower():
+                return float(v)
+            else:
+                return int(v)
+        except ValueError:
+            return v
+    elif isinstance(v, list):
+        return [legacy_convert_value(i) for i in v]
+    elif isinstance(v, dict):
+        return {k: legacy_convert_value(val) for k, val in v.items()}
+    return v
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument(
+        "--bands", type=int, default=32, help="Bands per channel (default: 32)."
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Timing repeats (default: 5)."
+    )
+    args = parser.parse_args()
+
+    converter = load_converter()
+    block = make_equalizer(args.bands, random.Random(42))
+
+    assert converter.convert_value(block) == legacy_convert_value(copy.deepcopy(block))
+
+    candidates = [
+        (
+            "deepcopy + legacy convert_value",
+            lambda: legacy_convert_value(copy.deepcopy(block)),
+        ),
+        ("single-pass convert_value", lambda: converter.convert_value(block)),
+    ]
+
+    number = 2000
+    results = []
+    for name, func in candidates:
+        best = min(timeit.repeat(func, number=number, repeat=args.repeat))
+        results.append((name, best / number * 1e6))
+
+    baseline = results[0][1]
+    print(
+        f"Equalizer block, {args.bands} bands per channel "
+        f"({number} runs, best of {args.repeat}):"
+    )
+    for name, usec in results:
+        print(f"  {name:<34} {usec:9.1f} us/block   x{baseline / usec:.2f}")
+
+
+if __name__ == "__main__":
+    main()
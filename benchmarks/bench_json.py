@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the JSON backend on converted presets.
+
+Compares stdlib parsing with _json_loads() and the indented stdlib output
+with the --compact output of _json_dumps() (orjson when installed).
+Before timing, every preset of the corpus is checked to parse and
+serialize to exactly the same data and bytes with both backends;
+the script exits with status 1 on any mismatch.
+
+Usage: python3 benchmarks/bench_json.py [--count 300] [--repeat 5]
+"""
+import argparse
+import json
+import sys
+import timeit
+
+from _loader import load_converter
+from generate_corpus import generate_corpus
+
+
+def check_identical(converter, sources, outputs):
+    """
+    Returns the number of presets where the backend differs from the stdlib.
+    """
+    mismatches = 0
+    for source, output in zip(sources, outputs):
+        if repr(converter._json_loads(source)) != repr(json.loads(source)):
+            mismatches += 1
+        expected = json.dumps(output, separators=converter.COMPACT_SEPARATORS)
+        if converter._json_dumps(output, compact=True) != expected.encode("utf-8"):
+            mismatches += 1
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument(
+        "--count", type=int, default=300, help="Presets in the corpus (default: 300)."
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Timing repeats (default: 5)."
+    )
+    args = parser.parse_args()
+
+    converter = load_converter()
+    options = converter.ConversionOptions()
+    corpus = list(generate_corpus(args.count))
+    sources = [json.dumps(preset, indent=4).encode("utf-8") for preset in corpus]
+    outputs = [converter.convert_preset(preset, options).preset for preset in corpus]
+
+    mismatches = check_identical(converter, sources, outputs)
+    if mismatches:
+        print(f"{mismatches} backend mismatches against the stdlib.")
+        sys.exit(1)
+
+    backend = "orjson" if converter.orjson is not None else "stdlib"
+    candidates = [
+        ("parse: json.loads", lambda: [json.loads(s) for s in sources]),
+        (f"parse: _json_loads ({backend})", lambda: [
+            converter._json_loads(s) for s in sources
+        ]),
+        ("write: json.dumps indent=4", lambda: [
+            json.dumps(o, indent=4).encode("utf-8") for o in outputs
+        ]),
+        ("write: json.dumps compact", lambda: [
+            json.dumps(o, separators=converter.COMPACT_SEPARATORS).encode("utf-8")
+            for o in outputs
+        ]),
+        (f"write: --compact ({backend})", lambda: [
+            converter._json_dumps(o, compact=True) for o in outputs
+        ]),
+    ]
+
+    print(f"{len(corpus)} presets, best of {args.repeat}; output bytes identical.")
+    for name, func in candidates:
+        best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print(f"  {name:<34} {best / len(corpus) * 1e6:9.1f} us/preset")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Generates a synthetic corpus of realistic PulseEffects presets.
+
+Every plugin known to the converter is covered, plus plugins it does not
+map, 10 to 32 band equalizers, duplicate plugin instances and string-typed
+values like the real PulseEffects format. The same seed always produces
+the same corpus.
+
+Usage: python3 benchmarks/generate_corpus.py OUTDIR [--count 1000] [--seed 1] [--shared 0]
+"""
+import argparse
+import copy
+import json
+import os
+import random
+
+
+def _num(rng, low, high, digits=2):
+    return str(round(rng.uniform(low, high), digits))
+
+
+def _bool(rng, p=0.5):
+    return "true" if rng.random() < p else "false"
+
+
+def make_equalizer(bands, rng):
+    """
+    Builds a string-typed PulseEffects equalizer block with `bands` bands per side.
+    """
+    def side():
+        return {
+            f"band{i}": {
+                "frequency": str(round(20.0 * 1.22 ** i, 2)),
+                "gain": _num(rng, -12.0, 12.0),
+                "mode": rng.choice(["RLC (BT)", "RLC (MT)", "BWC (BT)", "LRX (MT)"]),
+                "mute": "false",
+                "q": _num(rng, 0.5, 4.0),
+                "slope": rng.choice(["x1", "x2", "x3", "x4"]),
+                "solo": "false",
+                "type": rng.choice(["Bell", "Lo-shelf", "Hi-shelf", "Notch"]),
+                "width": "4",
+            }
+            for i in range(bands)
+        }
+
+    return {
+        "state": _bool(rng, 0.9),
+        "input-gain": _num(rng, -6.0, 3.0),
+        "output-gain": _num(rng, -6.0, 3.0),
+        "num-bands": str(bands),
+        "split-channels": _bool(rng, 0.2),
+        "left": side(),
+        "right": side(),
+    }
+
+
+def _gains(rng):
+    return {"input-gain": _num(rng, -6.0, 6.0), "output-gain": _num(rng, -6.0, 6.0)}
+
+
+# Old PulseEffects plugin name -> block builder
+PLUGIN_BUILDERS = {
+    "autogain": lambda rng: dict(
+        _gains(rng),
+        **{
+            "target": _num(rng, -30.0, -10.0),
+            "detect-silence": _bool(rng),
+            "use-geometric-mean": _bool(rng),
+            "weight-m": "1",
+            "weight-s": "1",
+            "weight-i": "1",
+        }
+    ),
+    "limiter": lambda rng: dict(
+        _gains(rng),
+        **{
+            "limit": _num(rng, -12.0, 0.0),
+            "lookahead": _num(rng, 1.0, 10.0),
+            "release": _num(rng, 1.0, 100.0),
+            "auto-level": _bool(rng),
+            "asc": _bool(rng),
+            "asc-level": _num(rng, 0.0, 1.0),
+            "oversampling": str(rng.randint(1, 4)),
+        }
+    ),
+    "maximizer": lambda rng: {
+        "release": _num(rng, 1.0, 100.0),
+        "ceiling": _num(rng, -6.0, 0.0),
+        "threshold": _num(rng, -12.0, 0.0),
+    },
+    "loudness": lambda rng: {
+        "input": _num(rng, -6.0, 0.0),
+        "fft": rng.choice(["1024", "2048", "4096", "8192"]),
+        "volume": _num(rng, -30.0, 0.0),
+        "std": rng.choice(["ISO226-2003", "Flat"]),
+    },
+    "compressor": lambda rng: dict(
+        _gains(rng),
+        **{
+            "mode": rng.choice(["Downward", "Downward", "Upward"]),
+            "attack": _num(rng, 1.0, 50.0),
+            "release": _num(rng, 10.0, 500.0),
+            "threshold": _num(rng, -40.0, 0.0),
+            "ratio": _num(rng, 1.0, 10.0),
+            "knee": _num(rng, -12.0, 0.0),
+            "makeup": _num(rng, 0.0, 12.0),
+            "detection": rng.choice(["RMS", "Peak", "LPF", "SMA"]),
+            "stereo-link": rng.choice(["Average", "Maximum"]),
+            "release-threshold": _num(rng, -160.0, -40.0),
+            "lookahead": _num(rng, 0.0, 10.0),
+            "wet": _num(rng, 0.0, 100.0),
+            "dry": _num(rng, 0.0, 100.0),
+        }
+    ),
+    "filter": lambda rng: dict(
+        _gains(rng),
+        **{
+            "mode": rng.choice(
+                [
+                    "12dB/oct Lowpass",
+                    "24dB/oct Highpass",
+                    "36dB/oct Bandpass",
+                    "6dB/oct Notch",
+                    "48dB/oct Lowpass",
+                ]
+            ),
+            "frequency": _num(rng, 20.0, 20000.0),
+            "resonance": _num(rng, 0.1, 4.0),
+            "inertia": _num(rng, 0.0, 100.0),
+        }
+    ),
+    "gate": lambda rng: dict(
+        _gains(rng),
+        **{
+            "range": _num(rng, -60.0, -10.0),
+            "threshold": _num(rng, -60.0, -10.0),
+            "knee": _num(rng, 0.0, 9.0),
+            "attack": _num(rng, 0.1, 50.0),
+            "release": _num(rng, 10.0, 500.0),
+            "makeup": _num(rng, 0.0, 6.0),
+            "ratio": _num(rng, 1.0, 4.0),
+            "detection": rng.choice(["RMS", "Peak"]),
+            "stereo-link": rng.choice(["Average", "Maximum"]),
+        }
+    ),
+    "multiband_compressor": lambda rng: dict(
+        _gains(rng),
+        **{
+            "freq0": _num(rng, 50.0, 200.0),
+            "freq1": _num(rng, 400.0, 1200.0),
+            "freq2": _num(rng, 2000.0, 8000.0),
+            "mode": rng.choice(["LR4", "LR8"]),
+            "subband": {"threshold": _num(rng, -30.0, 0.0), "ratio": "2"},
+            "lowband": {"threshold": _num(rng, -30.0, 0.0), "ratio": "2"},
+            "midband": {"threshold": _num(rng, -30.0, 0.0), "ratio": "2"},
+            "highband": {"threshold": _num(rng, -30.0, 0.0), "ratio": "2"},
+        }
+    ),
+    "multiband_gate": lambda rng: dict(
+        _gains(rng),
+        **{
+            "freq0": _num(rng, 50.0, 200.0),
+            "freq1": _num(rng, 400.0, 1200.0),
+            "freq2": _num(rng, 2000.0, 8000.0),
+            "mode": "LR4",
+            "subband": {"range": "-24", "threshold": "-24"},
+            "lowband": {"range": "-24", "threshold": "-24"},
+        }
+    ),
+    "convolver": lambda rng: dict(
+        _gains(rng),
+        **{
+            "kernel-path": f"/home/user/irs/room{rng.randint(1, 50)}.irs",
+            "ir-width": str(rng.randint(0, 200)),
+        }
+    ),
+    "crystalizer": lambda rng: dict(
+        _gains(rng), **{"intensity": _num(rng, 0.0, 10.0), "aggressive": _bool(rng)}
+    ),
+    "pitch": lambda rng: dict(
+        _gains(rng),
+        **{
+            "cents": _num(rng, -100.0, 100.0),
+            "semitones": str(rng.randint(-12, 12)),
+            "octaves": str(rng.randint(-1, 1)),
+            "crispness": str(rng.randint(0, 3)),
+            "formant-preserving": _bool(rng),
+        }
+    ),
+    "rnnoise": lambda rng: dict(
+        _gains(rng),
+        **{
+            "model-path": rng.choice(["Standard RNNoise Model", "/usr/share/rnn/x.rnnn"]),
+            "wet": _num(rng, 0.0, 100.0),
+        }
+    ),
+    "bass_enhancer": lambda rng: dict(
+        _gains(rng),
+        **{
+            "amount": _num(rng, 0.0, 12.0),
+            "harmonics": _num(rng, 0.0, 10.0),
+            "scope": _num(rng, 10.0, 250.0),
+            "floor": _num(rng, 10.0, 120.0),
+            "blend": _num(rng, -10.0, 10.0),
+            "floor-active": _bool(rng),
+            "listen": "false",
+        }
+    ),
+    "exciter": lambda rng: dict(
+        _gains(rng),
+        **{
+            "amount": _num(rng, 0.0, 12.0),
+            "harmonics": _num(rng, 0.0, 10.0),
+            "scope": _num(rng, 2000.0, 12000.0),
+            "ceil": _num(rng, 10000.0, 20000.0),
+            "blend": _num(rng, -10.0, 10.0),
+            "ceil-active": _bool(rng),
+            "listen": "false",
+        }
+    ),
+    "reverb": lambda rng: dict(
+        _gains(rng),
+        **{
+            "room-size": rng.choice(["Small", "Medium", "Large", "Large/smooth"]),
+            "decay-time": _num(rng, 0.4, 8.0),
+            "hf-damp": _num(rng, 2000.0, 20000.0),
+            "diffusion": _num(rng, 0.0, 1.0),
+            "amount": _num(rng, -30.0, 0.0),
+            "dry": _num(rng, -30.0, 0.0),
+            "predelay": _num(rng, 0.0, 100.0),
+            "bass-cut": _num(rng, 20.0, 500.0),
+            "treble-cut": _num(rng, 2000.0, 20000.0),
+        }
+    ),
+    "stereo_tools": lambda rng: dict(
+        _gains(rng),
+        **{
+            "balance-in": _num(rng, -1.0, 1.0),
+            "balance-out": _num(rng, -1.0, 1.0),
+            "softclip": _bool(rng),
+            "middle-level": _num(rng, 0.0, 100.0),
+            "side-level": _num(rng, 0.0, 100.0),
+            "stereo-base": _num(rng, -1.0, 1.0),
+            "delay": _num(rng, -20.0, 20.0),
+            "sc-level": _num(rng, 0.0, 2.0),
+            "stereo-phase": _num(rng, 0.0, 360.0),
+        }
+    ),
+    "crossfeed": lambda rng: {
+        "fcut": str(rng.randint(300, 2000)),
+        "feed": _num(rng, 1.0, 15.0),
+    },
+    "deesser": lambda rng: dict(
+        _gains(rng),
+        **{
+            "detection": rng.choice(["RMS", "Peak"]),
+            "mode": rng.choice(["Wide", "Split"]),
+            "threshold": _num(rng, -40.0, 0.0),
+            "ratio": _num(rng, 1.0, 10.0),
+            "makeup": _num(rng, 0.0, 6.0),
+            "f1-freq": _num(rng, 2000.0, 8000.0),
+            "f2-freq": _num(rng, 4000.0, 12000.0),
+            "f1-level": _num(rng, -12.0, 12.0),
+            "f2-level": _num(rng, -12.0, 12.0),
+            "f2-q": _num(rng, 0.5, 4.0),
+        }
+    ),
+    "delay": lambda rng: dict(
+        _gains(rng),
+        **{
+            "time-l": _num(rng, 0.0, 100.0),
+            "time-r": _num(rng, 0.0, 100.0),
+            "wet-l": _num(rng, 0.0, 100.0),
+            "dry-r": _num(rng, 0.0, 100.0),
+        }
+    ),
+    # Plugins the converter does not map
+    "level_meter": lambda rng: {},
+    "speex": lambda rng: dict(
+        _gains(rng),
+        **{
+            "enable-denoise": _bool(rng),
+            "noise-suppression": str(rng.randint(-70, -1)),
+            "enable-agc": _bool(rng),
+        }
+    ),
+    "webrtc": lambda rng: dict(
+        _gains(rng),
+        **{
+            "echo-cancel": _bool(rng),
+            "noise-suppression": _bool(rng),
+            "noise-suppression-level": rng.choice(["low", "moderate", "high"]),
+            "gain-control": _bool(rng),
+            "target-level-dbfs": str(rng.randint(0, 31)),
+        }
+    ),
+    "echo_canceller": lambda rng: dict(
+        _gains(rng), **{"frame-size": str(rng.choice([10, 20, 40]))}
+    ),
+}
+
+
+def generate_preset(rng):
+    """
+    Builds one PulseEffects preset dict.
+    """
+    names = rng.sample(sorted(PLUGIN_BUILDERS), rng.randint(3, 14))
+    if "equalizer" not in names and rng.random() < 0.8:
+        names.append("equalizer")
+
+    output = {}
+    for name in names:
+        if name == "equalizer":
+            output[name] = make_equalizer(rng.randint(10, 32), rng)
+        else:
+            output[name] = PLUGIN_BUILDERS[name](rng)
+            output[name]["state"] = _bool(rng, 0.8)
+
+    order = list(names)
+    rng.shuffle(order)
+    # Duplicate instances: the same block listed more than once
+    for _ in range(rng.choice([0, 0, 0, 1, 2])):
+        order.insert(rng.randint(0, len(order)), rng.choice(names))
+
+    output["plugins_order"] = order
+    return {"output": output}
+
+
+SHARED_POOL_SIZE = 20  # Distinct shared blocks per plugin
+
+
+def generate_corpus(count, seed=1, shared=0.0):
+    """
+    Yields `count` presets, always the same ones for the same seed.
+    With `shared` > 0, that fraction of plugin blocks is a copy of a block
+    from an earlier preset, like libraries where the same EQ or compressor
+    settings were pasted into many presets.
+    """
+    rng = random.Random(seed)
+    pool = {}  # plugin name -> blocks available for sharing
+    for _ in range(count):
+        preset = generate_preset(rng)
+        if shared:
+            output = preset["output"]
+            for name in sorted(set(output["plugins_order"])):
+                blocks = pool.setdefault(name, [])
+                if blocks and rng.random() < shared:
+                    output[name] = copy.deepcopy(rng.choice(blocks))
+                elif len(blocks) < SHARED_POOL_SIZE:
+                    blocks.append(output[name])
+        yield preset
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("outdir", help="Directory to write the presets to.")
+    parser.add_argument(
+        "--count", type=int, default=1000, help="Number of presets (default: 1000)."
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Random seed (default: 1).")
+    parser.add_argument(
+        "--shared",
+        type=float,
+        default=0.0,
+        help="Fraction of plugin blocks copied from earlier presets (default: 0).",
+    )
+    args = parser.parse_args()
+
+    os.makedirs(args.outdir, exist_ok=True)
+    corpus = generate_corpus(args.count, args.seed, args.shared)
+    for i, preset in enumerate(corpus):
+        path = os.path.join(args.outdir, f"synthetic_{i:05d}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(preset, f, indent=4)
+    print(f"Wrote {args.count} presets to {args.outdir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Benchmarks the converter on a synthetic PulseEffects corpus.
+
+For every volume mode this reports presets per second (conversion alone
+and including JSON serialization), the time spent in each plugin
+converter and the peak memory of a conversion pass. Results can be saved
+and compared against an earlier run to catch regressions.
+
+Usage:
+  python3 benchmarks/run_benchmarks.py [--count 500] [--save results.json]
+  python3 benchmarks/run_benchmarks.py --baseline results.json [--tolerance 10]
+  python3 benchmarks/run_benchmarks.py --shared 0.5 --block-cache
+"""
+import argparse
+import collections
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from _loader import load_converter
+from generate_corpus import generate_corpus
+
+
+def _timed(func, stats, name):
+    """
+    Wraps a plugin converter so its calls and time add up in stats[name].
+    """
+    def wrapper(data, args):
+        start = time.perf_counter()
+        try:
+            return func(data, args)
+        finally:
+            entry = stats[name]
+            entry[0] += 1
+            entry[1] += time.perf_counter() - start
+
+    return wrapper
+
+
+def bench_mode(converter, corpus, volume_mode, repeat):
+    """
+    Runs all benchmarks for one volume mode and returns its result dict.
+    """
+    options = converter.ConversionOptions(volume_mode=volume_mode)
+    convert_preset = converter.convert_preset
+
+    # Throughput: best of `repeat` passes
+    convert_times, serialize_times = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [convert_preset(preset, options).preset for preset in corpus]
+        convert_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for result in results:
+            json.dumps(result, indent=4)
+        serialize_times.append(time.perf_counter() - start)
+        del results
+
+    # Per-converter time: one instrumented pass
+    stats = collections.defaultdict(lambda: [0, 0.0])
+    originals = dict(converter.PARAM_CONVERTERS)
+    try:
+        for name, func in originals.items():
+            converter.PARAM_CONVERTERS[name] = _timed(func, stats, name)
+        for preset in corpus:
+            convert_preset(preset, options)
+    finally:
+        converter.PARAM_CONVERTERS.update(originals)
+
+    # Peak memory: one traced pass, results discarded per preset
+    tracemalloc.start()
+    for preset in corpus:
+        convert_preset(preset, options)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    convert_sec = min(convert_times)
+    total_sec = convert_sec + min(serialize_times)
+    return {
+        "presets_per_sec": len(corpus) / convert_sec,
+        "presets_per_sec_with_json": len(corpus) / total_sec,
+        "convert_sec": convert_sec,
+        "serialize_sec": min(serialize_times),
+        "peak_memory_kib": peak / 1024.0,
+        "converters": {
+            name: {
+                "calls": calls,
+                "total_ms": seconds * 1e3,
+                "mean_us": seconds / calls * 1e6,
+            }
+            for name, (calls, seconds) in sorted(stats.items())
+        },
+    }
+
+
+def print_results(results):
+    for mode, r in results["modes"].items():
+        print(f"\n=== {mode} ===")
+        print(f"  presets/s (convert):        {r['presets_per_sec']:10.1f}")
+        print(f"  presets/s (convert + json): {r['presets_per_sec_with_json']:10.1f}")
+        print(f"  peak memory:                {r['peak_memory_kib']:10.1f} KiB")
+        print(f"  {'converter':<22}{'calls':>8}{'total ms':>12}{'mean us':>10}")
+        for name, c in r["converters"].items():
+            print(
+                f"  {name:<22}{c['calls']:>8}{c['total_ms']:>12.2f}{c['mean_us']:>10.1f}"
+            )
+
+
+def compare(results, baseline, tolerance):
+    """
+    Prints the change against a baseline run.
+    Returns the list of regressions beyond `tolerance` percent.
+    """
+    regressions = []
+    print(f"\n=== Compared to baseline (tolerance {tolerance:.0f}%) ===")
+    for mode, r in results["modes"].items():
+        base = baseline.get("modes", {}).get(mode)
+        if not base:
+            print(f"  {mode}: not in baseline")
+            continue
+
+        checks = [("presets/s", r["presets_per_sec"], base["presets_per_sec"], True)]
+        checks.append(
+            ("peak KiB", r["peak_memory_kib"], base["peak_memory_kib"], False)
+        )
+        for name, c in r["converters"].items():
+            if name in base["converters"]:
+                old = base["converters"][name]["mean_us"]
+                checks.append((f"{name} us", c["mean_us"], old, False))
+
+        for label, new, old, higher_is_better in checks:
+            change = (new - old) / old * 100.0 if old else 0.0
+            worse = -change if higher_is_better else change
+            flag = ""
+            if worse > tolerance:
+                flag = "  <-- REGRESSION"
+                regressions.append(f"{mode}: {label} {change:+.1f}%")
+            print(
+                f"  {mode:<12}{label:<30}{old:>12.1f} -> {new:>12.1f} "
+                f"({change:+.1f}%){flag}"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument(
+        "--count", type=int, default=500, help="Presets in the corpus (default: 500)."
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Corpus seed (default: 1).")
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Timed passes per mode (default: 3)."
+    )
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        metavar="MODE",
+        help="Volume modes to run (default: all).",
+    )
+    parser.add_argument(
+        "--shared",
+        type=float,
+        default=0.0,
+        help="Fraction of plugin blocks shared between presets (default: 0).",
+    )
+    parser.add_argument(
+        "--block-cache",
+        action="store_true",
+        help="""Keep the converter's block cache on. By default it is off so
+every timed pass measures real conversions.""",
+    )
+    parser.add_argument("--save", metavar="FILE", help="Save results as JSON.")
+    parser.add_argument(
+        "--baseline", metavar="FILE", help="Compare against saved results."
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=10.0,
+        help="Allowed slowdown in percent before failing (default: 10).",
+    )
+    args = parser.parse_args()
+
+    converter = load_converter()
+    if not args.block_cache:
+        converter.configure_block_cache(0)
+    corpus = list(generate_corpus(args.count, args.seed, args.shared))
+    modes = args.modes or list(converter.VOLUME_MODES)
+
+    results = {
+        "meta": {
+            "count": args.count,
+            "seed": args.seed,
+            "shared": args.shared,
+            "block_cache": args.block_cache,
+            "repeat": args.repeat,
+            "converter_version": converter.CONVERTER_VERSION,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "modes": {},
+    }
+    for mode in modes:
+        results["modes"][mode] = bench_mode(converter, corpus, mode, args.repeat)
+
+    print(f"Corpus: {args.count} presets (seed {args.seed})")
+    print_results(results)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to {args.save}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("meta", {}).get("count") != args.count:
+            print("\nNote: the baseline used a different corpus size.")
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) found.")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
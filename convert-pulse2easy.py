@@ -2,9 +2,41 @@
 import json
 import sys
 import os
-import copy
 import argparse  # Used for command-line arguments
+import atexit  # Closes the --event-log
 import math  # Added for dB conversion
+import array  # Columnar equalizer bands
+import re
+import types  # MappingProxyType for the shared band layouts
+import io
+import contextlib
+import collections
+import hashlib  # Used for the --incremental manifest
+import threading  # Per-thread diagnostics collection
+import time
+import tracemalloc  # Peak memory for --profile
+import ctypes  # inotify for --watch
+import ctypes.util
+import select
+import signal  # Clean --serve shutdown on SIGTERM
+import struct
+import itertools
+import fnmatch  # --include / --exclude patterns
+import tarfile  # Archive input/output
+import gzip
+import zipfile
+import marshal  # Fast private copies of cached plugin blocks
+import sqlite3  # Persistent --block-cache store
+import http.server  # --serve
+import socketserver
+import urllib.parse
+from concurrent.futures import ProcessPoolExecutor  # Used for --jobs
+from concurrent.futures import ThreadPoolExecutor  # Used for --pipeline
+
+try:
+    import orjson  # Optional: faster JSON parsing and compact output
+except ImportError:
+    orjson = None
 
 # --- Icons for legibility ---
 ICON_SUCCESS = "✅"
@@ -130,31 +162,404 @@ Version 1.4       Reworked both --volume-reset and --transparent modes. Everythi
 # We will not apply default or global gains to these.
 SELF_GAINED_PLUGINS = {"autogain", "maximizer", "loudness", "convolver"}
 
+# Bump this whenever a change alters converted output.
+# It is recorded in the --incremental manifest so stale outputs are rebuilt.
+CONVERTER_VERSION = "1.5"
+
+# Manifest stored next to the outputs for --incremental
+MANIFEST_NAME = ".pulse2easy-manifest.json"
+
 # --- End Configs ---
 
 
+# --- Diagnostics ---
+
+# Icon shown for each diagnostic level when printed
+LEVEL_ICONS = {
+    "success": ICON_SUCCESS,
+    "info": ICON_INFO,
+    "warning": ICON_WARN,
+    "error": ICON_ERROR,
+}
+
+
+class Diagnostic:
+    """
+    A single note emitted while converting a preset.
+
+    level:   "success", "info", "warning" or "error"
+    kind:    what happened, e.g. "clamp", "reset", "remap", "rebuild",
+             "coerce", "skip", "convert", "violation" or "error"
+    plugin:  the plugin it concerns (e.g. "compressor#0"), or None
+    key:     the affected parameter, if any
+    old/new: the value before and after, if any
+    """
+
+    __slots__ = ("level", "kind", "message", "plugin", "key", "old", "new")
+
+    def __init__(
+        self, level, kind, message, plugin=None, key=None, old=None, new=None
+    ):
+        self.level = level
+        self.kind = kind
+        self.message = message
+        self.plugin = plugin
+        self.key = key
+        self.old = old
+        self.new = new
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return f"Diagnostic({self.level!r}, {self.kind!r}, {self.message!r})"
+
+
+# Diagnostics of the conversion running on the current thread
+_context = threading.local()
+
+
+def _report(level, kind, message, key=None, old=None, new=None):
+    """
+    Records a diagnostic for the conversion running on this thread.
+    Outside of convert_preset() this does nothing.
+    """
+    diagnostics = getattr(_context, "diagnostics", None)
+    if diagnostics is not None:
+        plugin = getattr(_context, "plugin", None)
+        diagnostics.append(Diagnostic(level, kind, message, plugin, key, old, new))
+
+
+# --- Logging (--quiet / --verbose / --event-log) ---
+
+# How much of the log each --quiet/--verbose setting shows
+LOG_LEVELS = {"quiet": 0, "normal": 1, "verbose": 2}
+
+# The least verbose log level that still shows a line of each level
+LINE_LEVELS = {"error": 0, "warning": 1, "success": 1, "info": 1, "detail": 2}
+
+# The active log level, set from --quiet/--verbose
+_log_level = "normal"
+
+
+def _shown(level):
+    """
+    Whether log lines of level are shown at the current log level.
+    Errors are always shown, "detail" lines only with --verbose.
+    """
+    return LINE_LEVELS[level] <= LOG_LEVELS[_log_level]
+
+
+def _log(message, level="info", label=None):
+    """
+    Prints a log line unless the --quiet/--verbose setting hides its level.
+    Errors are also added to the --event-log, for the file label if given.
+    """
+    if _shown(level):
+        print(message)
+    if level == "error":
+        _log_error(label, message)
+
+
+def _buffer_stdout():
+    """
+    Stops flushing stdout after every line. Terminals get the log in
+    large writes instead of one write per line; input() still flushes
+    before prompting. Needs Python 3.7+, a no-op before.
+    """
+    reconfigure = getattr(sys.stdout, "reconfigure", None)
+    if reconfigure is not None:
+        reconfigure(line_buffering=False)
+
+
+class _EventLog:
+    """
+    The --event-log: one JSON object per line for every diagnostic and for
+    the result of every file. Without a path (in worker processes), or
+    while held, lines are kept in memory until take() hands them over.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.held = False
+        self._file = open(path, "w", encoding="utf-8") if path else None
+        self._pending = []
+
+    def emit(self, **event):
+        self.write([json.dumps(event, default=repr)])
+
+    def write(self, lines):
+        if self._file is None or self.held:
+            self._pending.extend(lines)
+        else:
+            for line in lines:
+                self._file.write(line + "\n")
+
+    def take(self):
+        lines, self._pending = self._pending, []
+        return lines
+
+    def flush(self):
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+
+
+# The active event log, or None when --event-log is not used
+_event_log = None
+
+
+def _configure_logging(level, event_log_path=None):
+    """
+    Sets the log level and opens the --event-log, closed at exit.
+    """
+    global _log_level, _event_log
+    _log_level = level
+    if event_log_path:
+        _event_log = _EventLog(event_log_path)
+        atexit.register(_event_log.close)
+
+
+def _log_diagnostics(label, diagnostics):
+    """
+    Adds one event per diagnostic of the file (or archive member) label.
+    """
+    if _event_log is not None:
+        for d in diagnostics:
+            _event_log.emit(
+                file=label,
+                plugin=d.plugin,
+                event=d.kind,
+                level=d.level,
+                key=d.key,
+                old=d.old,
+                new=d.new,
+                message=d.message,
+            )
+
+
+def _log_error(label, message):
+    """
+    Adds an "error" event for label (None if no file is concerned).
+    """
+    if _event_log is not None:
+        message = message.replace(ICON_ERROR, "").strip()
+        _event_log.emit(file=label, event="error", level="error", message=message)
+
+
+def _log_file(label, status):
+    """
+    Adds the event for the outcome of converting label.
+    """
+    if _event_log is not None:
+        _event_log.emit(file=label, event="file", status=status)
+
+
+# --- Profiling (--profile) ---
+
+
+class _Profiler:
+    """
+    Wall time and call counts per stage and per plugin type, plus the
+    tracemalloc peak. Only exists while --profile is active; the hot paths
+    check `_profiler` and skip all timing when it is None.
+    """
+
+    def __init__(self):
+        self.stages = {}  # stage -> [calls, seconds]
+        self.plugins = {}  # plugin type -> [calls, seconds]
+        self.peak_memory = 0
+
+    @staticmethod
+    def _add(table, name, start):
+        elapsed = time.perf_counter() - start
+        entry = table.get(name)
+        if entry is None:
+            table[name] = [1, elapsed]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed
+
+    def stage(self, name, start):
+        """Adds the time since `start` (a perf_counter value) to a stage."""
+        self._add(self.stages, name, start)
+
+    def plugin(self, name, start):
+        """Adds the time since `start` to a plugin type."""
+        self._add(self.plugins, name, start)
+
+    def sample_memory(self):
+        if tracemalloc.is_tracing():
+            self.peak_memory = max(self.peak_memory, tracemalloc.get_traced_memory()[1])
+
+    def snapshot(self):
+        """Returns the counters as plain data, e.g. to send from a worker."""
+        self.sample_memory()
+        return {
+            "stages": self.stages,
+            "plugins": self.plugins,
+            "peak_memory": self.peak_memory,
+        }
+
+    def merge(self, snapshot):
+        """Adds the counters of another profiler's snapshot."""
+        for table, other in (
+            (self.stages, snapshot["stages"]),
+            (self.plugins, snapshot["plugins"]),
+        ):
+            for name, (calls, seconds) in other.items():
+                entry = table.setdefault(name, [0, 0.0])
+                entry[0] += calls
+                entry[1] += seconds
+        self.peak_memory = max(self.peak_memory, snapshot["peak_memory"])
+
+    def report(self, files, wall_seconds):
+        """Returns the machine-readable stats for the --profile JSON file."""
+        self.sample_memory()
+
+        def table(entries):
+            return {
+                name: {
+                    "calls": calls,
+                    "seconds": round(seconds, 6),
+                    "mean_ms": round(seconds / calls * 1e3, 4),
+                }
+                for name, (calls, seconds) in sorted(
+                    entries.items(), key=lambda item: -item[1][1]
+                )
+            }
+
+        return {
+            "converter_version": CONVERTER_VERSION,
+            "files": files,
+            "wall_seconds": round(wall_seconds, 6),
+            "files_per_second": round(files / wall_seconds, 3) if wall_seconds else None,
+            "peak_memory_kib": round(self.peak_memory / 1024.0, 1),
+            "stages": table(self.stages),
+            "plugins": table(self.plugins),
+        }
+
+
+# The active profiler, or None when --profile is not used
+_profiler = None
+
+
+def _start_profiler():
+    """
+    Activates a fresh profiler (and tracemalloc) for this process.
+    """
+    global _profiler
+    _profiler = _Profiler()
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    return _profiler
+
+
+class _Progress:
+    """
+    A live progress line on stderr with files per second and an ETA.
+    Stays silent when stderr is not a terminal.
+    """
+
+    def __init__(self, total):
+        self.total = total
+        self.done = 0
+        self.start = time.perf_counter()
+        self._last_draw = 0.0
+        self._enabled = sys.stderr.isatty()
+
+    def update(self, done=1):
+        self.done += done
+        now = time.perf_counter()
+        if self._enabled and (now - self._last_draw >= 0.2 or self.done == self.total):
+            self._last_draw = now
+            self._draw(now)
+
+    def _draw(self, now):
+        elapsed = now - self.start
+        rate = self.done / elapsed if elapsed > 0 else 0.0
+        line = f"[{self.done}"
+        if self.total:
+            line += f"/{self.total}"
+        line += f"] {rate:.1f} files/s"
+        if self.total and rate > 0:
+            remaining = int((self.total - self.done) / rate)
+            line += f", ETA {remaining // 60}m{remaining % 60:02d}s"
+        sys.stderr.write("\r\033[K" + line)
+        sys.stderr.flush()
+
+    def finish(self):
+        if self._enabled:
+            sys.stderr.write("\n")
+            sys.stderr.flush()
+
+
+# --- Type Coercion ---
+
+# Plain decimal numbers, matched without raising and catching ValueError
+_INT_RE = re.compile(r"[+-]?[0-9]+\Z")
+_FLOAT_RE = re.compile(r"[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?\Z")
+
+# First characters that can start a number int()/float() would accept
+_NUMBER_LEADS = frozenset("+-.0123456789")
+
+_BOOL_STRINGS = {"true": True, "false": False}
+
+
+def _convert_string(v):
+    """
+    Converts a single string value to bool, int or float where possible.
+    Enum-like strings ("RMS", "Feed-forward") are recognised by their first
+    character and returned as-is without attempting a number parse.
+    """
+    lead = v[:1]
+    if not lead:
+        return v
+    if lead not in _NUMBER_LEADS and not (lead.isspace() or lead.isdigit()):
+        if len(v) <= 5:
+            return _BOOL_STRINGS.get(v.lower(), v)
+        return v
+
+    if _INT_RE.match(v):
+        return int(v)
+    if _FLOAT_RE.match(v):
+        return float(v)
+
+    # Rare forms (padding, digit separators, non-ASCII digits):
+    # defer to int()/float() exactly like the old format did.
+    try:
+        # Check for '.' or 'e' to decide float vs int
+        if "." in v or "e" in v.lower():
+            return float(v)
+        else:
+            return int(v)
+    except ValueError:
+        return v  # Keep as string if it's not a number (e.g., "12dB/oct")
+
+
 def convert_value(v):
     """
     Recursively convert string values ("true", "false", "1.0")
     from the old preset format to native Python types.
+    Builds the new tree in a single pass; the input is never modified,
+    so there is no need to copy it first.
     """
+    t = type(v)
+    if t is str:
+        return _convert_string(v)
+    if t is dict:
+        return {k: convert_value(val) for k, val in v.items()}
+    if t is list:
+        return [convert_value(i) for i in v]
+    # Subclasses of str/dict/list are rare; check them last
     if isinstance(v, str):
-        v_low = v.lower()
-        if v_low == "true":
-            return True
-        if v_low == "false":
-            return False
-        try:
-            # Check for '.' or 'e' to decide float vs int
-            if "." in v or "e" in v.lower():
-                return float(v)
-            else:
-                return int(v)
-        except ValueError:
-            return v  # Keep as string if it's not a number (e.g., "RMS")
-    elif isinstance(v, list):
+        return _convert_string(v)
+    if isinstance(v, list):
         return [convert_value(i) for i in v]
-    elif isinstance(v, dict):
+    if isinstance(v, dict):
         return {k: convert_value(val) for k, val in v.items()}
     return v
 
@@ -168,8 +573,12 @@ def _ensure_floats(data, keys):
                 data[key] = float(data[key])
             except (ValueError, TypeError):
                 if not isinstance(data[key], (float, int)):
-                    print(
-                        f"        {ICON_WARN} Could not convert {key}: {data[key]} to float."
+                    _report(
+                        "warning",
+                        "coerce",
+                        f"Could not convert {key}: {data[key]} to float.",
+                        key=key,
+                        old=data[key],
                     )
     return data
 
@@ -201,6 +610,7 @@ def _recursive_reset_gains(data, value):
     """
     Recursively traverses a dict/list and overwrites any key
     from GAIN_KEYS_TO_RESET with the new value.
+    Only used for sub-objects that GAIN_KEY_INDEX does not know about.
     """
     if isinstance(data, dict):
         for key, val in data.items():
@@ -219,26 +629,45 @@ def _recursive_reset_gains(data, value):
 # --- Scale Conversion Helpers ---
 
 
+# Slider values repeat a lot across presets; remember their dB instead of
+# running log10 every time. A plain dict that stops growing at its size
+# bound keeps hits as cheap as possible.
+AMP_DB_CACHE_SIZE = 4096
+_amp_db_cache = {}
+
+
+def _amplitude_to_db(amp):
+    """
+    Converts an amplitude (0-1 or 0-100) given as a float to dB.
+    """
+    # Normalize 0-100 scale to 0-1 if needed
+    if amp > 1.0:
+        amp = amp / 100.0
+
+    if amp <= 0.0:
+        return -100.0
+    elif amp >= 1.0:
+        return 0.0  # Map 1.0 (100%) to 0dB
+    else:
+        return max(-100.0, 20 * math.log10(amp))
+
+
 def _remap_amplitude_to_db_val(old_val):
     """
     Helper to convert a single old amplitude value (0-1 or 0-100) to dB.
     """
     try:
         amp = float(old_val)
-
-        # Normalize 0-100 scale to 0-1 if needed
-        if amp > 1.0:
-            amp = amp / 100.0
-
-        if amp <= 0.0:
-            return -100.0
-        elif amp >= 1.0:
-            return 0.0  # Map 1.0 (100%) to 0dB
-        else:
-            return max(-100.0, 20 * math.log10(amp))
     except (ValueError, TypeError):
         return -100.0  # Default to "off" on error
 
+    db = _amp_db_cache.get(amp)
+    if db is None:
+        db = _amplitude_to_db(amp)
+        if len(_amp_db_cache) < AMP_DB_CACHE_SIZE:
+            _amp_db_cache[amp] = db
+    return db
+
 
 def _remap_and_set_mix_db(data):
     """
@@ -273,7 +702,14 @@ def _remap_and_set_mix_db(data):
         data["dry"] = _remap_amplitude_to_db_val(old_dry_val)
 
     if found:
-        print(f"        {ICON_INFO} Remapping old dry/wet mix to dB scale.")
+        _report(
+            "info",
+            "remap",
+            "Remapping old dry/wet mix to dB scale.",
+            key="wet/dry",
+            old={"wet": old_wet_val, "dry": old_dry_val},
+            new={"wet": data["wet"], "dry": data["dry"]},
+        )
     return data
 
 
@@ -283,11 +719,13 @@ def _remap_stereo_mix_keys(data):
     """
     keys_to_remap = ["dry-l", "dry-r", "wet-l", "wet-r"]
     found = False
+    old_vals = {}
 
     for key in keys_to_remap:
         old_val = data.pop(key, None)
         if old_val is not None:
             found = True
+            old_vals[key] = old_val
             data[key] = _remap_amplitude_to_db_val(old_val)
         else:
             # Set EE default for this key
@@ -297,7 +735,14 @@ def _remap_stereo_mix_keys(data):
                 data[key] = -100.0
 
     if found:
-        print(f"        {ICON_INFO} Remapping old stereo dry/wet mix to dB scale.")
+        _report(
+            "info",
+            "remap",
+            "Remapping old stereo dry/wet mix to dB scale.",
+            key="/".join(old_vals),
+            old=old_vals,
+            new={key: data[key] for key in old_vals},
+        )
     return data
 
 
@@ -305,7 +750,7 @@ def _remap_amplitude_to_db(data, keys_to_remap, default_db=0.0):
     """
     Remaps specific gain keys from an old amplitude scale to the new dB scale.
     """
-    found = False
+    old_vals = {}
     for key in keys_to_remap:
         old_val = data.pop(key, None)
 
@@ -313,112 +758,55 @@ def _remap_amplitude_to_db(data, keys_to_remap, default_db=0.0):
             data[key] = default_db
             continue
 
-        found = True
+        old_vals[key] = old_val
         data[key] = _remap_amplitude_to_db_val(old_val)
 
-    if found:
-        print(f"        {ICON_INFO} Remapping old amplitude keys {keys_to_remap} to dB scale.")
+    if old_vals:
+        _report(
+            "info",
+            "remap",
+            f"Remapping old amplitude keys {keys_to_remap} to dB scale.",
+            key="/".join(old_vals),
+            old=old_vals,
+            new={key: data[key] for key in old_vals},
+        )
     return data
 
 
-# --- Special Converters for Incompatible Parameters ---
+# --- Structural Hooks ---
+# Conversion steps that do more than rename, drop, coerce or default a key.
+# Each takes the plugin dict and the options and returns the plugin dict.
 
 
-def _convert_autogain(data, args):
+def _autogain_reference(data, args):
     """
-    Converts old autogain parameters.
+    Maps old 'use-geometric-mean' to the new 'reference' choice.
     """
     if data.pop("use-geometric-mean", False):
         data["reference"] = "Geometric Mean (MSI)"
     else:
         data["reference"] = "RMS"  # Default fallback
-
-    [data.pop(k, None) for k in ["detect-silence", "weight-m", "weight-s", "weight-i"]]
-
-    float_keys = [
-        "input-gain",
-        "output-gain",
-        "maximum-history",
-        "silence-threshold",
-        "target",
-    ]
-    data = _ensure_floats(data, float_keys)
-    # Autogain manages its own level. No gain logic applied.
-    return data
-
-
-def _convert_maximizer(data, args):
-    """
-    Converts old 'limiter' OR 'maximizer' plugins to the new 'maximizer'.
-    """
-    if "limit" in data:
-        data["threshold"] = data.pop("limit")
-        [
-            data.pop(k, None)
-            for k in ["lookahead", "auto-level", "asc", "asc-level", "oversampling"]
-        ]
-
-    if "ceiling" in data:
-        data["output-gain"] = data.pop("ceiling")
-
-    float_keys = ["threshold", "output-gain", "release", "input-gain"]
-    data = _ensure_floats(data, float_keys)
-    # Maximizer manages its own level. No gain logic applied.
-    return data
-
-
-def _convert_loudness(data, args):
-    """
-    Converts old loudness parameters.
-    """
-    if "input" in data:
-        data["input-gain"] = data.pop("input")
-
-    if "fft" in data:
-        data["fft"] = str(data["fft"])
-
-    float_keys = [
-        "input-gain",
-        "link-gain",
-        "makeup-gain",
-        "output-gain",
-        "volume",
-        "clipping-range",
-    ]
-    data = _ensure_floats(data, float_keys)
-    # Loudness manages its own level. No gain logic applied.
     return data
 
 
-def _convert_compressor(data, args):
+def _compressor_sidechain(data, args):
     """
-    Converts old compressor/expander parameters and builds a new valid sidechain.
+    Builds a new valid compressor sidechain.
+    Upward (expander) mode gets an internal sidechain.
     """
-    if data.get("release-threshold", 0) < -100.0:
-        data["release-threshold"] = -100.0
-        print(f"        {ICON_WARN} Clamped compressor 'release-threshold' to -100.0 dB.")
-
-    float_keys = [
-        "attack",
-        "release",
-        "ratio",
-        "threshold",
-        "knee",
-        "makeup",
-        "release-threshold",
-        "boost-amount",
-        "boost-threshold",
-        "hpf-frequency",
-        "lpf-frequency",
-    ]
-    data = _ensure_floats_simple(data, args, float_keys)
-
     # --- Start Expander/Compressor Logic ---
     # Detect mode *before* setting defaults
     original_mode = data.get("mode", "Downward")
     sc_type = "Internal" if original_mode == "Upward" else "Feed-forward"
     if original_mode == "Upward":
-        print(f"        {ICON_INFO} Detected Upward mode; configuring as Expander.")
+        _report(
+            "info",
+            "remap",
+            "Detected Upward mode; configuring as Expander.",
+            key="sidechain.type",
+            old=original_mode,
+            new=sc_type,
+        )
     # --- End Expander/Compressor Logic ---
 
     # Rebuild the sidechain structure completely
@@ -438,24 +826,28 @@ def _convert_compressor(data, args):
         "stereo-split-source": "Left/Right",
         "type": sc_type,  # Use the detected type
     }
+    return data
 
-    # Remap mix keys from 0-100 scale to dB scale
-    data = _remap_and_set_mix_db(data)
 
-    # Add other missing top-level keys
-    data.setdefault("mode", original_mode) # Preserve original mode
-    data.setdefault("boost-amount", 6.0)
-    data.setdefault("boost-threshold", -72.0)
-    data.setdefault("hpf-mode", "off")
-    data.setdefault("hpf-frequency", 10.0)
-    data.setdefault("lpf-mode", "off")
-    data.setdefault("lpf-frequency", 20000.0)
-    data.setdefault("stereo-split", False)
+def _gate_sidechain(data, args):
+    """
+    Builds a new valid gate sidechain from the old detection mode.
+    """
+    detection_mode = data.pop("detection", "RMS")
 
+    data["sidechain"] = {
+        "input": "Internal",
+        "lookahead": 0.0,
+        "mode": detection_mode,
+        "preamp": 0.0,
+        "reactivity": 10.0,
+        "source": "Middle",
+        "stereo-split-source": "Left/Right",
+    }
     return data
 
 
-def _convert_filter(data, args):
+def _filter_type_slope(data, args):
     """
     Remaps old filter 'mode' to new 'type' and 'slope'.
     """
@@ -484,171 +876,221 @@ def _convert_filter(data, args):
         data["slope"] = "x8"
     else:
         data["slope"] = "x2"  # Default for old "Lowpass"
+    return data
 
-    if "resonance" in data:
-        data["quality"] = data.pop("resonance")
 
-    data.pop("inertia", None)
+def _filter_mode(data, args):
     data["mode"] = "RLC (BT)"  # Set new default filter mode
-
-    float_keys = ["frequency", "gain", "quality", "balance", "width"]
-    data = _ensure_floats_simple(data, args, float_keys)
-
-    data.setdefault("gain", 0.0)
-    data.setdefault("balance", 0.0)
-    data.setdefault("width", 4.0)
-    data.setdefault("frequency", 2000.0)
     return data
 
 
-def _convert_gate(data, args):
+def _crystalizer_bands(data, args):
     """
-    Remaps old 'gate' parameters to the new structure.
+    Crystalizer is now multiband. Migrates the old 'intensity' to band0.
     """
-    if "range" in data:
-        data["reduction"] = data.pop("range")
-    if "threshold" in data:
-        data["curve-threshold"] = data.pop("threshold")
-    if "knee" in data:
-        data["curve-zone"] = data.pop("knee")
-
-    float_keys = [
-        "attack",
-        "hold",
-        "release",
-        "reduction",
-        "curve-threshold",
-        "curve-zone",
-        "makeup",
-        "hysteresis-threshold",
-        "hysteresis-zone",
-    ]
-    data = _ensure_floats_simple(data, args, float_keys)
-
-    detection_mode = data.pop("detection", "RMS")
-    data.pop("stereo-link", None)
-
-    data["sidechain"] = {
-        "input": "Internal",
-        "lookahead": 0.0,
-        "mode": detection_mode,
-        "preamp": 0.0,
-        "reactivity": 10.0,
-        "source": "Middle",
-        "stereo-split-source": "Left/Right",
-    }
-
-    # Remap mix keys from 0-100 scale to dB scale
-    data = _remap_and_set_mix_db(data)
+    if "intensity" in data:
+        _report(
+            "info",
+            "remap",
+            "Plugin 'crystalizer' is now multiband. Migrating 'intensity' to band0.",
+            key="intensity",
+            old=data["intensity"],
+        )
+        data["band0"] = {
+            "bypass": False,
+            "intensity": data.pop("intensity"),
+            "mute": False,
+        }
+    return data
 
-    data.setdefault("makeup", 0.0)
-    data.setdefault("hysteresis", False)
-    data.setdefault("hpf-mode", "off")
-    data.setdefault("lpf-mode", "off")
 
+def _rnnoise_model(data, args):
+    """
+    Maps the old default model to the new built-in one.
+    """
+    if data.get("model-name") == "Standard RNNoise Model":
+        data["model-name"] = ""
     return data
 
 
-def _convert_convolver(data, args):
+def _rnnoise_wet(data, args):
     """
-    Maps old 'kernel-path' to new 'kernel-name'.
-    Removes obsolete keys.
+    Remaps 'wet' to dB, or sets its default. Always the last key.
     """
-    if "kernel-path" in data:
-        data["kernel-name"] = data.pop("kernel-path")
+    # SPECIAL CASE: rnnoise has a 'wet' param that needs remapping
+    old_wet_val = data.pop("wet", None)
+    if old_wet_val is not None:
+        # The 'wet' param in rnnoise is 0-100, remap to -100 to 0
+        data['wet'] = _remap_amplitude_to_db_val(old_wet_val)
+        _report(
+            "info",
+            "remap",
+            "Remapping 'wet' for rnnoise to dB scale.",
+            key="wet",
+            old=old_wet_val,
+            new=data["wet"],
+        )
+    else:
+        # Default from EE-DEFAULT-RESET-SETTINGS.json
+        data.setdefault('wet', 0.0)
+    return data
 
-    # Remove obsolete keys
-    data.pop("gain", None)
-    data.pop("wet", None)
-    data.pop("ir-gain", None)
 
-    float_keys = []
-    # Convolver has autogain. No gain logic applied.
-    data = _ensure_floats(data, float_keys)
+# Band parameters that must be floats
+EQ_BAND_FLOAT_KEYS = ("frequency", "gain", "q", "width")
 
-    data.setdefault("autogain", True)
-    return data
 
+def _write_column(holders, key, column):
+    for band, value in zip(holders, column):
+        band[key] = value
 
-def _convert_crystalizer(data, args):
+
+class _BandColumns:
     """
-    Removes obsolete 'aggressive' parameter.
+    The bands of one equalizer channel as columns: for each key of
+    EQ_BAND_FLOAT_KEYS, the bands holding it and their float values.
+    Building it coerces the band values to floats in bulk, column by column.
+
+    bands:   the band dicts, in order
+    columns: key -> (bands holding the key, their float values)
     """
-    data.pop("aggressive", None)
 
-    float_keys = ["intensity"]
-    data = _ensure_floats_simple(data, args, float_keys)
+    __slots__ = ("bands", "columns")
+
+    def __init__(self, channel):
+        bands = list(channel.values())
+        columns = None
+        if {dict}.issuperset(map(type, bands)):
+            columns = self._coerce(bands)
+        if columns is None:
+            # Odd values: convert band by band, warning in the usual order
+            for band in bands:
+                _ensure_floats(band, EQ_BAND_FLOAT_KEYS)
+            bands = [band for band in bands if type(band) is dict]
+            columns = self._collect(bands)
+        self.bands = bands
+        self.columns = columns
+
+    @staticmethod
+    def _coerce(bands):
+        """
+        Converts each column that is not all floats with one array('d')
+        call and writes the floats back. Returns None if a value is not
+        numeric.
+        """
+        columns = {}
+        for key in EQ_BAND_FLOAT_KEYS:
+            try:
+                holders = bands
+                values = [band[key] for band in bands]
+            except KeyError:
+                holders = [band for band in bands if key in band]
+                values = [band[key] for band in holders]
+            if {float}.issuperset(map(type, values)):
+                columns[key] = (holders, values)
+                continue
+            try:
+                column = array.array("d", values)
+            except (TypeError, OverflowError):
+                return None
+            _write_column(holders, key, column)
+            columns[key] = (holders, column)
+        return columns
+
+    @staticmethod
+    def _collect(bands):
+        """
+        Builds the columns from bands whose values are already coerced,
+        leaving out values that could not be converted.
+        """
+        columns = {}
+        for key in EQ_BAND_FLOAT_KEYS:
+            holders = [band for band in bands if type(band.get(key)) is float]
+            columns[key] = (holders, array.array("d", [band[key] for band in holders]))
+        return columns
+
+    def shift(self, key, delta):
+        """
+        Adds delta to every value of a column, in one pass.
+        """
+        holders, column = self.columns[key]
+        column = array.array("d", [value + delta for value in column])
+        self.columns[key] = (holders, column)
+        _write_column(holders, key, column)
+
+
+def _equalizer_bands(data, args):
+    """
+    Converts the band parameters of both channels to floats, column by
+    column, and applies the bulk band options of ConversionOptions:
+    eq_link, eq_normalize and eq_gain_offset, in that order.
+    """
+    channels = {
+        side: _BandColumns(data[side]) for side in ("left", "right") if side in data
+    }
 
-    if "intensity" in data:
-        print(
-            f"        {ICON_INFO} Plugin 'crystalizer' is now multiband. Migrating 'intensity' to band0."
-        )
-        data["band0"] = {
-            "bypass": False,
-            "intensity": data.pop("intensity"),
-            "mute": False,
+    if args.eq_link and "left" in channels:
+        data["right"] = {
+            name: dict(band) if type(band) is dict else band
+            for name, band in data["left"].items()
         }
+        data["split-channels"] = False
+        channels["right"] = _BandColumns(data["right"])
+        _report(
+            "info",
+            "remap",
+            "Linked EQ channels: right now uses the left bands.",
+            key="right",
+        )
 
+    delta = args.eq_gain_offset
+    if args.eq_normalize:
+        gains = [c.columns["gain"][1] for c in channels.values()]
+        peak = max((max(column) for column in gains if column), default=0.0)
+        if math.isfinite(peak) and peak:
+            delta -= peak
+            _report(
+                "info",
+                "remap",
+                f"Normalizing EQ band gains: peak {peak}dB moved to 0dB.",
+                key="gain",
+                old=peak,
+                new=0.0,
+            )
+    if args.eq_gain_offset:
+        _report(
+            "info",
+            "remap",
+            f"Shifting EQ band gains by {args.eq_gain_offset}dB.",
+            key="gain",
+            new=args.eq_gain_offset,
+        )
+    if delta:
+        for columns in channels.values():
+            columns.shift("gain", delta)
     return data
 
 
-def _convert_pitch(data, args):
+def _stereo_tools_levels(data, args):
     """
-    Removes obsolete pitch parameters.
+    Remaps amplitude keys (0-100) to dB scale.
+    Missing keys default to 0.0dB.
     """
-    data.pop("crispness", None)
-    data.pop("formant-preserving", None)
+    return _remap_amplitude_to_db(data, ["middle-level", "side-level"], default_db=0.0)
 
-    float_keys = [
-        "pitch",
-        "semitones",
-        "rate-difference",
-        "tempo-difference",
-        "cents",
-        "octaves",
-    ]
-    data = _ensure_floats_simple(data, args, float_keys)
-
-    data.setdefault("anti-alias", False)
-    data.setdefault("overlap-length", 8)
-    data.setdefault("quick-seek", False)
-    data.setdefault("rate-difference", 0.0)
-    data.setdefault("seek-window", 15)
-    data.setdefault("sequence-length", 40)
-    data.setdefault("tempo-difference", 0.0)
-    data.setdefault("semitones", 0.0)
-    data.setdefault("cents", 0.0)
-    data.setdefault("octaves", 0.0)
-    return data
 
-
-def _convert_rnnoise(data, args):
+def _mix_db(data, args):
     """
-    Maps old 'model-path' to new 'model-name'.
+    Remaps dry/wet mix keys from 0-100 scale to dB scale.
     """
-    if "model-path" in data:
-        data["model-name"] = data.pop("model-path")
-    if data.get("model-name") == "Standard RNNoise Model":
-        data["model-name"] = ""
-
-    float_keys = ["release", "vad-thres"]
-    data = _ensure_floats_simple(data, args, float_keys)
+    return _remap_and_set_mix_db(data)
 
-    data.setdefault("enable-vad", False)
-    data.setdefault("release", 20.0)
-    data.setdefault("vad-thres", 50.0)
-    
-    # SPECIAL CASE: rnnoise has a 'wet' param that needs remapping
-    old_wet_val = data.pop("wet", None)
-    if old_wet_val is not None:
-        print(f"        {ICON_INFO} Remapping 'wet' for rnnoise to dB scale.")
-        # The 'wet' param in rnnoise is 0-100, remap to -100 to 0
-        data['wet'] = _remap_amplitude_to_db_val(old_wet_val)
-    else:
-        # Default from EE-DEFAULT-RESET-SETTINGS.json
-        data.setdefault('wet', 0.0) 
 
-    return data
+def _stereo_mix_db(data, args):
+    """
+    Remaps stereo dry/wet mix keys from 0-100 scale to dB scale.
+    """
+    return _remap_stereo_mix_keys(data)
 
 
 # --- Multiband Functions (structure confirmed OK) ---
@@ -691,54 +1133,6 @@ MC_SIDECHAIN_FREQS = [
     (16000.0, 20000.0),
 ]
 
-
-def _convert_multiband_compressor(data, args):
-    """
-    Resets the multiband compressor to a valid 8-band default structure.
-    """
-    print(
-        f"        {ICON_WARN} Plugin 'multiband_compressor' is incompatible; resetting bands to a valid default."
-    )
-
-    [
-        data.pop(k, None)
-        for k in [
-            "freq0",
-            "freq1",
-            "freq2",
-            "mode",
-            "subband",
-            "lowband",
-            "midband",
-            "highband",
-        ]
-    ]
-
-    band0 = copy.deepcopy(DEFAULT_MC_BAND)
-    band0["sidechain-lowcut-frequency"] = MC_SIDECHAIN_FREQS[0][0]
-    band0["sidechain-highcut-frequency"] = MC_SIDECHAIN_FREQS[0][1]
-    band0["enable-band"] = True
-    data["band0"] = band0
-
-    for i in range(1, 8):
-        band = copy.deepcopy(DEFAULT_MC_BAND)
-        band["split-frequency"] = MC_SPLIT_FREQS[i - 1]
-        band["sidechain-lowcut-frequency"] = MC_SIDECHAIN_FREQS[i][0]
-        band["sidechain-highcut-frequency"] = MC_SIDECHAIN_FREQS[i][1]
-        band["enable-band"] = i < 4
-        data[f"band{i}"] = band
-
-    data = _ensure_floats_simple(data, args, [])
-
-    # Remap mix keys from 0-100 scale to dB scale
-    data = _remap_and_set_mix_db(data)
-
-    data.setdefault("compressor-mode", "Modern")
-    data.setdefault("envelope-boost", "None")
-    data.setdefault("stereo-split", False)
-    return data
-
-
 DEFAULT_MG_BAND = {
     "attack-time": 20.0,
     "curve-threshold": -24.0,
@@ -765,160 +1159,552 @@ DEFAULT_MG_BAND = {
     "stereo-split-source": "Left/Right",
 }
 
+# Old multiband keys with no counterpart in the new 8-band layout
+OLD_MULTIBAND_KEYS = [
+    "freq0",
+    "freq1",
+    "freq2",
+    "mode",
+    "subband",
+    "lowband",
+    "midband",
+    "highband",
+]
+
 
-def _convert_multiband_gate(data, args):
+def _band_layout(default_band):
     """
-    Resets the multiband gate to a valid 8-band default structure.
+    Builds the valid 8-band default structure from default_band once.
+    Returns the bands as read-only mappings, so they can never be changed
+    by accident and are safe to share.
     """
-    print(
-        f"        {ICON_WARN} Plugin 'multiband_gate' is incompatible; resetting bands to a valid default."
-    )
-
-    [
-        data.pop(k, None)
-        for k in [
-            "freq0",
-            "freq1",
-            "freq2",
-            "mode",
-            "subband",
-            "lowband",
-            "midband",
-            "highband",
-        ]
-    ]
-
-    band0 = copy.deepcopy(DEFAULT_MG_BAND)
-    band0["sidechain-lowcut-frequency"] = MC_SIDECHAIN_FREQS[0][0]
-    band0["sidechain-highcut-frequency"] = MC_SIDECHAIN_FREQS[0][1]
-    band0["enable-band"] = True
-    data["band0"] = band0
-
-    for i in range(1, 8):
-        band = copy.deepcopy(DEFAULT_MG_BAND)
-        band["split-frequency"] = MC_SPLIT_FREQS[i - 1]
+    layout = []
+    for i in range(8):
+        band = dict(default_band)
+        if i > 0:
+            band["split-frequency"] = MC_SPLIT_FREQS[i - 1]
         band["sidechain-lowcut-frequency"] = MC_SIDECHAIN_FREQS[i][0]
         band["sidechain-highcut-frequency"] = MC_SIDECHAIN_FREQS[i][1]
         band["enable-band"] = i < 4
-        data[f"band{i}"] = band
+        layout.append((f"band{i}", types.MappingProxyType(band)))
+    return tuple(layout)
 
-    data = _ensure_floats_simple(data, args, [])
 
-    # Remap mix keys from 0-100 scale to dB scale
-    data = _remap_and_set_mix_db(data)
+# Precomputed band layouts. All band values are scalars, so a shallow
+# copy per plugin instance is all a rebuild needs.
+MC_BAND_LAYOUT = _band_layout(DEFAULT_MC_BAND)
+MG_BAND_LAYOUT = _band_layout(DEFAULT_MG_BAND)
 
-    data.setdefault("gate-mode", "Modern")
-    data.setdefault("envelope-boost", "None")
-    data.setdefault("stereo-split", False)
+
+def _rebuild_bands(data, layout):
+    """
+    Adds a fresh copy of a precomputed 8-band layout.
+    """
+    for band_name, band in layout:
+        data[band_name] = band.copy()  # dict.copy() of the underlying band
     return data
 
 
-# --- Simple Converters (for headroom) ---
+def _multiband_compressor_bands(data, args):
+    """
+    Resets the multiband compressor to a valid 8-band default structure.
+    """
+    _report(
+        "warning",
+        "rebuild",
+        "Plugin 'multiband_compressor' is incompatible; resetting bands to a valid default.",
+    )
+    return _rebuild_bands(data, MC_BAND_LAYOUT)
 
 
-def _convert_equalizer(data, args):
+def _multiband_gate_bands(data, args):
     """
-    Adds headroom and ensures all band parameters are floats.
+    Resets the multiband gate to a valid 8-band default structure.
     """
-    if "left" in data:
-        for band in data["left"].values():
-            _ensure_floats(band, ["frequency", "gain", "q", "width"])
-    if "right" in data:
-        for band in data["right"].values():
-            _ensure_floats(band, ["frequency", "gain", "q", "width"])
+    _report(
+        "warning",
+        "rebuild",
+        "Plugin 'multiband_gate' is incompatible; resetting bands to a valid default.",
+    )
+    return _rebuild_bands(data, MG_BAND_LAYOUT)
 
-    data = _ensure_floats_simple(data, args, ["balance"])
-    data.setdefault("balance", 0.0)
-    return data
 
+# --- Gain Key Index (forced volume modes) ---
+# Where GAIN_KEYS_TO_RESET live in a converted plugin, per plugin type,
+# so a forced volume mode only touches those keys. Every field is optional:
+#
+#   nested: sub-dict key -> gain keys it holds
+#   keep:   sub-objects holding no gains to reset (the equalizer bands keep
+#           their band gains)
+#
+# Top-level gain keys are always reset. Any other sub-object is walked
+# with _recursive_reset_gains() as a fallback for unexpected source data.
+
+
+def _layout_gain_keys(layout):
+    """
+    Returns {band name: gain keys} for a precomputed multiband layout.
+    """
+    return {
+        band_name: tuple(key for key in band if key in GAIN_KEYS_TO_RESET)
+        for band_name, band in layout
+    }
 
-def _convert_bass_enhancer(data, args):
-    float_keys = ["amount", "blend", "floor", "harmonics", "scope"]
-    return _ensure_floats_simple(data, args, float_keys)
 
+GAIN_KEY_INDEX = {
+    "equalizer": {"keep": ("left", "right")},
+    "multiband_compressor": {"nested": _layout_gain_keys(MC_BAND_LAYOUT)},
+    "multiband_gate": {"nested": _layout_gain_keys(MG_BAND_LAYOUT)},
+}
 
-def _convert_exciter(data, args):
-    float_keys = ["amount", "blend", "ceil", "harmonics", "scope"]
-    return _ensure_floats_simple(data, args, float_keys)
+_GAIN_KEYS = tuple(sorted(GAIN_KEYS_TO_RESET))
 
 
-def _convert_reverb(data, args):
-    float_keys = [
-        "amount",
-        "bass-cut",
-        "decay-time",
-        "diffusion",
-        "dry",
-        "hf-damp",
-        "predelay",
-        "treble-cut",
-    ]
-    return _ensure_floats_simple(data, args, float_keys)
-
-
-def _convert_stereo_tools(data, args):
-    float_keys = [
-        "balance-in",
-        "balance-out",
-        "delay",
-        "middle-panorama",
-        "sc-level",
-        "side-balance",
-        "stereo-base",
-        "stereo-phase",
-    ]
-    data = _ensure_floats_simple(data, args, float_keys)
-
-    # Remap amplitude keys (0-100) to dB scale
-    # This function also sets the default to 0.0dB if the key is missing
-    data = _remap_amplitude_to_db(data, ["middle-level", "side-level"], default_db=0.0)
-
-    # Add all other defaults based on EE-DEFAULT-RESET-SETTINGS.json
-    data.setdefault("balance-in", 0.0)
-    data.setdefault("balance-out", 0.0)
-    data.setdefault("delay", 0.0)
-    data.setdefault("middle-panorama", 0.0)
-    data.setdefault("mode", "LR > LR (Stereo Default)")
-    data.setdefault("mutel", False)
-    data.setdefault("muter", False)
-    data.setdefault("phasel", False)
-    data.setdefault("phaser", False)
-    data.setdefault("sc-level", 1.0)
-    data.setdefault("side-balance", 0.0)
-    data.setdefault("softclip", False)
-    data.setdefault("stereo-base", 0.0)
-    data.setdefault("stereo-phase", 0.0)
+def _compile_gain_reset(entry):
+    """
+    Compiles a GAIN_KEY_INDEX entry into a function (data, value) that sets
+    every gain key of a converted plugin to value, in place.
+    """
+    nested = tuple(entry.get("nested", {}).items())
+    indexed = frozenset(entry.get("nested", ())) | frozenset(entry.get("keep", ()))
 
-    return data
+    def reset(data, value):
+        for key in _GAIN_KEYS:
+            if key in data:
+                data[key] = value
+        for sub_key, gain_keys in nested:
+            section = data.get(sub_key)
+            if type(section) is dict:
+                for key in gain_keys:
+                    if key in section:
+                        section[key] = value
+            elif section is not None:
+                data[sub_key] = _recursive_reset_gains(section, value)
+        for key, val in data.items():
+            if key in indexed or key in GAIN_KEYS_TO_RESET:
+                continue
+            if isinstance(val, (dict, list)):
+                data[key] = _recursive_reset_gains(val, value)
+        return data
 
+    return reset
 
-def _convert_crossfeed(data, args):
-    float_keys = ["feed"]
-    return _ensure_floats_simple(data, args, float_keys)
 
+# Map plugin names to their compiled gain resets
+GAIN_RESETS = {
+    name: _compile_gain_reset(entry) for name, entry in GAIN_KEY_INDEX.items()
+}
+_reset_gains = _compile_gain_reset({})
+
+
+# --- Plugin Specs ---
+# One declarative entry per plugin. Every field is optional:
+#
+#   rename:    old key -> new key (the renamed value wins over an existing new key,
+#              in its place; otherwise it is added after the other keys)
+#   drop:      keys that no longer exist
+#   drop_with: trigger key -> keys to drop only when the trigger key is present
+#   floats:    keys (after renaming) that must be floats
+#   strings:   keys (after renaming) that must be strings
+#   clamp:     key -> (minimum, maximum, unit); None means unbounded
+#   hooks:     structural steps run in order after the key pass; "renamed" and
+#              "defaults" mark where the renamed keys and the defaults are
+#              added (first and last unless listed), so keys come out in
+#              the same order as from the original converter functions
+#   defaults:  keys added, in order, when still missing
+
+PLUGIN_SPECS = {
+    # Special structural converters
+    "autogain": {
+        "drop": ["detect-silence", "weight-m", "weight-s", "weight-i"],
+        "floats": [
+            "input-gain",
+            "output-gain",
+            "maximum-history",
+            "silence-threshold",
+            "target",
+        ],
+        "hooks": [_autogain_reference],
+        # Autogain manages its own level. No gain logic applied.
+    },
+    # Handles old 'limiter' and old 'maximizer'
+    "maximizer": {
+        "rename": {"limit": "threshold", "ceiling": "output-gain"},
+        "drop_with": {
+            "limit": ["lookahead", "auto-level", "asc", "asc-level", "oversampling"]
+        },
+        "floats": ["threshold", "output-gain", "release", "input-gain"],
+        # Maximizer manages its own level. No gain logic applied.
+    },
+    "loudness": {
+        "rename": {"input": "input-gain"},
+        "strings": ["fft"],
+        "floats": [
+            "input-gain",
+            "link-gain",
+            "makeup-gain",
+            "output-gain",
+            "volume",
+            "clipping-range",
+        ],
+        # Loudness manages its own level. No gain logic applied.
+    },
+    # Handles both compressor and expander
+    "compressor": {
+        "floats": [
+            "attack",
+            "release",
+            "ratio",
+            "threshold",
+            "knee",
+            "makeup",
+            "release-threshold",
+            "boost-amount",
+            "boost-threshold",
+            "hpf-frequency",
+            "lpf-frequency",
+        ],
+        "clamp": {"release-threshold": (-100.0, None, " dB")},
+        "hooks": [_compressor_sidechain, _mix_db],
+        "defaults": {
+            "mode": "Downward",
+            "boost-amount": 6.0,
+            "boost-threshold": -72.0,
+            "hpf-mode": "off",
+            "hpf-frequency": 10.0,
+            "lpf-mode": "off",
+            "lpf-frequency": 20000.0,
+            "stereo-split": False,
+        },
+    },
+    # Rebuilds
+    "multiband_compressor": {
+        "drop": OLD_MULTIBAND_KEYS,
+        "hooks": [_multiband_compressor_bands, _mix_db],
+        "defaults": {
+            "compressor-mode": "Modern",
+            "envelope-boost": "None",
+            "stereo-split": False,
+        },
+    },
+    "filter": {
+        "rename": {"resonance": "quality"},
+        "drop": ["inertia"],
+        "floats": ["frequency", "gain", "quality", "balance", "width"],
+        "hooks": [_filter_type_slope, "renamed", _filter_mode],
+        "defaults": {
+            "gain": 0.0,
+            "balance": 0.0,
+            "width": 4.0,
+            "frequency": 2000.0,
+        },
+    },
+    "gate": {
+        "rename": {
+            "range": "reduction",
+            "threshold": "curve-threshold",
+            "knee": "curve-zone",
+        },
+        "drop": ["stereo-link"],
+        "floats": [
+            "attack",
+            "hold",
+            "release",
+            "reduction",
+            "curve-threshold",
+            "curve-zone",
+            "makeup",
+            "hysteresis-threshold",
+            "hysteresis-zone",
+        ],
+        "hooks": [_gate_sidechain, _mix_db],
+        "defaults": {
+            "makeup": 0.0,
+            "hysteresis": False,
+            "hpf-mode": "off",
+            "lpf-mode": "off",
+        },
+    },
+    # Rebuilds
+    "multiband_gate": {
+        "drop": OLD_MULTIBAND_KEYS,
+        "hooks": [_multiband_gate_bands, _mix_db],
+        "defaults": {
+            "gate-mode": "Modern",
+            "envelope-boost": "None",
+            "stereo-split": False,
+        },
+    },
+    "convolver": {
+        "rename": {"kernel-path": "kernel-name"},
+        "drop": ["gain", "wet", "ir-gain"],
+        # Convolver has autogain. No gain logic applied.
+        "defaults": {"autogain": True},
+    },
+    "crystalizer": {
+        "drop": ["aggressive"],
+        "floats": ["intensity"],
+        "hooks": [_crystalizer_bands],
+    },
+    "pitch": {
+        "drop": ["crispness", "formant-preserving"],
+        "floats": [
+            "pitch",
+            "semitones",
+            "rate-difference",
+            "tempo-difference",
+            "cents",
+            "octaves",
+        ],
+        "defaults": {
+            "anti-alias": False,
+            "overlap-length": 8,
+            "quick-seek": False,
+            "rate-difference": 0.0,
+            "seek-window": 15,
+            "sequence-length": 40,
+            "tempo-difference": 0.0,
+            "semitones": 0.0,
+            "cents": 0.0,
+            "octaves": 0.0,
+        },
+    },
+    "rnnoise": {
+        "rename": {"model-path": "model-name"},
+        "floats": ["release", "vad-thres"],
+        "hooks": [_rnnoise_model, "defaults", _rnnoise_wet],
+        "defaults": {
+            "enable-vad": False,
+            "release": 20.0,
+            "vad-thres": 50.0,
+        },
+    },
+    # Headroom-adding converters
+    "equalizer": {
+        "floats": ["balance"],
+        "hooks": [_equalizer_bands],
+        "defaults": {"balance": 0.0},
+    },
+    "bass_enhancer": {
+        "floats": ["amount", "blend", "floor", "harmonics", "scope"],
+    },
+    "exciter": {
+        "floats": ["amount", "blend", "ceil", "harmonics", "scope"],
+    },
+    "reverb": {
+        "floats": [
+            "amount",
+            "bass-cut",
+            "decay-time",
+            "diffusion",
+            "dry",
+            "hf-damp",
+            "predelay",
+            "treble-cut",
+        ],
+    },
+    "stereo_tools": {
+        "floats": [
+            "balance-in",
+            "balance-out",
+            "delay",
+            "middle-panorama",
+            "sc-level",
+            "side-balance",
+            "stereo-base",
+            "stereo-phase",
+        ],
+        "hooks": [_stereo_tools_levels],
+        # Defaults based on EE-DEFAULT-RESET-SETTINGS.json
+        "defaults": {
+            "balance-in": 0.0,
+            "balance-out": 0.0,
+            "delay": 0.0,
+            "middle-panorama": 0.0,
+            "mode": "LR > LR (Stereo Default)",
+            "mutel": False,
+            "muter": False,
+            "phasel": False,
+            "phaser": False,
+            "sc-level": 1.0,
+            "side-balance": 0.0,
+            "softclip": False,
+            "stereo-base": 0.0,
+            "stereo-phase": 0.0,
+        },
+    },
+    "crossfeed": {
+        "floats": ["feed"],
+    },
+    "deesser": {
+        "floats": [
+            "f1-freq",
+            "f1-level",
+            "f2-freq",
+            "f2-level",
+            "f2-q",
+            "makeup",
+            "ratio",
+            "threshold",
+        ],
+    },
+    "delay": {
+        "floats": ["time-l", "time-r"],
+        "hooks": [_stereo_mix_db],
+    },
+}
 
-def _convert_deesser(data, args):
-    float_keys = [
-        "f1-freq",
-        "f1-level",
-        "f2-freq",
-        "f2-level",
-        "f2-q",
-        "makeup",
-        "ratio",
-        "threshold",
-    ]
-    return _ensure_floats_simple(data, args, float_keys)
 
+# --- Spec Compiler ---
 
-def _convert_delay(data, args):
-    float_keys = ["time-l", "time-r"]
-    data = _ensure_floats_simple(data, args, float_keys)
+_SPEC_FIELDS = {
+    "rename",
+    "drop",
+    "drop_with",
+    "floats",
+    "strings",
+    "clamp",
+    "hooks",
+    "defaults",
+}
 
-    # Remap stereo mix keys from 0-100 scale to dB scale
-    data = _remap_stereo_mix_keys(data)
 
-    return data
+def _coerce_float(key, value):
+    """
+    Returns value as a float, like _ensure_floats() does for a single key.
+    """
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        if not isinstance(value, (float, int)):
+            _report(
+                "warning",
+                "coerce",
+                f"Could not convert {key}: {value} to float.",
+                key=key,
+                old=value,
+            )
+        return value
+
+
+def _clamp(plugin_name, key, value, bounds):
+    """
+    Clamps a numeric value to bounds = (minimum, maximum, unit).
+    """
+    low, high, unit = bounds
+    if not isinstance(value, (int, float)):
+        return value
+    if low is not None and value < low:
+        bound = low
+    elif high is not None and value > high:
+        bound = high
+    else:
+        return value
+    _report(
+        "warning",
+        "clamp",
+        f"Clamped {plugin_name} '{key}' to {bound}{unit}.",
+        key=key,
+        old=value,
+        new=bound,
+    )
+    return bound
+
+
+def _compile_plugin_spec(plugin_name, spec):
+    """
+    Compiles a PLUGIN_SPECS entry into a converter function (data, args).
+
+    All per-key work (rename, drop, coercion, clamping) is folded into one
+    action table, so a plugin is converted in a single pass over its keys.
+    """
+    unknown = set(spec) - _SPEC_FIELDS
+    if unknown:
+        raise ValueError(f"Unknown fields in spec for '{plugin_name}': {sorted(unknown)}")
+
+    rename = dict(spec.get("rename", {}))
+    floats = set(spec.get("floats", ()))
+    strings = set(spec.get("strings", ()))
+    clamps = dict(spec.get("clamp", {}))
+    steps = list(spec.get("hooks", ()))
+    if "renamed" not in steps:
+        steps.insert(0, "renamed")
+    if "defaults" not in steps:
+        steps.append("defaults")
+    for step in steps:
+        if isinstance(step, str) and step not in ("renamed", "defaults"):
+            raise ValueError(f"Unknown step '{step}' in spec for '{plugin_name}'")
+    steps = tuple(steps)
+    defaults = tuple(spec.get("defaults", {}).items())
+
+    renamed_from = {new: old for old, new in rename.items()}
+    rename_rank = {new: rank for rank, new in enumerate(rename.values())}
+    if set(rename) & set(renamed_from):
+        raise ValueError(f"Chained renames in spec for '{plugin_name}'")
+
+    def coercion(key):
+        if key in floats:
+            return _coerce_float
+        if key in strings:
+            return lambda key, value: str(value)
+        return None
+
+    # key -> (new key or None to drop, coercion, shadowing key, drop trigger)
+    actions = {}
+    for key in floats | strings | set(clamps) | set(renamed_from):
+        actions[key] = (key, coercion(key), renamed_from.get(key), None)
+    for old, new in rename.items():
+        actions[old] = (new, coercion(new), None, None)
+    for trigger, keys in spec.get("drop_with", {}).items():
+        for key in keys:
+            _, coerce, shadow, _ = actions.get(key, (key, None, None, None))
+            actions[key] = (key, coerce, shadow, trigger)
+    for key in spec.get("drop", ()):
+        actions[key] = (None, None, None, None)
+
+    def convert(data, args):
+        out = {}
+        renamed = []
+        for key, value in data.items():
+            action = actions.get(key)
+            if action is None:
+                out[key] = value
+                continue
+
+            new_key, coerce, shadow, trigger = action
+            if new_key is None:
+                continue
+            if new_key != key and new_key in data:
+                continue  # Takes the place of the existing new key
+            if shadow is not None and shadow in data:
+                value = data[shadow]  # The renamed old key wins
+            if trigger is not None and trigger in data:
+                continue
+            if coerce is not None:
+                value = coerce(new_key, value)
+            if new_key in clamps:
+                value = _clamp(plugin_name, new_key, value, clamps[new_key])
+            if new_key != key:
+                renamed.append((rename_rank[new_key], new_key, value))
+            else:
+                out[new_key] = value
+
+        for step in steps:
+            if step == "renamed":
+                renamed.sort()  # In spec order; ranks are unique
+                for _rank, key, value in renamed:
+                    out[key] = value
+            elif step == "defaults":
+                for key, value in defaults:
+                    if key not in out:
+                        out[key] = value
+            else:
+                out = step(out, args)
+        return out
+
+    convert.__name__ = f"_convert_{plugin_name}"
+    convert.__doc__ = f"Converts '{plugin_name}' as declared in PLUGIN_SPECS."
+    return convert
 
 
 # --- Mappings ---
@@ -926,50 +1712,57 @@ def _convert_delay(data, args):
 # Map old plugin names to their new names
 PLUGIN_NAME_MAP = {"limiter": "maximizer"}
 
-# Map new plugin names to their special conversion functions
+# Map new plugin names to their compiled conversion functions
 PARAM_CONVERTERS = {
-    # Special structural converters
-    "autogain": _convert_autogain,
-    "maximizer": _convert_maximizer,  # Handles old 'limiter' and old 'maximizer'
-    "loudness": _convert_loudness,
-    "compressor": _convert_compressor, # Handles both compressor and expander
-    "multiband_compressor": _convert_multiband_compressor,  # Rebuilds
-    "filter": _convert_filter,
-    "gate": _convert_gate,
-    "multiband_gate": _convert_multiband_gate,  # Rebuilds
-    "convolver": _convert_convolver,
-    "crystalizer": _convert_crystalizer,
-    "pitch": _convert_pitch,
-    "rnnoise": _convert_rnnoise,
-    # Headroom-adding converters
-    "equalizer": _convert_equalizer,
-    "bass_enhancer": _convert_bass_enhancer,
-    "exciter": _convert_exciter,
-    "reverb": _convert_reverb,
-    "stereo_tools": _convert_stereo_tools,
-    "crossfeed": _convert_crossfeed,
-    "deesser": _convert_deesser,
-    "delay": _convert_delay,
+    name: _compile_plugin_spec(name, spec) for name, spec in PLUGIN_SPECS.items()
+}
+
+# Keys holding old amplitude values (0-1 or 0-100) that are remapped to dB
+AMPLITUDE_KEYS = {
+    "compressor": ("wet", "dry"),
+    "gate": ("wet", "dry"),
+    "multiband_compressor": ("wet", "dry"),
+    "multiband_gate": ("wet", "dry"),
+    "rnnoise": ("wet",),
+    "stereo_tools": ("middle-level", "side-level"),
+    "delay": ("dry-l", "dry-r", "wet-l", "wet-r"),
 }
 
 
+# Choices made with a trailing '!' in the --selected menu, by plugin list
+_remembered_selections = {}
+
+
 # Helper function for --selected
 def _prompt_for_plugins(plugin_list):
     """
     Shows an interactive menu for the user to select plugins.
     Returns a set of plugins to convert.
+    A choice ending in '!' is reused for all remaining presets with the
+    same plugin list, without asking again.
     """
+    remembered = _remembered_selections.get(tuple(plugin_list))
+    if remembered is not None:
+        print(f" {ICON_INFO} Reusing your choice for this plugin set:")
+        for name in sorted(remembered):
+            print(f"  - {name}")
+        return set(remembered)
+
     print("---  Interactive Plugin Selection ---")
     print("The following plugins were found in the preset:")
     for i, name in enumerate(plugin_list):
         print(f"  [{i + 1}] {name}")
     print("\nPlease enter the numbers of the plugins you wish to convert.")
-    print("Example: 1, 3, 4\n")
+    print("Example: 1, 3, 4")
+    print("End with '!' (e.g. '1, 3!' or 'a!') to apply the choice to all")
+    print("remaining presets with the same plugins.\n")
 
     selected_plugins = set()
     while True:
         try:
             choice = input("Plugins to convert (or 'a' for all, 'q' to quit): ")
+            remember = choice.rstrip().endswith("!")
+            choice = choice.rstrip().rstrip("!")
             choice_low = choice.lower()
 
             if not choice:
@@ -977,6 +1770,8 @@ def _prompt_for_plugins(plugin_list):
             if choice_low == "q":
                 return None  # Signal to quit
             if choice_low == "a":
+                if remember:
+                    _remembered_selections[tuple(plugin_list)] = set(plugin_list)
                 return set(plugin_list)  # Convert all
 
             indices = [int(i.strip()) for i in choice.split(",")]
@@ -997,6 +1792,9 @@ def _prompt_for_plugins(plugin_list):
             print("\nSelected to convert:")
             for name in selected_plugins:
                 print(f"  - {name}")
+            if remember:
+                _remembered_selections[tuple(plugin_list)] = selected_plugins
+                print("(Also used for all remaining presets with these plugins.)")
             print("---")
             return selected_plugins
 
@@ -1008,35 +1806,900 @@ def _prompt_for_plugins(plugin_list):
             print(f" {ICON_ERROR} An error occurred: {e}")
 
 
-# --- Main Conversion Function ---
+# --- Plugin Rules (--plugin-include / --plugin-exclude / --plugin-rules) ---
+# Unattended plugin selection. A rule is (action, pattern) with action
+# "include" or "exclude". A pattern is a 1-based position in the preset's
+# plugins_order (as numbered by --selected) or a shell-style pattern
+# matched against the old and the new plugin name.
+
+PLUGIN_RULE_ACTIONS = ("include", "exclude")
+
+
+def _rule_matches(pattern, position, plugin_name):
+    if pattern.isdigit():
+        return int(pattern) == position
+    return fnmatch.fnmatchcase(plugin_name, pattern) or fnmatch.fnmatchcase(
+        PLUGIN_NAME_MAP.get(plugin_name, plugin_name), pattern
+    )
+
+
+def _select_plugins(plugin_list, rules):
+    """
+    Applies plugin rules to a preset's plugin list.
+    Returns the set of plugins to convert: those matching an include rule
+    (all, if there are none) and no exclude rule.
+    """
+    includes = [pattern for action, pattern in rules if action == "include"]
+    excludes = [pattern for action, pattern in rules if action == "exclude"]
+    selected = set()
+    for position, plugin_name in enumerate(plugin_list, 1):
+        if includes and not any(
+            _rule_matches(p, position, plugin_name) for p in includes
+        ):
+            continue
+        if any(_rule_matches(p, position, plugin_name) for p in excludes):
+            continue
+        selected.add(plugin_name)
+    return selected
+
+
+def _read_plugin_rules(path):
+    """
+    Reads a --plugin-rules file: one "include PATTERN" or "exclude PATTERN"
+    per line; blank lines and lines starting with '#' are ignored.
+    Raises ValueError for malformed lines.
+    """
+    rules = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            action, _, pattern = line.partition(" ")
+            pattern = pattern.strip()
+            if action not in PLUGIN_RULE_ACTIONS or not pattern:
+                raise ValueError(
+                    f"{path}:{line_no}: expected 'include PATTERN' or "
+                    f"'exclude PATTERN', got {line!r}"
+                )
+            rules.append((action, pattern))
+    return rules
+
+
+# --- EasyEffects Schema (--validate) ---
+# What EasyEffects accepts for each plugin, checked against converted output.
+# The float, string and clamp declarations of PLUGIN_SPECS are included
+# automatically; EE_SCHEMA adds what the converter does not enforce.
+# Every field is optional:
+#
+#   types:    key -> "number", "integer", "string" or "boolean"
+#   enums:    key -> allowed string values
+#   ranges:   key -> (minimum, maximum); None means unbounded
+#   required: keys that must be present
+#   sections: key -> nested schema for a sub-object (e.g. "sidechain")
+#   bands:    (containers, count, band schema): band0..band<count - 1> must
+#             exist in each container key ("" is the plugin itself); count is
+#             a number or the key holding it
+
+# Modes shared by several plugins
+SIDECHAIN_MODES = ("Peak", "RMS", "Low-Pass", "SMA")
+SIDECHAIN_SOURCES = ("Middle", "Side", "Left", "Right", "Min", "Max")
+STEREO_SPLIT_SOURCES = (
+    "Left/Right",
+    "Right/Left",
+    "Mid/Side",
+    "Side/Mid",
+    "Min",
+    "Max",
+)
+PASS_FILTER_MODES = ("off", "12 dB/oct", "24 dB/oct", "36 dB/oct")
+FILTER_MODES = (
+    "RLC (BT)",
+    "RLC (MT)",
+    "BWC (BT)",
+    "BWC (MT)",
+    "LRX (BT)",
+    "LRX (MT)",
+    "APO (DR)",
+)
+MULTIBAND_MODES = ("Classic", "Modern", "Linear Phase")
+ENVELOPE_BOOSTS = ("None", "Pink BT", "Pink MT", "Brown BT", "Brown MT")
+
+# Checked on every plugin; the gains only where present
+BASE_SCHEMA = {
+    "types": {"bypass": "boolean"},
+    "ranges": {"input-gain": (-36.0, 36.0), "output-gain": (-36.0, 36.0)},
+    "required": ["bypass"],
+}
+
+
+def _multiband_band_schema(default_band):
+    """
+    Band schema for a rebuilt multiband plugin: every key of the default
+    band with the type of its default value.
+    """
+    names = {bool: "boolean", float: "number", int: "integer", str: "string"}
+    types = {key: names[type(value)] for key, value in default_band.items()}
+    types.update({"enable-band": "boolean", "split-frequency": "number"})
+    return {
+        "types": types,
+        "ranges": {"split-frequency": (10.0, 24000.0)},
+        "required": list(default_band) + ["enable-band"],
+    }
+
+
+EE_SCHEMA = {
+    "autogain": {
+        "enums": {
+            "reference": (
+                "Momentary",
+                "Short-Term",
+                "Integrated",
+                "Geometric Mean (MSI)",
+                "Geometric Mean (MS)",
+                "Geometric Mean (MI)",
+                "Geometric Mean (SI)",
+            )
+        },
+        "ranges": {"target": (-100.0, 0.0), "silence-threshold": (-100.0, 0.0)},
+    },
+    "maximizer": {
+        "ranges": {"threshold": (-48.0, 0.0)},
+    },
+    "compressor": {
+        "enums": {
+            "mode": ("Downward", "Upward", "Boosting"),
+            "hpf-mode": PASS_FILTER_MODES,
+            "lpf-mode": PASS_FILTER_MODES,
+        },
+        "ranges": {"ratio": (1.0, 100.0)},
+        "sections": {
+            "sidechain": {
+                "types": {
+                    "lookahead": "number",
+                    "preamp": "number",
+                    "reactivity": "number",
+                },
+                "enums": {
+                    "type": ("Feed-forward", "Feed-back", "External", "Link"),
+                    "mode": SIDECHAIN_MODES,
+                    "source": SIDECHAIN_SOURCES,
+                    "stereo-split-source": STEREO_SPLIT_SOURCES,
+                },
+                "required": ["type", "mode", "source"],
+            }
+        },
+        "required": ["sidechain"],
+    },
+    "gate": {
+        "enums": {"hpf-mode": PASS_FILTER_MODES, "lpf-mode": PASS_FILTER_MODES},
+        "sections": {
+            "sidechain": {
+                "types": {
+                    "lookahead": "number",
+                    "preamp": "number",
+                    "reactivity": "number",
+                },
+                "enums": {
+                    "input": ("Internal", "External", "Link"),
+                    "mode": SIDECHAIN_MODES,
+                    "source": SIDECHAIN_SOURCES,
+                    "stereo-split-source": STEREO_SPLIT_SOURCES,
+                },
+                "required": ["input", "mode", "source"],
+            }
+        },
+        "required": ["sidechain"],
+    },
+    "multiband_compressor": {
+        "enums": {
+            "compressor-mode": MULTIBAND_MODES,
+            "envelope-boost": ENVELOPE_BOOSTS,
+        },
+        "bands": (("",), 8, _multiband_band_schema(DEFAULT_MC_BAND)),
+    },
+    "multiband_gate": {
+        "enums": {"gate-mode": MULTIBAND_MODES, "envelope-boost": ENVELOPE_BOOSTS},
+        "bands": (("",), 8, _multiband_band_schema(DEFAULT_MG_BAND)),
+    },
+    "filter": {
+        "enums": {
+            "type": (
+                "Low-pass",
+                "High-pass",
+                "Low-shelf",
+                "High-shelf",
+                "Bell",
+                "Band-pass",
+                "Notch",
+                "Resonance",
+                "Ladder-pass",
+                "Ladder-rejection",
+                "Allpass",
+            ),
+            "slope": ("x1", "x2", "x3", "x4", "x6", "x8"),
+            "mode": FILTER_MODES,
+        },
+        "ranges": {"frequency": (10.0, 24000.0)},
+        "required": ["type", "slope", "mode"],
+    },
+    "pitch": {
+        "types": {
+            "overlap-length": "integer",
+            "seek-window": "integer",
+            "sequence-length": "integer",
+            "anti-alias": "boolean",
+            "quick-seek": "boolean",
+        },
+    },
+    "rnnoise": {
+        "types": {"model-name": "string", "enable-vad": "boolean"},
+    },
+    "equalizer": {
+        "types": {"num-bands": "integer", "split-channels": "boolean"},
+        "enums": {"mode": ("IIR", "FIR", "FFT", "SPM")},
+        "ranges": {"num-bands": (1, 32)},
+        "required": ["num-bands", "left", "right"],
+        "bands": (
+            ("left", "right"),
+            "num-bands",
+            {
+                "types": {
+                    "frequency": "number",
+                    "gain": "number",
+                    "q": "number",
+                    "width": "number",
+                    "mute": "boolean",
+                    "solo": "boolean",
+                },
+                "enums": {
+                    "type": (
+                        "Off",
+                        "Bell",
+                        "Hi-pass",
+                        "Hi-shelf",
+                        "Lo-pass",
+                        "Lo-shelf",
+                        "Notch",
+                        "Resonance",
+                        "Allpass",
+                        "Bandpass",
+                        "Ladder-pass",
+                        "Ladder-rej",
+                    ),
+                    "mode": FILTER_MODES,
+                    "slope": ("x1", "x2", "x3", "x4"),
+                },
+                "ranges": {
+                    "frequency": (10.0, 24000.0),
+                    "gain": (-36.0, 36.0),
+                    "q": (0.0, 100.0),
+                },
+                "required": ["frequency", "gain", "q"],
+            },
+        ),
+    },
+    "stereo_tools": {
+        "types": {
+            "mutel": "boolean",
+            "muter": "boolean",
+            "phasel": "boolean",
+            "phaser": "boolean",
+            "softclip": "boolean",
+        },
+        "enums": {
+            "mode": (
+                "LR > LR (Stereo Default)",
+                "LR > MS (Stereo to Mid-Side)",
+                "MS > LR (Mid-Side to Stereo)",
+                "LR > LL (Mono Left Channel)",
+                "LR > RR (Mono Right Channel)",
+                "LR > L+R (Mono Sum L+R)",
+                "LR > RL (Stereo Flip Channels)",
+            )
+        },
+    },
+}
+
+
+# --- Schema Compiler ---
+
+_SCHEMA_FIELDS = {"types", "enums", "ranges", "required", "sections", "bands"}
+
+# Accepted Python types per schema type. Exact type matches, so a bool
+# never passes as a number.
+_SCHEMA_TYPES = {
+    "number": frozenset((int, float)),
+    "integer": frozenset((int,)),
+    "string": frozenset((str,)),
+    "boolean": frozenset((bool,)),
+}
+
+_BAND_NAMES = tuple(f"band{i}" for i in range(32))
+
+# Unbounded numbers must still be finite to be written as JSON
+_FINITE = (-sys.float_info.max, sys.float_info.max)
+
+_MISSING = object()
+
+
+def _merge_schemas(*schemas):
+    """
+    Merges schema dicts field by field; later schemas win per key.
+    """
+    merged = {"types": {}, "enums": {}, "ranges": {}, "required": [], "sections": {}}
+    for schema in schemas:
+        unknown = set(schema) - _SCHEMA_FIELDS
+        if unknown:
+            raise ValueError(f"Unknown fields in schema: {sorted(unknown)}")
+        for field in ("types", "enums", "ranges", "sections"):
+            merged[field].update(schema.get(field, {}))
+        merged["required"] += [
+            key for key in schema.get("required", ()) if key not in merged["required"]
+        ]
+        if "bands" in schema:
+            merged["bands"] = schema["bands"]
+    return merged
+
+
+def _compile_checks(schema):
+    """
+    Folds a schema into one tuple of per-key checks:
+    (key, type name, accepted types, allowed values, minimum, maximum, required).
+    """
+    schema = _merge_schemas(schema)
+    types = dict(schema["types"])
+    for key in schema["enums"]:
+        types.setdefault(key, "string")
+    for key in schema["ranges"]:
+        types.setdefault(key, "number")
+
+    checks = []
+    for key in sorted(set(types) | set(schema["required"])):
+        type_name = types.get(key)
+        accepted = _SCHEMA_TYPES[type_name] if type_name else None
+        allowed = schema["enums"].get(key)
+        low = high = None
+        if key in schema["ranges"]:
+            low, high = schema["ranges"][key]
+            low = _FINITE[0] if low is None else low
+            high = _FINITE[1] if high is None else high
+        elif type_name == "number":
+            low, high = _FINITE
+        checks.append(
+            (
+                key,
+                type_name,
+                accepted,
+                None if allowed is None else frozenset(allowed),
+                low,
+                high,
+                key in schema["required"],
+            )
+        )
+    return tuple(checks)
+
+
+def _violation(message, key=None, old=None):
+    _report("warning", "violation", message, key=key, old=old)
+
+
+def _check_keys(name, data, checks, prefix):
+    """
+    Runs compiled checks against one dict. Reports every violation.
+    """
+    get = data.get
+    for key, type_name, accepted, allowed, low, high, required in checks:
+        value = get(key, _MISSING)
+        if value is _MISSING:
+            if required:
+                _violation(f"{name}: Missing '{prefix}{key}'.", key=prefix + key)
+        elif accepted is None:
+            continue
+        elif type(value) not in accepted:
+            _violation(
+                f"{name}: '{prefix}{key}' should be a {type_name}, got {value!r}.",
+                key=prefix + key,
+                old=value,
+            )
+        elif allowed is not None:
+            if value not in allowed:
+                _violation(
+                    f"{name}: '{prefix}{key}' has unknown value {value!r}.",
+                    key=prefix + key,
+                    old=value,
+                )
+        elif low is not None and not low <= value <= high:
+            if (low, high) == _FINITE:
+                message = f"{name}: '{prefix}{key}' is not finite."
+            else:
+                message = f"{name}: '{prefix}{key}' is {value}, outside {low}-{high}."
+            _violation(message, key=prefix + key, old=value)
+
+
+def _columns_valid(rows, checks):
+    """
+    Fast verdict for the same checks over many dicts, such as the bands of
+    an equalizer: one column per key, checked with set and min/max builtins.
+    False means _check_keys() has to find and report the violations.
+    """
+    for key, _type_name, accepted, allowed, low, high, required in checks:
+        try:
+            column = [row[key] for row in rows]
+        except KeyError:
+            if required:
+                return False
+            column = [row[key] for row in rows if key in row]
+        if accepted is None or not column:
+            continue
+        if not accepted.issuperset(map(type, column)):
+            return False
+        if allowed is not None:
+            if not allowed.issuperset(column):
+                return False
+        elif low is not None:
+            total = sum(column)
+            if total - total != 0:  # NaN or infinite
+                return False
+            if min(column) < low or max(column) > high:
+                return False
+    return True
+
+
+def _check_section(name, data, key, prefix):
+    """
+    Returns data[key] if it is a dict; reports a violation otherwise.
+    """
+    section = data.get(key) if key else data
+    if isinstance(section, dict):
+        return section
+    if section is not None:
+        _violation(f"{name}: '{prefix}{key}' should be an object.", key=prefix + key)
+    return None
+
+
+def _compile_schema(plugin_name, spec_schema, schema):
+    """
+    Compiles the schema of one plugin into a validator function (name, data)
+    that reports every violation in data. name is the plugin instance
+    (e.g. "compressor#0") used in the messages.
+    """
+    merged = _merge_schemas(BASE_SCHEMA, spec_schema, schema)
+    checks = _compile_checks(merged)
+    sections = tuple(
+        (key, _compile_checks(sub)) for key, sub in sorted(merged["sections"].items())
+    )
+    bands = None
+    if "bands" in merged:
+        containers, count, band_schema = merged["bands"]
+        bands = (tuple(containers), count, _compile_checks(band_schema))
+
+    def validate(name, data):
+        _check_keys(name, data, checks, "")
+        for key, section_checks in sections:
+            section = _check_section(name, data, key, "")
+            if section is not None:
+                _check_keys(name, section, section_checks, key + ".")
+        if bands is None:
+            return
+
+        containers, count, band_checks = bands
+        if not isinstance(count, int):
+            count = data.get(count)
+            if type(count) is not int or not 0 < count <= len(_BAND_NAMES):
+                return  # Already reported by the key checks
+        for container in containers:
+            holder = _check_section(name, data, container, "")
+            if holder is None:
+                continue
+            prefix = f"{container}." if container else ""
+            found = []
+            for band_name in _BAND_NAMES[:count]:
+                band = holder.get(band_name)
+                if isinstance(band, dict):
+                    found.append((band_name, band))
+                else:
+                    _violation(
+                        f"{name}: Missing band '{prefix}{band_name}'.",
+                        key=prefix + band_name,
+                    )
+            if not _columns_valid([band for _, band in found], band_checks):
+                for band_name, band in found:
+                    _check_keys(name, band, band_checks, f"{prefix}{band_name}.")
+
+    validate.__name__ = f"_validate_{plugin_name}"
+    validate.__doc__ = f"Validates '{plugin_name}' as declared in EE_SCHEMA."
+    return validate
+
+
+def _spec_schema(plugin_name):
+    """
+    The part of a plugin's schema implied by its PLUGIN_SPECS entry.
+    """
+    spec = PLUGIN_SPECS.get(plugin_name, {})
+    types = {key: "number" for key in spec.get("floats", ())}
+    types.update({key: "string" for key in spec.get("strings", ())})
+    ranges = {key: bounds[:2] for key, bounds in spec.get("clamp", {}).items()}
+    required = []
+    if plugin_name not in SELF_GAINED_PLUGINS:
+        required = ["input-gain", "output-gain"]
+    return {"types": types, "ranges": ranges, "required": required}
+
+
+# Map plugin names to their compiled validators
+VALIDATORS = {
+    name: _compile_schema(name, _spec_schema(name), EE_SCHEMA.get(name, {}))
+    for name in set(PLUGIN_SPECS) | set(EE_SCHEMA)
+}
+_validate_plugin = _compile_schema("plugin", _spec_schema(""), {})
+
+
+def _validate_preset(ee_data):
+    """
+    Validation core behind validate_preset(). Reports through _report().
+    """
+    output = ee_data.get("output") if isinstance(ee_data, dict) else None
+    if not isinstance(output, dict):
+        _violation("Missing 'output' section.", key="output")
+        return
+    plugins_order = output.get("plugins_order")
+    if not isinstance(plugins_order, list):
+        _violation("'output.plugins_order' should be a list.", key="plugins_order")
+        return
+    if not isinstance(output.get("blocklist", []), list):
+        _violation("'output.blocklist' should be a list.", key="blocklist")
+
+    seen = set()
+    for name in plugins_order:
+        if not isinstance(name, str) or name in seen:
+            _violation(
+                f"Invalid or repeated plugin name {name!r}.", key="plugins_order"
+            )
+            continue
+        seen.add(name)
+        _context.plugin = name
+        data = output.get(name)
+        if not isinstance(data, dict):
+            _violation(f"{name}: Plugin listed but has no settings.", key=name)
+        else:
+            VALIDATORS.get(name.partition("#")[0], _validate_plugin)(name, data)
+    _context.plugin = None
+
+
+# --- Block Cache ---
+
+BLOCK_CACHE_SIZE = 1024  # Converted plugin blocks kept in memory (LRU)
+
+
+class _BoundedCache:
+    """
+    A mapping with a size bound that evicts the least recently used entry.
+    """
+
+    __slots__ = ("size", "_data")
+
+    def __init__(self, size):
+        self.size = size
+        self._data = collections.OrderedDict()
+
+    def get(self, key):
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.size:
+            self._data.popitem(last=False)
+
+    def __len__(self):
+        return len(self._data)
+
+
+class _BlockStore:
+    """
+    The persistent block cache (--block-cache PATH), an SQLite file that
+    can be shared by worker processes and later runs. Each process opens
+    its own connection. Database errors only ever cost a cache miss.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._conn = None
+        self._pid = None
+
+    def _connection(self):
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")  # A lost entry is only a miss
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS blocks"
+                " (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def get(self, key):
+        try:
+            row = (
+                self._connection()
+                .execute("SELECT value FROM blocks WHERE key = ?", (key,))
+                .fetchone()
+            )
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    def put(self, key, value):
+        try:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO blocks (key, value) VALUES (?, ?)",
+                    (key, value),
+                )
+        except sqlite3.Error:
+            pass
+
+
+class _BlockCache:
+    """
+    Converted plugin blocks, keyed by (plugin name, relevant options, source
+    block as marshal bytes). Entries hold the converted block and its
+    diagnostics as marshal bytes, so every hit gets a private copy.
+    Misses in memory fall through to the optional persistent store, which
+    is keyed by a BLAKE2 digest of the same key.
+
+    Without a persistent store a block is only kept once it is seen a
+    second time, so libraries of unique presets do not pay for copies
+    that are never read.
+    """
+
+    def __init__(self, size, path=None):
+        self.memory = _BoundedCache(size)
+        self.seen = _BoundedCache(size * 8)  # hash(key) of blocks seen once
+        self.store = _BlockStore(path) if path else None
+        self.config = (size, path)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _digest(key):
+        plugin_name, options_key, source = key
+        h = hashlib.blake2b(digest_size=16)
+        h.update(repr((plugin_name, options_key)).encode("utf-8", "surrogatepass"))
+        h.update(source)
+        return h.hexdigest()
+
+    def get(self, key):
+        value = self.memory.get(key)
+        if value is None and self.store is not None:
+            text = self.store.get(self._digest(key))
+            if text is not None:
+                block, notes = json.loads(text)
+                value = marshal.dumps((block, [tuple(note) for note in notes]))
+                self.memory.put(key, value)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def put(self, key, block, notes):
+        if self.store is None:
+            marker = hash(key)
+            if self.seen.get(marker) is None:
+                self.seen.put(marker, True)
+                return
+        try:
+            value = marshal.dumps((block, notes))
+        except ValueError:  # Not plain data; leave it uncached
+            return
+        self.memory.put(key, value)
+        if self.store is not None:
+            self.store.put(self._digest(key), json.dumps([block, notes]))
+
+
+_block_cache = _BlockCache(BLOCK_CACHE_SIZE)
+
+
+def configure_block_cache(size=BLOCK_CACHE_SIZE, path=None):
+    """
+    Sets up the cache of converted plugin blocks shared by all conversions
+    in this process. size bounds the in-memory LRU; path adds a persistent
+    SQLite store. size=0 without a path turns the cache off.
+    Calling it again with the same settings keeps the current cache.
+    """
+    global _block_cache
+    if _block_cache is not None and _block_cache.config == (size, path):
+        return
+    _block_cache = _BlockCache(size, path) if size or path else None
+
+
+# --- Library API ---
+
+# Volume modes, as selected by the --transparent/--volume-* flags
+VOLUME_MODES = ("transparent", "headroom_0", "headroom_3", "headroom_6", "reset_1")
+
+# Gain (dB) forced onto every plugin by the volume-forcing modes
+FORCE_SET_DB_MAP = {
+    "headroom_0": 0.0,
+    "headroom_3": -3.0,
+    "headroom_6": -6.0,
+    "reset_1": -1.0,  # Changed from -9.0
+}
+
+
+class ConversionOptions:
+    """
+    Options for convert_preset(). Mirrors the command-line flags.
+
+    volume_mode: one of VOLUME_MODES (default "transparent")
+    eq_only:     only convert the equalizer
+    no_eq:       convert everything except the equalizer
+    plugins:     PulseEffects plugin names to convert, or None for all
+    plugin_rules: (action, pattern) rules picking the plugins of each preset,
+                 see _select_plugins()
+    eq_gain_offset: dB added to every equalizer band gain
+    eq_normalize: shift the equalizer band gains so the highest is 0dB
+    eq_link:     copy the left equalizer bands to the right channel
+    validate:    check the converted preset against EE_SCHEMA and report
+                 every violation as a diagnostic
+    """
+
+    __slots__ = (
+        "volume_mode",
+        "eq_only",
+        "no_eq",
+        "plugins",
+        "plugin_rules",
+        "eq_gain_offset",
+        "eq_normalize",
+        "eq_link",
+        "validate",
+    )
+
+    def __init__(
+        self,
+        volume_mode="transparent",
+        eq_only=False,
+        no_eq=False,
+        plugins=None,
+        plugin_rules=(),
+        eq_gain_offset=0.0,
+        eq_normalize=False,
+        eq_link=False,
+        validate=False,
+    ):
+        if volume_mode not in VOLUME_MODES:
+            raise ValueError(f"Unknown volume mode: {volume_mode!r}")
+        if eq_only and no_eq:
+            raise ValueError("eq_only and no_eq are mutually exclusive")
+        self.volume_mode = volume_mode
+        self.eq_only = bool(eq_only)
+        self.no_eq = bool(no_eq)
+        self.plugins = None if plugins is None else frozenset(plugins)
+        self.plugin_rules = tuple((action, pattern) for action, pattern in plugin_rules)
+        for action, _pattern in self.plugin_rules:
+            if action not in PLUGIN_RULE_ACTIONS:
+                raise ValueError(f"Unknown plugin rule action: {action!r}")
+        self.eq_gain_offset = float(eq_gain_offset)
+        if not math.isfinite(self.eq_gain_offset):
+            raise ValueError("eq_gain_offset must be a finite number")
+        self.eq_normalize = bool(eq_normalize)
+        self.eq_link = bool(eq_link)
+        self.validate = bool(validate)
+
+    @classmethod
+    def from_args(cls, args):
+        """
+        Builds options from parsed command-line arguments.
+        """
+        return cls(
+            volume_mode=args.volume_mode,
+            eq_only=args.eq_only,
+            no_eq=args.no_eq,
+            plugin_rules=args.plugin_rules,
+            eq_gain_offset=args.eq_gain_offset,
+            eq_normalize=args.eq_normalize,
+            eq_link=args.eq_link,
+            validate=args.validate,
+        )
+
+    def fingerprint(self):
+        """
+        Returns the options that influence converted output, as a plain dict.
+        validate only adds diagnostics, so it is not part of it.
+        """
+        fingerprint = {
+            "version": CONVERTER_VERSION,
+            "volume_mode": self.volume_mode,
+            "eq_only": self.eq_only,
+            "no_eq": self.no_eq,
+            "plugins": None if self.plugins is None else sorted(self.plugins),
+        }
+        # Only present when used, so existing manifests stay valid
+        if self.plugin_rules:
+            fingerprint["plugin_rules"] = [list(rule) for rule in self.plugin_rules]
+        if self.eq_gain_offset or self.eq_normalize or self.eq_link:
+            fingerprint["eq"] = [self.eq_gain_offset, self.eq_normalize, self.eq_link]
+        return fingerprint
+
+    def block_key(self):
+        """
+        Returns the options that change how a single plugin block converts.
+        Part of every block cache key.
+        """
+        return (
+            CONVERTER_VERSION,
+            self.volume_mode,
+            self.eq_gain_offset,
+            self.eq_normalize,
+            self.eq_link,
+        )
+
+
+class ConversionResult:
+    """
+    The outcome of convert_preset().
+
+    preset:      the EasyEffects preset dict, or None if nothing was converted
+    diagnostics: list of Diagnostic, in the order they happened
+    """
+
+    __slots__ = ("preset", "diagnostics")
 
+    def __init__(self, preset, diagnostics):
+        self.preset = preset
+        self.diagnostics = diagnostics
 
-def convert_pulseeffects_to_easyeffects(pulse_data, args):
+    def __repr__(self):
+        converted = "None" if self.preset is None else "{...}"
+        count = len(self.diagnostics)
+        return f"ConversionResult(preset={converted}, diagnostics={count})"
+
+
+def convert_preset(pulse_data, options=None):
     """
-    Main conversion function.
     Converts a PulseEffects preset dict to an EasyEffects preset dict.
-    Applies filtering and headroom based on 'args'.
+
+    Never prints or prompts. Everything worth telling the user is returned
+    as structured diagnostics in the ConversionResult.
+    """
+    if options is None:
+        options = ConversionOptions()
+
+    outer = getattr(_context, "diagnostics", None), getattr(_context, "plugin", None)
+    _context.diagnostics, _context.plugin = [], None
+    try:
+        preset = _convert_preset(pulse_data, options)
+        return ConversionResult(preset, _context.diagnostics)
+    finally:
+        _context.diagnostics, _context.plugin = outer
+
+
+def _convert_preset(pulse_data, options):
+    """
+    Conversion core behind convert_preset(). Reports through _report().
     """
     ee_data = {"output": {"blocklist": [], "plugins_order": []}}
 
-    pe_output = pulse_data.get("output", {})
+    pe_output = pulse_data.get("output", {}) if isinstance(pulse_data, dict) else None
     if not pe_output:
-        print(f" {ICON_ERROR} No 'output' section found in source file.")
+        _report("error", "error", "No 'output' section found in source file.")
         return None
 
     all_plugins = pe_output.get("plugins_order", [])
-    plugins_to_process = set(all_plugins)
-
-    # Handle --selected
-    if args.selected:
-        selected = _prompt_for_plugins(all_plugins)
-        if selected is None:  # User quit
-            print(f" {ICON_INFO} Operation cancelled.")
-            return "CANCELLED"
-        plugins_to_process = selected
-
-    print(f"\nProcessing preset...")
-    
+    plugins_to_process = options.plugins
+    if plugins_to_process is None:
+        plugins_to_process = set(all_plugins)
+    ruled_in = plugins_to_process
+    if options.plugin_rules:
+        ruled_in = _select_plugins(all_plugins, options.plugin_rules)
+
     # Counter for unique plugin instances
     plugin_counters = {}
 
@@ -1045,115 +2708,69 @@ def convert_pulseeffects_to_easyeffects(pulse_data, args):
 
         # Get the new plugin name (e.g., "limiter" -> "maximizer")
         final_plugin_name = PLUGIN_NAME_MAP.get(plugin_name, plugin_name)
+        _context.plugin = plugin_name
 
         # --- Filtering Logic ---
         if plugin_name not in plugins_to_process:  # From --selected
-            print(f"        {ICON_INFO} Skipping '{plugin_name}' (not selected).")
+            _report("info", "skip", f"Skipping '{plugin_name}' (not selected).")
             continue
-        if args.eq_only and final_plugin_name != "equalizer":
-            print(f"        {ICON_INFO} Skipping '{plugin_name}' (--eq-only).")
+        if plugin_name not in ruled_in:
+            _report("info", "skip", f"Skipping '{plugin_name}' (plugin rules).")
             continue
-        if args.no_eq and final_plugin_name == "equalizer":
-            print(f"        {ICON_INFO} Skipping 'equalizer' (--no-eq).")
+        if options.eq_only and final_plugin_name != "equalizer":
+            _report("info", "skip", f"Skipping '{plugin_name}' (--eq-only).")
+            continue
+        if options.no_eq and final_plugin_name == "equalizer":
+            _report("info", "skip", "Skipping 'equalizer' (--no-eq).")
             continue
         # --- End Filtering Logic ---
 
         if not pe_plugin_data:
-            print(
-                f"        {ICON_WARN} Missing plugin data for '{plugin_name}', skipping."
+            _report(
+                "warning", "skip", f"Missing plugin data for '{plugin_name}', skipping."
             )
             continue
 
-        # Convert all string values ("true", "1.0") to native types
-        ee_plugin_data = convert_value(copy.deepcopy(pe_plugin_data))
-
-        # Handle "state" (old) -> "bypass" (new)
-        state = ee_plugin_data.pop("state", True)
-        ee_plugin_data["bypass"] = not state
-
-        # Run special parameter converters if one exists
-        if final_plugin_name in PARAM_CONVERTERS:
-            ee_plugin_data = PARAM_CONVERTERS[final_plugin_name](ee_plugin_data, args)
-
-        # For plugins without converters, still ensure floats
-        elif final_plugin_name not in [
-            "level_meter",
-            "speex",
-            "echo_canceller",
-            "deepfilternet",
-        ]:
-            ee_plugin_data = _ensure_floats_simple(ee_plugin_data, args)
-
-        # Centralized Gain Strategy
-        # Set 0.0dB defaults *unless* it's a self-gained plugin
-        # This will be overwritten by force-set modes later if used.
-        if final_plugin_name not in SELF_GAINED_PLUGINS:
-            ee_plugin_data.setdefault("input-gain", 0.0)
-            ee_plugin_data.setdefault("output-gain", 0.0)
-
-        # --- Force-Set Gain Logic (if flags are used) ---
-        FORCE_SET_DB_MAP = {
-            "headroom_0": 0.0,
-            "headroom_3": -3.0,
-            "headroom_6": -6.0,
-            "reset_1": -1.0, # Changed from -9.0
-        }
-
-        # Check if the current volume mode is one we need to force-set
-        if args.volume_mode in FORCE_SET_DB_MAP:
-            target_db = FORCE_SET_DB_MAP[args.volume_mode]
-            if args.volume_mode == "reset_1":
-                print(
-                    f"        {ICON_INFO} Resetting all gain levels in '{final_plugin_name}' to -1.0dB."
-                )
-            else:
-                print(
-                    f"        {ICON_INFO} Forcing all gain levels in '{final_plugin_name}' to {target_db}dB."
-                )
-
-            # Preserve EQ band gains during reset
-            eq_bands_to_restore = None
-            if final_plugin_name == "equalizer":
-                eq_bands_to_restore = (
-                    copy.deepcopy(ee_plugin_data.get("left")),
-                    copy.deepcopy(ee_plugin_data.get("right")),
-                )
-
-            # Run the reset, using the dynamically-fetched target_db
-            ee_plugin_data = _recursive_reset_gains(ee_plugin_data, target_db)
-
-            # Restore EQ band gains
-            if eq_bands_to_restore:
-                print(
-                    f"        {ICON_INFO} Restoring EQ band settings (not resetting band gains)."
-                )
-                if eq_bands_to_restore[0]:
-                    ee_plugin_data["left"] = eq_bands_to_restore[0]
-                if eq_bands_to_restore[1]:
-                    ee_plugin_data["right"] = eq_bands_to_restore[1]
-        # --- END: Force-Set Gain Logic ---
-
         # Use counter to create unique plugin name
         count = plugin_counters.get(final_plugin_name, 0)
         final_name_indexed = f"{final_plugin_name}#{count}"
         plugin_counters[final_plugin_name] = count + 1
+        _context.plugin = final_name_indexed
+
+        prof = _profiler
+        if prof:
+            plugin_start = time.perf_counter()
+
+        ee_plugin_data = _convert_block_cached(
+            plugin_name, final_plugin_name, pe_plugin_data, options
+        )
+
+        if prof:
+            prof.plugin(final_plugin_name, plugin_start)
 
         # Assign the plugin data dict to the new key
         ee_data["output"][final_name_indexed] = ee_plugin_data
         ee_data["output"]["plugins_order"].append(final_name_indexed)
-        print(f"       {ICON_SUCCESS} Converted {plugin_name} -> {final_name_indexed}")
+        _report(
+            "success",
+            "convert",
+            f"Converted {plugin_name} -> {final_name_indexed}",
+            old=plugin_name,
+            new=final_name_indexed,
+        )
 
+    _context.plugin = None
 
     # Handle case where filtering resulted in an empty preset
     if not ee_data["output"]["plugins_order"]:
-        print(f"\n {ICON_WARN} No plugins were converted based on your filter selection.")
+        _report(
+            "warning", "skip", "No plugins were converted based on your filter selection."
+        )
         return None
 
     # Apply -6.0dB (50% gain) to first/last plugin in transparent mode
-    if args.volume_mode == "transparent" and ee_data["output"]["plugins_order"]:
-        print(
-            f"        {ICON_INFO} Applying -6.0dB gain to first input and last output."
-        )
+    if options.volume_mode == "transparent" and ee_data["output"]["plugins_order"]:
+        _report("info", "reset", "Applying -6.0dB gain to first input and last output.")
 
         # Find first non-self-gained plugin
         first_plugin_name = None
@@ -1170,20 +2787,2299 @@ def convert_pulseeffects_to_easyeffects(pulse_data, args):
                 break
 
         if first_plugin_name:
+            _context.plugin = first_plugin_name
+            old_val = ee_data["output"][first_plugin_name].get("input-gain")
             ee_data["output"][first_plugin_name]["input-gain"] = -6.0
-            print(
-                f"        {ICON_INFO} Set '{first_plugin_name}' input-gain to -6.0dB (50% gain)."
+            _report(
+                "info",
+                "reset",
+                f"Set '{first_plugin_name}' input-gain to -6.0dB (50% gain).",
+                key="input-gain",
+                old=old_val,
+                new=-6.0,
             )
         if last_plugin_name:
+            _context.plugin = last_plugin_name
+            old_val = ee_data["output"][last_plugin_name].get("output-gain")
             ee_data["output"][last_plugin_name]["output-gain"] = -6.0
-            print(f"        {ICON_INFO} Set '{last_plugin_name}' output-gain to -6.0dB (50% gain).")
+            _report(
+                "info",
+                "reset",
+                f"Set '{last_plugin_name}' output-gain to -6.0dB (50% gain).",
+                key="output-gain",
+                old=old_val,
+                new=-6.0,
+            )
+        _context.plugin = None
+
+    if options.validate:
+        prof = _profiler
+        if prof:
+            stage_start = time.perf_counter()
+        _validate_preset(ee_data)
+        if prof:
+            prof.stage("validate", stage_start)
 
     return ee_data
 
 
-def main():
+def _convert_block(plugin_name, final_plugin_name, pe_plugin_data, options):
     """
-    Main entry point. Parses command-line arguments and runs conversion.
+    Converts the data of one plugin: type coercion, its parameter converter,
+    default gains and the forced volume modes. Reports through _report().
+    Returns the new plugin dict; pe_plugin_data is left untouched.
+    """
+    prof = _profiler
+    if prof:
+        stage_start = time.perf_counter()
+
+    # Convert all string values ("true", "1.0") to native types.
+    # convert_value() builds a fresh tree, so the source is left untouched.
+    ee_plugin_data = convert_value(pe_plugin_data)
+    if prof:
+        prof.stage("coerce", stage_start)
+        stage_start = time.perf_counter()
+
+    # Handle "state" (old) -> "bypass" (new)
+    state = ee_plugin_data.pop("state", True)
+    ee_plugin_data["bypass"] = not state
+
+    # Run special parameter converters if one exists
+    if final_plugin_name in PARAM_CONVERTERS:
+        ee_plugin_data = PARAM_CONVERTERS[final_plugin_name](ee_plugin_data, options)
+        if prof:
+            prof.stage("convert", stage_start)
+
+    # For plugins without converters, still ensure floats
+    elif final_plugin_name not in [
+        "level_meter",
+        "speex",
+        "echo_canceller",
+        "deepfilternet",
+    ]:
+        ee_plugin_data = _ensure_floats_simple(ee_plugin_data, options)
+
+    # Centralized Gain Strategy
+    # Set 0.0dB defaults *unless* it's a self-gained plugin
+    # This will be overwritten by force-set modes later if used.
+    if final_plugin_name not in SELF_GAINED_PLUGINS:
+        ee_plugin_data.setdefault("input-gain", 0.0)
+        ee_plugin_data.setdefault("output-gain", 0.0)
+
+    # --- Force-Set Gain Logic (if flags are used) ---
+    # Check if the current volume mode is one we need to force-set
+    if options.volume_mode in FORCE_SET_DB_MAP:
+        if prof:
+            stage_start = time.perf_counter()
+        target_db = FORCE_SET_DB_MAP[options.volume_mode]
+        if options.volume_mode == "reset_1":
+            message = (
+                f"Resetting all gain levels in '{final_plugin_name}' to -1.0dB."
+            )
+        else:
+            message = (
+                f"Forcing all gain levels in '{final_plugin_name}' to {target_db}dB."
+            )
+        _report("info", "reset", message, new=target_db)
+
+        # Reset exactly the gain keys listed in GAIN_KEY_INDEX
+        ee_plugin_data = GAIN_RESETS.get(final_plugin_name, _reset_gains)(
+            ee_plugin_data, target_db
+        )
+        if final_plugin_name == "equalizer":
+            _report(
+                "info",
+                "reset",
+                "Restoring EQ band settings (not resetting band gains).",
+            )
+        if prof:
+            prof.stage("gain_reset", stage_start)
+    # --- END: Force-Set Gain Logic ---
+
+    return ee_plugin_data
+
+
+def _convert_block_cached(plugin_name, final_plugin_name, pe_plugin_data, options):
+    """
+    _convert_block() through the block cache. Identical blocks copied into
+    many presets are converted once; later hits replay the stored
+    diagnostics against the current plugin instance.
+    """
+    cache = _block_cache
+    diagnostics = getattr(_context, "diagnostics", None)
+    if cache is None or diagnostics is None:
+        return _convert_block(plugin_name, final_plugin_name, pe_plugin_data, options)
+
+    prof = _profiler
+    if prof:
+        start = time.perf_counter()
+    try:
+        # Marshal format 2 has no object back-references, so equal blocks
+        # always give equal bytes. Key order is part of the key because
+        # converted blocks keep their source key order.
+        source = marshal.dumps(pe_plugin_data, 2)
+    except ValueError:  # Not plain data
+        return _convert_block(plugin_name, final_plugin_name, pe_plugin_data, options)
+    key = (plugin_name, options.block_key(), source)
+    cached = cache.get(key)
+    if prof:
+        prof.stage("block_cache", start)
+
+    if cached is not None:
+        block, notes = marshal.loads(cached)
+        plugin = _context.plugin
+        for level, kind, message, note_key, old, new in notes:
+            diagnostics.append(
+                Diagnostic(level, kind, message, plugin, note_key, old, new)
+            )
+        return block
+
+    first = len(diagnostics)
+    block = _convert_block(plugin_name, final_plugin_name, pe_plugin_data, options)
+    notes = [
+        (d.level, d.kind, d.message, d.key, d.old, d.new) for d in diagnostics[first:]
+    ]
+    cache.put(key, block, notes)
+    return block
+
+
+def convert_presets(pulse_presets, options=None):
+    """
+    Converts a batch of PulseEffects presets with the same options.
+    Returns a list of ConversionResult in input order.
+    """
+    return [convert_preset(pulse_data, options) for pulse_data in pulse_presets]
+
+
+def validate_preset(ee_data):
+    """
+    Checks an EasyEffects preset dict against EE_SCHEMA: types, allowed
+    values and ranges of every plugin, and the band layouts.
+    Returns a list of Diagnostic of kind "violation", empty if none were found.
+    """
+    outer = getattr(_context, "diagnostics", None), getattr(_context, "plugin", None)
+    _context.diagnostics, _context.plugin = [], None
+    try:
+        _validate_preset(ee_data)
+        return _context.diagnostics
+    finally:
+        _context.diagnostics, _context.plugin = outer
+
+
+# --- Command-Line Conversion ---
+
+
+def _print_diagnostics(diagnostics):
+    """
+    Prints diagnostics in the script's classic emoji log format.
+    --verbose adds the affected key with its old and new value.
+    """
+    verbose = _log_level == "verbose"
+    for d in diagnostics:
+        icon = LEVEL_ICONS[d.level]
+        message = d.message
+        if verbose and d.key is not None and d.kind != "convert":
+            message += f" [{d.key}: {d.old!r} -> {d.new!r}]"
+        if d.kind == "convert":
+            _log(f"       {icon} {message}", d.level)
+        elif d.plugin is None and d.level == "warning":
+            _log(f"\n {icon} {message}", d.level)
+        elif d.plugin is None and d.level == "error":
+            _log(f" {icon} {message}", d.level)
+        else:
+            _log(f"        {icon} {message}", d.level)
+
+
+def convert_pulseeffects_to_easyeffects(pulse_data, args, label=None):
+    """
+    Main conversion function for the command line.
+    Converts a PulseEffects preset dict to an EasyEffects preset dict,
+    prompting for plugins if --selected is used and printing the log.
+    label names the file in the --event-log.
+    Returns the preset dict, None if nothing was converted, or "CANCELLED".
+    """
+    options = ConversionOptions.from_args(args)
+
+    pe_output = pulse_data.get("output") if isinstance(pulse_data, dict) else None
+    if pe_output:
+        # Handle --selected
+        if args.selected:
+            selected = _prompt_for_plugins(pe_output.get("plugins_order", []))
+            if selected is None:  # User quit
+                _log(f" {ICON_INFO} Operation cancelled.")
+                return "CANCELLED"
+            options.plugins = frozenset(selected)
+
+        _log(f"\nProcessing preset...")
+
+    result = convert_preset(pulse_data, options)
+    _print_diagnostics(result.diagnostics)
+    _log_diagnostics(label, result.diagnostics)
+    return result.preset
+
+
+# --- JSON Backend ---
+
+COMPACT_SEPARATORS = (",", ":")
+
+# Maps every digit, sign and exponent character onto '0'/'e' so the spots
+# where orjson and the stdlib can disagree become plain substring searches.
+_NUMBER_SHAPE = bytes.maketrans(b"123456789+-E", b"000000000" + b"00e")
+
+
+def _orjson_unsafe_input(data):
+    """
+    True if orjson could read data differently from the stdlib:
+    it turns integers beyond 64 bits (20+ digits) into floats.
+    """
+    return b"0" * 20 in data.translate(_NUMBER_SHAPE)
+
+
+def _orjson_unsafe_output(output):
+    """
+    True if orjson's compact output could differ from json.dumps():
+    exponents ('1e16' vs '1e+16'), tiny floats ('0.00001' vs '1e-05'),
+    NaN/Infinity (written as null), DEL and non-ASCII characters, which
+    json.dumps() escapes.
+    """
+    return (
+        not output.isascii()
+        or b"0.0000" in output
+        or b"null" in output
+        or b"\x7f" in output
+        or b"0e0" in output.translate(_NUMBER_SHAPE)
+    )
+
+
+def _json_loads(data):
+    """
+    Parses a JSON document given as bytes (UTF-8) or str.
+    Uses orjson when installed. Documents it rejects or reads differently,
+    such as NaN/Infinity literals or integers beyond 64 bits, are parsed by
+    the stdlib instead, so both backends return exactly the same data.
+    """
+    if orjson is not None:
+        try:
+            raw = data.encode("utf-8") if isinstance(data, str) else data
+            if not _orjson_unsafe_input(raw):
+                return orjson.loads(raw)
+        except (orjson.JSONDecodeError, UnicodeEncodeError):
+            pass
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def _json_dumps(data, compact=False):
+    """
+    Serializes data to UTF-8 bytes: indented by 4 spaces (the EE file
+    layout), or compact with no whitespace. Compact output uses orjson when
+    installed and falls back to the stdlib wherever the bytes could differ,
+    so the result is always identical to json.dumps().
+    """
+    if not compact:
+        return json.dumps(data, indent=4).encode("utf-8")
+    if orjson is not None:
+        try:
+            output = orjson.dumps(data)
+        except TypeError:  # e.g. integers beyond 64 bits
+            output = None
+        if output is not None and not _orjson_unsafe_output(output):
+            return output
+    return json.dumps(data, separators=COMPACT_SEPARATORS).encode("utf-8")
+
+
+def _round_floats(data, ndigits):
+    """
+    Returns a copy of data with every float rounded to ndigits decimals.
+    """
+    if type(data) is float:
+        return round(data, ndigits)
+    if isinstance(data, dict):
+        return {k: _round_floats(v, ndigits) for k, v in data.items()}
+    if isinstance(data, list):
+        return [_round_floats(v, ndigits) for v in data]
+    return data
+
+
+def _serialize(data, args):
+    """
+    Serializes a converted preset using the --compact and --float-precision
+    output options.
+    """
+    if args.float_precision is not None:
+        data = _round_floats(data, args.float_precision)
+    return _json_dumps(data, compact=args.compact)
+
+
+def _output_format(args):
+    """
+    The output options that change the written bytes, for the manifest.
+    """
+    return {"compact": args.compact, "float_precision": args.float_precision}
+
+
+# --- Batch Processing ---
+
+
+def _output_path_for(input_file):
+    """
+    Returns the '<base>_ee.json' path for an input preset.
+    """
+    base_name = os.path.splitext(input_file)[0]
+    if base_name.endswith("_ee"):
+        base_name = base_name[:-3]
+    return f"{base_name}_ee.json"
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _is_up_to_date(entry, source_hash, output_file, args):
+    """
+    Checks a manifest entry against the current source, options and output.
+    """
+    if not entry or entry.get("source") != source_hash:
+        return False
+    if entry.get("options") != ConversionOptions.from_args(args).fingerprint():
+        return False
+    if entry.get("format") != _output_format(args):
+        return False
+    try:
+        if os.path.getsize(output_file) != entry.get("output_size"):
+            return False
+        with open(output_file, "rb") as f:
+            return _sha256(f.read()) == entry.get("output")
+    except OSError:
+        return False
+
+
+def _convert_source(label, source, args):
+    """
+    Converts the raw bytes of one PE preset.
+    Returns (status, output_bytes); output_bytes is None unless converted.
+    Errors are reported against label, which names the file or archive member.
+    """
+    prof = _profiler
+    try:
+        start = time.perf_counter()
+        pulse_data = _json_loads(source)
+        if prof:
+            prof.stage("parse", start)
+
+        converted_data = convert_pulseeffects_to_easyeffects(pulse_data, args, label)
+
+        if converted_data is None:  # Skipped due to filters
+            _log(
+                f"        {ICON_WARN} No preset file written for {label}.\n", "warning"
+            )
+            return "skipped", None
+        if converted_data == "CANCELLED":  # User quit interactive prompt
+            return "cancelled", None
+
+        start = time.perf_counter()
+        output = _serialize(converted_data, args)
+        if prof:
+            prof.stage("serialize", start)
+        return "converted", output
+
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        _log(
+            f" {ICON_ERROR} Error: Failed to decode JSON from {label}. Is it valid?",
+            "error",
+            label,
+        )
+    except Exception as e:
+        _log(
+            f" {ICON_ERROR} An unexpected error occurred for {label}: {e}",
+            "error",
+            label,
+        )
+        import traceback
+
+        traceback.print_exc()
+    return "failed", None
+
+
+def _read_input(input_file, output_file, entry, args, incremental):
+    """
+    Reads one input file and, for --incremental, checks it against its
+    manifest entry. Returns (source, source_hash, up_to_date).
+    Neither prints nor profiles, so it can run on a prefetch thread.
+    """
+    with open(input_file, "rb") as f:
+        source = f.read()
+    if not incremental:
+        return source, None, False
+    source_hash = _sha256(source)
+    return source, source_hash, _is_up_to_date(entry, source_hash, output_file, args)
+
+
+def _holds_bytes(path, data):
+    """
+    Whether the file at path already contains exactly data.
+    Compares the size first and only reads files of the same size.
+    """
+    try:
+        if os.path.getsize(path) != len(data):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == data
+    except OSError:
+        return False
+
+
+def _write_output(output_file, output):
+    """
+    Writes output unless output_file already holds these exact bytes, so
+    identical outputs keep their mtime and do not trigger EasyEffects
+    reloads or sync traffic. Returns whether the file was written.
+    """
+    if _holds_bytes(output_file, output):
+        return False
+    with open(output_file, "wb") as f:
+        f.write(output)
+    return True
+
+
+def _saved_message(output_file, written=True):
+    if not written:
+        return (
+            f"        {ICON_INFO} Converted preset is identical to {output_file}; "
+            "left untouched.\n"
+        )
+    return f"        {ICON_SUCCESS} Converted preset saved as: {output_file}\n"
+
+
+def _process_input(input_file, args, entry=None, load=None, write=None):
+    """
+    Converts one input file and writes its '_ee.json' next to it.
+    Returns (status, manifest_entry). The status is one of "converted",
+    "identical" (converted, but the output file already held the same
+    bytes), "unchanged", "skipped", "failed", "ignored" or "cancelled".
+    The manifest entry is only built for --incremental runs.
+
+    load and write let _run_pipelined() move the file I/O to other threads:
+    load() returns the _read_input() result, and write(output_file, data)
+    takes over writing the output and reporting it.
+    """
+    if not input_file.endswith(".json"):
+        _log(f"{ICON_INFO} Skipping non-JSON file: {input_file}")
+        return "ignored", None
+
+    incremental = args.incremental and not args.selected
+    output_file = _output_path_for(input_file)
+    if load is None:
+        load = lambda: _read_input(input_file, output_file, entry, args, incremental)
+
+    prof = _profiler
+    try:
+        source = source_hash = None
+        if incremental:
+            start = time.perf_counter()
+            source, source_hash, up_to_date = load()
+            if prof:
+                prof.stage("manifest", start)
+            if up_to_date:
+                _log(f"{ICON_INFO} Up to date, skipping: {input_file}")
+                return "unchanged", entry
+
+        _log(f"--- Converting: {input_file} ---")
+        if source is None:
+            start = time.perf_counter()
+            source = load()[0]
+            if prof:
+                prof.stage("read", start)
+
+        status, output = _convert_source(input_file, source, args)
+        if status != "converted":
+            return status, None
+
+        status = "converted"
+        if write is not None:
+            write(output_file, output)
+        else:
+            start = time.perf_counter()
+            written = _write_output(output_file, output)
+            if prof:
+                prof.stage("write", start)
+            _log(_saved_message(output_file, written), "success")
+            if not written:
+                status = "identical"
+
+        if not incremental:
+            return status, None
+        return status, {
+            "source": source_hash,
+            "options": ConversionOptions.from_args(args).fingerprint(),
+            "format": _output_format(args),
+            "output": _sha256(output),
+            "output_size": len(output),
+        }
+
+    except Exception as e:
+        _log(
+            f" {ICON_ERROR} An unexpected error occurred for {input_file}: {e}",
+            "error",
+            input_file,
+        )
+        import traceback
+
+        traceback.print_exc()
+    return "failed", None
+
+
+class _Manifest:
+    """
+    The --incremental manifests, one per output directory.
+    Loaded lazily and written back by save().
+    """
+
+    def __init__(self):
+        self._dirs = {}
+        self._dirty = set()
+
+    def _entries(self, directory):
+        if directory not in self._dirs:
+            path = os.path.join(directory, MANIFEST_NAME)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self._dirs[directory] = json.load(f).get("files", {})
+            except (OSError, ValueError, AttributeError):
+                self._dirs[directory] = {}
+        return self._dirs[directory]
+
+    @staticmethod
+    def _split(input_file):
+        directory, name = os.path.split(_output_path_for(input_file))
+        return directory or ".", os.path.basename(input_file)
+
+    def get(self, input_file):
+        directory, name = self._split(input_file)
+        return self._entries(directory).get(name)
+
+    def update(self, input_file, entry):
+        directory, name = self._split(input_file)
+        entries = self._entries(directory)
+        if entry is None:
+            if entries.pop(name, None) is not None:
+                self._dirty.add(directory)
+        elif entries.get(name) != entry:
+            entries[name] = entry
+            self._dirty.add(directory)
+
+    def save(self):
+        for directory in sorted(self._dirty):
+            path = os.path.join(directory, MANIFEST_NAME)
+            tmp_path = path + ".tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(
+                        {"files": self._dirs[directory]}, f, indent=1, sort_keys=True
+                    )
+                os.replace(tmp_path, path)
+            except OSError as e:
+                _log(
+                    f" {ICON_ERROR} Could not write manifest {path}: {e}",
+                    "error",
+                    path,
+                )
+        self._dirty.clear()
+
+
+def _process_task(input_file, args, entry):
+    """
+    Runs _process_input() and returns (input_file, status, manifest_entry).
+    """
+    status, entry = _process_input(input_file, args, entry)
+    return input_file, status, entry
+
+
+def _run_serial(input_files, args, manifest):
+    """
+    Converts input_files one after another.
+    Yields (input_file, status, manifest_entry) per file.
+    """
+    for input_file in input_files:
+        entry = manifest.get(input_file) if manifest else None
+        yield _process_task(input_file, args, entry)
+
+
+def _run_parallel(input_files, args, jobs, manifest):
+    """
+    Converts input_files on a pool of worker processes.
+    Yields the same tuples as _run_serial(), in input order. A file whose
+    input or output is the input or output of an earlier file (e.g.
+    'a.json' and 'a_ee.json') waits for the files before it and is then
+    converted in this process, so it reads and writes what it would in
+    _run_serial().
+    """
+    claimed = set()  # Paths read or written by the files since the last wait
+
+    def collides(func_args):
+        input_file = func_args[0]
+        paths = {input_file}
+        if input_file.endswith(".json"):
+            paths.add(_output_path_for(input_file))
+        if claimed.isdisjoint(paths):
+            claimed.update(paths)
+            return False
+        claimed.clear()
+        return True
+
+    tasks = (
+        (input_file, args, manifest.get(input_file) if manifest else None)
+        for input_file in input_files
+    )
+    for captured in _map_ordered(_process_task, tasks, jobs, serial=collides):
+        yield _replay(captured)
+
+
+PIPELINE_DEPTH = 8  # Files read ahead, and outputs queued for writing, with --pipeline
+PIPELINE_READERS = 4  # Threads reading ahead with --pipeline
+
+
+def _run_pipelined(input_files, args, manifest):
+    """
+    Converts input_files one after another like _run_serial(), while
+    background threads read (and hash) the next PIPELINE_DEPTH files and
+    one thread writes finished outputs. Both queues are bounded, so memory
+    stays flat on any number of files.
+    Each file's log and event log lines are held back until its output is
+    written, so both and the yielded tuples match _run_serial(). An input
+    that an earlier file of the window writes to is read only after that
+    write.
+    """
+    incremental = args.incremental and not args.selected
+    prof = _profiler
+    prefetched = collections.deque()  # (input_file, entry, read future)
+    # (input_file, status, entry, log, write, event log lines)
+    unwritten = collections.deque()
+    submitted = []  # The write handed over by the current _process_input()
+    outputs = collections.Counter()  # Output paths of the files in flight
+
+    def prefetch(input_file):
+        entry = manifest.get(input_file) if manifest else None
+        future = None
+        if input_file.endswith(".json"):
+            output_file = _output_path_for(input_file)
+            if not outputs[input_file]:
+                future = readers.submit(
+                    _read_input, input_file, output_file, entry, args, incremental
+                )
+            outputs[output_file] += 1
+        prefetched.append((input_file, entry, future))
+
+    def submit_write(output_file, output):
+        future = writer.submit(_write_output, output_file, output)
+        submitted.append((output_file, future))
+
+    def finish():
+        input_file, status, entry, log, write, events = unwritten.popleft()
+        if input_file.endswith(".json"):
+            outputs[_output_path_for(input_file)] -= 1
+        error = None
+        if write:
+            output_file, future = write
+            start = time.perf_counter()
+            try:
+                written = future.result()
+            except OSError as e:
+                error = f" {ICON_ERROR} An unexpected error occurred for "
+                error += f"{input_file}: {e}"
+                log += error + "\n"
+                status, entry = "failed", None
+            else:
+                if not written:
+                    status = "identical"
+                if _shown("success"):
+                    log += _saved_message(output_file, written) + "\n"
+            if prof:
+                prof.stage("write", start)
+        sys.stdout.write(log)
+        sys.stdout.flush()
+        if events:
+            _event_log.write(events)
+        if error:
+            _log_error(input_file, error)
+        return input_file, status, entry
+
+    files = iter(input_files)
+    readers = ThreadPoolExecutor(PIPELINE_READERS)
+    writer = ThreadPoolExecutor(1)
+    with readers, writer:
+        for input_file in itertools.islice(files, PIPELINE_DEPTH):
+            prefetch(input_file)
+
+        while prefetched:
+            input_file, entry, future = prefetched.popleft()
+            for next_file in itertools.islice(files, 1):
+                prefetch(next_file)
+            while future is None and any(
+                write and write[0] == input_file for *_, write, _events in unwritten
+            ):
+                yield finish()  # Read it inline once it has been written
+
+            out, err = io.StringIO(), io.StringIO()
+            if _event_log is not None:
+                _event_log.held = True
+            with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+                status, entry = _process_input(
+                    input_file,
+                    args,
+                    entry,
+                    load=future.result if future else None,
+                    write=submit_write,
+                )
+            events = None
+            if _event_log is not None:
+                _event_log.held = False
+                events = _event_log.take()
+            if err.getvalue():
+                sys.stderr.write(err.getvalue())
+            write = submitted.pop() if submitted else None
+            log = out.getvalue()
+            unwritten.append((input_file, status, entry, log, write, events))
+
+            while unwritten and (
+                len(unwritten) > PIPELINE_DEPTH
+                or not unwritten[0][4]
+                or unwritten[0][4][1].done()
+            ):
+                yield finish()
+
+        while unwritten:
+            yield finish()
+
+
+def _worker_state():
+    """
+    Process-wide settings that worker processes must share with the parent.
+    """
+    return {
+        "profiling": _profiler is not None,
+        "block_cache": None if _block_cache is None else _block_cache.config,
+        "log_level": _log_level,
+        "event_log": _event_log is not None,
+    }
+
+
+def _apply_worker_state(state):
+    """
+    Applies the settings from _worker_state() in a worker process.
+    Cheap to repeat: unchanged settings keep the current caches.
+    Event log lines are kept in memory for _captured() to pass on.
+    """
+    global _log_level, _event_log
+    if state["block_cache"] is None:
+        configure_block_cache(0)
+    else:
+        configure_block_cache(*state["block_cache"])
+    _log_level = state["log_level"]
+    if not state["event_log"]:
+        _event_log = None
+    elif _event_log is None or _event_log.path is not None:  # Not the parent's file
+        _event_log = _EventLog()
+
+
+def _captured(func, state, *func_args):
+    """
+    Worker entry point for --jobs.
+    Applies the parent's _worker_state(), runs func and returns its result
+    with the captured stdout/stderr, the worker's profile counters for this
+    task when profiling and its --event-log lines.
+    """
+    profile = None
+    profiling = state["profiling"]
+    _apply_worker_state(state)
+    if profiling:
+        _start_profiler()
+    out, err = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        result = func(*func_args)
+    if profiling:
+        profile = _profiler.snapshot()
+    events = _event_log.take() if _event_log is not None else []
+    return result, out.getvalue(), err.getvalue(), profile, events
+
+
+def _map_ordered(func, arg_tuples, jobs, serial=None):
+    """
+    Runs func(*args) for every tuple in arg_tuples on a pool of worker processes.
+    Yields _captured() results in input order, keeping only a small window of
+    tasks in flight so arg_tuples can be a lazy stream.
+    When serial(args) is true, the tasks before it are finished first and
+    func runs in this process, printing directly.
+    """
+    window = jobs * 4
+    state = _worker_state()
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending = collections.deque()
+        for func_args in arg_tuples:
+            if serial is not None and serial(func_args):
+                while pending:
+                    yield pending.popleft().result()
+                yield func(*func_args), "", "", None, []
+                continue
+            # A worker forked now must not inherit buffered lines
+            sys.stdout.flush()
+            if _event_log is not None:
+                _event_log.flush()
+            pending.append(pool.submit(_captured, func, state, *func_args))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _replay(captured):
+    """
+    Prints a worker's captured output, merges its profile counters,
+    adds its event log lines and returns its result.
+    """
+    result, out, err, profile, events = captured
+    sys.stdout.write(out)
+    sys.stdout.flush()
+    if err:
+        sys.stderr.write(err)
+        sys.stderr.flush()
+    if profile and _profiler:
+        _profiler.merge(profile)
+    if events and _event_log is not None:
+        _event_log.write(events)
+    return result
+
+
+# --- Directory Input ---
+
+
+def _matches(rel_path, patterns):
+    """
+    True if rel_path or its file name matches one of the fnmatch patterns.
+    """
+    name = rel_path.rpartition("/")[2]
+    return any(
+        fnmatch.fnmatch(rel_path, pattern) or fnmatch.fnmatch(name, pattern)
+        for pattern in patterns
+    )
+
+
+def _is_preset_name(name):
+    """
+    True for PE preset file names. Skips '_ee.json' outputs and the
+    --incremental manifest.
+    """
+    return (
+        name.endswith(".json")
+        and not name.endswith("_ee.json")
+        and name != MANIFEST_NAME
+    )
+
+
+def _is_wanted(rel_path, include, exclude):
+    """
+    Applies the --include/--exclude patterns to a preset's relative path.
+    """
+    if include and not _matches(rel_path, include):
+        return False
+    return not (exclude and _matches(rel_path, exclude))
+
+
+def _scan_presets(directory, include=None, exclude=None):
+    """
+    Yields an os.DirEntry for every PE preset below directory, depth first
+    and in name order. Uses os.scandir() so file types come from the
+    directory listing and no extra stat() is needed per entry. Earlier
+    '_ee.json' outputs and the --incremental manifest are never yielded;
+    symlinked directories are not followed. Patterns match the path relative
+    to directory ('/'-separated) or the bare name; exclude patterns also
+    prune whole directories.
+    """
+    exclude = exclude or ()
+    stack = [(directory, "")]
+    while stack:
+        path, rel_dir = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError as e:
+            _log(f" {ICON_ERROR} Could not read directory {path}: {e}", "error", path)
+            continue
+
+        subdirs = []
+        for entry in entries:
+            rel_path = rel_dir + entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_dir:
+                if not _matches(rel_path, exclude):
+                    subdirs.append((entry.path, rel_path + "/"))
+            elif _is_preset_name(entry.name) and _is_wanted(rel_path, include, exclude):
+                yield entry
+        stack.extend(reversed(subdirs))
+
+
+def _walk_presets(directory, include=None, exclude=None):
+    """
+    Yields the paths of the PE presets below directory (see _scan_presets()).
+    """
+    for entry in _scan_presets(directory, include, exclude):
+        yield entry.path
+
+
+def _expand_inputs(paths, include=None, exclude=None):
+    """
+    Lazily expands directories in paths into the presets they contain.
+    Files and archives are passed through unchanged.
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            yield from _walk_presets(path, include, exclude)
+        else:
+            yield path
+
+
+# --- Archives (.zip / .tar / .tar.gz) ---
+
+ARCHIVE_SUFFIXES = (".zip", ".tar.gz", ".tgz", ".tar")
+
+
+def _archive_suffix(path):
+    """
+    Returns the archive suffix of path, or None for anything else.
+    """
+    lower = path.lower()
+    for suffix in ARCHIVE_SUFFIXES:
+        if lower.endswith(suffix):
+            return suffix
+    return None
+
+
+def _is_archive(path):
+    return _archive_suffix(path) is not None
+
+
+def _archive_output_path_for(archive_file):
+    """
+    Returns the '<base>_ee<suffix>' path for an input archive.
+    """
+    suffix = _archive_suffix(archive_file)
+    return f"{archive_file[:-len(suffix)]}_ee{archive_file[-len(suffix):]}"
+
+
+def _read_archive(archive_file):
+    """
+    Yields (member_name, mtime, data) for every regular file in an archive,
+    reading one member at a time straight from the archive.
+    """
+    if _archive_suffix(archive_file) == ".zip":
+        with zipfile.ZipFile(archive_file) as zf:
+            for info in zf.infolist():
+                if info.is_dir():
+                    continue
+                mtime = time.mktime(info.date_time + (0, 0, -1))
+                yield info.filename, mtime, zf.read(info)
+    else:
+        # Stream mode ('r|*'): members are read in order without seeking.
+        with tarfile.open(archive_file, "r|*") as tf:
+            for member in tf:
+                if not member.isfile():
+                    continue
+                yield member.name, member.mtime, tf.extractfile(member).read()
+
+
+class _ArchiveWriter:
+    """
+    Writes converted members into a new archive of the same type as the input.
+    The archive is built under a temporary name and moved into place on close(),
+    so an interrupted run never leaves a truncated bundle behind.
+    Archives only depend on their members (the gzip header carries no
+    timestamp), so an unchanged archive can be left untouched.
+    """
+
+    def __init__(self, output_file):
+        self.output_file = output_file
+        self._tmp_path = output_file + ".tmp"
+        self._gzip = self._raw = None
+        suffix = _archive_suffix(output_file)
+        if suffix == ".zip":
+            self._zip = zipfile.ZipFile(
+                self._tmp_path, "w", compression=zipfile.ZIP_DEFLATED
+            )
+            self._tar = None
+        else:
+            self._zip = None
+            if suffix == ".tar":
+                self._tar = tarfile.open(self._tmp_path, "w")
+            else:
+                self._raw = open(self._tmp_path, "wb")
+                # No name or time in the header, unlike tarfile's "w:gz"
+                self._gzip = gzip.GzipFile("", "wb", fileobj=self._raw, mtime=0)
+                self._tar = tarfile.open(fileobj=self._gzip, mode="w")
+
+    def add(self, name, mtime, data):
+        if self._zip is not None:
+            date_time = time.localtime(max(mtime, 315532800))[:6]  # Zip starts 1980
+            info = zipfile.ZipInfo(name, date_time=date_time)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            self._zip.writestr(info, data)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = mtime
+            info.mode = 0o644
+            self._tar.addfile(info, io.BytesIO(data))
+
+    def _finish(self):
+        (self._zip or self._tar).close()
+        if self._gzip is not None:
+            self._gzip.close()  # Leaves the file it wrote to open
+            self._raw.close()
+
+    def close(self):
+        """
+        Moves the archive into place, unless the existing one is identical.
+        Returns whether it was written.
+        """
+        self._finish()
+        try:
+            same_size = os.path.getsize(self._tmp_path) == os.path.getsize(
+                self.output_file
+            )
+        except OSError:
+            same_size = False
+        if same_size:
+            with open(self._tmp_path, "rb") as f:
+                if _holds_bytes(self.output_file, f.read()):
+                    os.remove(self._tmp_path)
+                    return False
+        os.replace(self._tmp_path, self.output_file)
+        return True
+
+    def abort(self):
+        self._finish()
+        try:
+            os.remove(self._tmp_path)
+        except OSError:
+            pass
+
+
+def _convert_member(label, name, mtime, data, args):
+    """
+    Converts one archive member.
+    Returns (label, status, output_name, mtime, output_bytes).
+    """
+    if not name.endswith(".json"):
+        _log(f"{ICON_INFO} Skipping non-JSON member: {label}")
+        return label, "ignored", None, mtime, None
+    if name.endswith("_ee.json"):
+        _log(f"{ICON_INFO} Skipping already converted member: {label}")
+        return label, "ignored", None, mtime, None
+
+    _log(f"--- Converting: {label} ---")
+    status, output = _convert_source(label, data, args)
+    return label, status, _output_path_for(name), mtime, output
+
+
+def _run_archive(archive_file, args, jobs):
+    """
+    Converts every preset inside archive_file into '<base>_ee<suffix>'
+    without extracting anything to disk. Members are converted in memory,
+    on worker processes when jobs > 1, and written in archive order.
+    Yields (label, status, None) per converted member.
+    """
+    output_file = _archive_output_path_for(archive_file)
+    try:
+        writer = _ArchiveWriter(output_file)
+    except (OSError, tarfile.TarError) as e:
+        _log(
+            f" {ICON_ERROR} Could not create archive {output_file}: {e}",
+            "error",
+            archive_file,
+        )
+        yield archive_file, "failed", None
+        return
+
+    written = 0
+    cancelled = False
+    try:
+        tasks = (
+            (f"{archive_file}:{name}", name, mtime, data, args)
+            for name, mtime, data in _read_archive(archive_file)
+        )
+        if jobs > 1:
+            results = (_replay(c) for c in _map_ordered(_convert_member, tasks, jobs))
+        else:
+            results = (_convert_member(*task) for task in tasks)
+
+        for label, status, output_name, mtime, output in results:
+            if status == "cancelled":
+                cancelled = True
+                yield label, status, None
+                break
+            if status == "converted":
+                start = time.perf_counter()
+                writer.add(output_name, mtime, output)
+                if _profiler:
+                    _profiler.stage("write", start)
+                written += 1
+                _log(
+                    f"        {ICON_SUCCESS} Converted preset added as: "
+                    f"{output_name}\n",
+                    "success",
+                )
+            yield label, status, None
+    except (OSError, zipfile.BadZipFile, tarfile.TarError, EOFError) as e:
+        _log(
+            f" {ICON_ERROR} Could not read archive {archive_file}: {e}",
+            "error",
+            archive_file,
+        )
+        writer.abort()
+        yield archive_file, "failed", None
+        return
+    except BaseException:
+        writer.abort()
+        raise
+
+    if cancelled or not written:
+        writer.abort()
+        if not cancelled:
+            _log(
+                f"{ICON_WARN} No presets converted from {archive_file}; "
+                "no archive written.",
+                "warning",
+            )
+        return
+    if not writer.close():
+        _log(f"{ICON_INFO} Archive {output_file} is unchanged; left untouched.\n")
+        return
+    _log(
+        f"{ICON_SUCCESS} Wrote {written} preset(s) to archive: {output_file}\n",
+        "success",
+    )
+
+
+def _run_inputs(input_files, args, jobs, manifest):
+    """
+    Converts plain preset files and archives in input order.
+    Consecutive plain files share one serial or parallel run and are recorded
+    in the manifest; each archive is converted on its own.
+    Yields (name, status, manifest_entry).
+    """
+    for is_archive, group in itertools.groupby(input_files, key=_is_archive):
+        if is_archive:
+            for archive_file in group:
+                for label, status, entry in _run_archive(archive_file, args, jobs):
+                    _log_file(label, status)
+                    yield label, status, entry
+            continue
+        if jobs > 1:
+            results = _run_parallel(group, args, jobs, manifest)
+        elif args.pipeline:
+            results = _run_pipelined(group, args, manifest)
+        else:
+            results = _run_serial(group, args, manifest)
+        for input_file, status, entry in results:
+            if manifest and status not in ("ignored", "cancelled"):
+                manifest.update(input_file, entry)
+            _log_file(input_file, status)
+            yield input_file, status, entry
+
+
+# --- Streaming (--stream) ---
+
+
+def _convert_stream_line(line_no, line, args):
+    """
+    Converts one NDJSON line, given as bytes. Returns (status, output line);
+    the line is "null" if the preset failed, was skipped or is not valid
+    UTF-8. Diagnostics are printed to stdout and must be redirected to
+    stderr by the caller.
+    """
+    label = f"<stdin>:{line_no}"
+    _log(f"--- Converting: {label} ---")
+    try:
+        converted_data = convert_pulseeffects_to_easyeffects(
+            _json_loads(line), args, label
+        )
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        _log(
+            f" {ICON_ERROR} Error: Failed to decode JSON on line {line_no}.",
+            "error",
+            label,
+        )
+        _log_file(label, "failed")
+        return "failed", "null"
+    except Exception as e:
+        _log(
+            f" {ICON_ERROR} An unexpected error occurred on line {line_no}: {e}",
+            "error",
+            label,
+        )
+        _log_file(label, "failed")
+        return "failed", "null"
+
+    if converted_data is None:  # Skipped due to filters
+        _log(f"        {ICON_WARN} No preset written for line {line_no}.", "warning")
+        _log_file(label, "skipped")
+        return "skipped", "null"
+    if args.float_precision is not None:
+        converted_data = _round_floats(converted_data, args.float_precision)
+    _log_file(label, "converted")
+    return "converted", _json_dumps(converted_data, compact=True).decode("utf-8")
+
+
+def _stream_lines(stream):
+    """
+    Yields (line_no, line) for every non-blank line of a binary stream.
+    """
+    for line_no, line in enumerate(stream, 1):
+        if line.strip():
+            yield line_no, line
+
+
+def _run_stream(args, jobs):
+    """
+    Reads one PulseEffects preset per line on stdin and writes one
+    EasyEffects preset per line on stdout. Presets that fail or are
+    skipped become "null" so output lines stay aligned with input lines.
+    Returns the per-line statuses as a Counter.
+    """
+    stdout = sys.stdout
+    summary = collections.Counter()
+    tasks = (
+        (line_no, line, args) for line_no, line in _stream_lines(sys.stdin.buffer)
+    )
+
+    with contextlib.redirect_stdout(sys.stderr):
+        if jobs > 1:
+            captured = _map_ordered(_convert_stream_line, tasks, jobs)
+            results = (_replay(c) for c in captured)
+        else:
+            results = (_convert_stream_line(*task) for task in tasks)
+
+        for status, out_line in results:
+            summary[status] += 1
+            stdout.write(out_line + "\n")
+            stdout.flush()
+
+    return summary
+
+
+# --- Watch Mode (--watch) ---
+
+WATCH_DEBOUNCE = 0.5  # Seconds a preset must stay untouched before converting
+WATCH_POLL_INTERVAL = 1.0  # Seconds between scans of the polling watcher
+
+
+class _InotifyWatcher:
+    """
+    Reports changed presets below a directory using Linux inotify (via ctypes).
+    Every subdirectory gets its own watch; new subdirectories are added as
+    they appear and scanned once for presets created before their watch.
+    """
+
+    name = "inotify"
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+
+    _EVENT = struct.Struct("iIII")  # wd, mask, cookie, len
+
+    def __init__(self, directory, include, exclude):
+        self.directory = directory
+        self.include = include
+        self.exclude = exclude
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs = {}
+        self._add_tree(directory)
+
+    def _rel(self, path):
+        return os.path.relpath(path, self.directory).replace(os.sep, "/")
+
+    def _add_tree(self, top):
+        """
+        Watches top and its subdirectories. Returns the presets already in them.
+        """
+        found = []
+        stack = [top]
+        while stack:
+            path = stack.pop()
+            wd = self._libc.inotify_add_watch(
+                self._fd, os.fsencode(path), self.MASK
+            )
+            if wd < 0:
+                err = ctypes.get_errno()
+                _log(
+                    f" {ICON_ERROR} Cannot watch {path}: {os.strerror(err)}",
+                    "error",
+                    path,
+                )
+                continue
+            self._dirs[wd] = path
+            try:
+                with os.scandir(path) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            for entry in entries:
+                rel_path = self._rel(entry.path)
+                if entry.is_dir(follow_symlinks=False):
+                    if not _matches(rel_path, self.exclude):
+                        stack.append(entry.path)
+                elif _is_preset_name(entry.name):
+                    found.append(entry.path)
+        return found
+
+    def changes(self, timeout):
+        """
+        Waits up to timeout seconds (None = forever) for events and returns
+        the set of preset paths that were written, created or moved in.
+        """
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        buf = os.read(self._fd, 64 * 1024)
+
+        changed = set()
+        offset = 0
+        while offset < len(buf):
+            wd, mask, _cookie, length = self._EVENT.unpack_from(buf, offset)
+            offset += self._EVENT.size
+            name = os.fsdecode(buf[offset:offset + length].rstrip(b"\0"))
+            offset += length
+
+            if mask & self.IN_Q_OVERFLOW:
+                _log(f"{ICON_WARN} Too many changes at once; rescanning.", "warning")
+                changed.update(
+                    _walk_presets(self.directory, self.include, self.exclude)
+                )
+                continue
+            if mask & self.IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            parent = self._dirs.get(wd)
+            if parent is None or not name:
+                continue
+            path = os.path.join(parent, name)
+            if mask & self.IN_ISDIR:
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO) and not _matches(
+                    self._rel(path), self.exclude
+                ):
+                    changed.update(self._add_tree(path))
+            elif _is_preset_name(name):
+                changed.add(path)
+
+        return {
+            path
+            for path in changed
+            if _is_wanted(self._rel(path), self.include, self.exclude)
+        }
+
+    def close(self):
+        os.close(self._fd)
+
+
+class _PollingWatcher:
+    """
+    Reports changed presets by rescanning the directory every
+    WATCH_POLL_INTERVAL seconds and comparing size and mtime per file.
+    Used where inotify is not available.
+    """
+
+    name = "polling"
+
+    def __init__(self, directory, include, exclude):
+        self.directory = directory
+        self.include = include
+        self.exclude = exclude
+        self._next_scan = 0.0
+        self._seen = self._scan()
+
+    def _scan(self):
+        self._next_scan = time.monotonic() + WATCH_POLL_INTERVAL
+        seen = {}
+        for entry in _scan_presets(self.directory, self.include, self.exclude):
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            seen[entry.path] = (st.st_mtime_ns, st.st_size)
+        return seen
+
+    def changes(self, timeout):
+        """
+        Waits up to timeout seconds (None = until the next scan) and returns
+        the set of preset paths that are new or changed since the last scan.
+        """
+        wait = self._next_scan - time.monotonic()
+        if timeout is not None:
+            wait = min(wait, timeout)
+        if wait > 0:
+            time.sleep(wait)
+        if time.monotonic() < self._next_scan:
+            return set()
+
+        seen = self._scan()
+        changed = {
+            path for path, stamp in seen.items() if self._seen.get(path) != stamp
+        }
+        self._seen = seen
+        return changed
+
+    def close(self):
+        pass
+
+
+def _make_watcher(directory, include, exclude):
+    """
+    Returns an inotify watcher on Linux and a polling watcher elsewhere
+    or when inotify cannot be set up.
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            return _InotifyWatcher(directory, include, exclude)
+        except (OSError, AttributeError, TypeError) as e:
+            _log(f"{ICON_INFO} inotify unavailable ({e}); falling back to polling.")
+    return _PollingWatcher(directory, include, exclude)
+
+
+def _run_watch(directory, args, jobs, manifest):
+    """
+    Converts presets below directory whenever they are created or changed,
+    until interrupted with Ctrl+C. A preset is converted once it has not
+    been touched for WATCH_DEBOUNCE seconds, so bursts of writes and
+    sync tools that save in several steps trigger a single conversion.
+    Returns the per-file statuses as a Counter.
+    """
+    watcher = _make_watcher(directory, args.include, args.exclude)
+    _log(
+        f"{ICON_INFO} Watching {directory} for changed presets ({watcher.name}). "
+        "Press Ctrl+C to stop."
+    )
+
+    summary = collections.Counter()
+    pending = {}  # path -> time of the last change
+    try:
+        while True:
+            timeout = None
+            if pending:
+                oldest = min(pending.values())
+                timeout = max(0.0, oldest + WATCH_DEBOUNCE - time.monotonic())
+
+            changed = watcher.changes(timeout)
+            now = time.monotonic()
+            for path in changed:
+                pending[path] = now
+
+            now = time.monotonic()
+            ready = sorted(
+                path for path, t in pending.items() if now - t >= WATCH_DEBOUNCE
+            )
+            if not ready:
+                continue
+            for path in ready:
+                del pending[path]
+            ready = [path for path in ready if os.path.isfile(path)]
+
+            batch = collections.Counter()
+            batch_jobs = jobs if len(ready) > 1 else 1  # No pool for a single file
+            results = _run_inputs(ready, args, batch_jobs, manifest)
+            for _name, status, _entry in results:
+                batch[status] += 1
+            if manifest:
+                manifest.save()
+            if _event_log is not None:
+                _event_log.flush()  # Readers can follow the log live
+            summary.update(batch)
+            if batch["converted"] or batch["identical"] or batch["failed"]:
+                _log(
+                    f"{ICON_INFO} {batch['converted']} converted, "
+                    f"{batch['identical']} identical, "
+                    f"{batch['failed']} failed. Still watching..."
+                )
+    except KeyboardInterrupt:
+        _log(f"\n{ICON_INFO} Stopped watching.")
+    finally:
+        watcher.close()
+    return summary
+
+
+# --- Preset Index (--index) ---
+
+INDEX_VERSION = 2  # Bump when the tables change; older indexes are rebuilt
+INDEX_COMMIT_EVERY = 256  # Presets stored per transaction
+
+INDEX_TABLES = (
+    """CREATE TABLE presets (
+        id INTEGER PRIMARY KEY,
+        path TEXT UNIQUE NOT NULL,
+        mtime_ns INTEGER NOT NULL,
+        size INTEGER NOT NULL,
+        source TEXT NOT NULL,
+        options TEXT NOT NULL,
+        status TEXT NOT NULL,
+        plugins_order TEXT
+    )""",
+    """CREATE TABLE plugins (
+        preset INTEGER NOT NULL,
+        position INTEGER NOT NULL,
+        name TEXT NOT NULL,
+        converted_as TEXT
+    )""",
+    """CREATE TABLE params (
+        preset INTEGER NOT NULL,
+        plugin TEXT NOT NULL,
+        instance TEXT NOT NULL,
+        key TEXT NOT NULL,
+        value
+    )""",
+    """CREATE TABLE source_params (
+        preset INTEGER NOT NULL,
+        plugin TEXT NOT NULL,
+        key TEXT NOT NULL,
+        value
+    )""",
+    """CREATE TABLE diagnostics (
+        preset INTEGER NOT NULL,
+        level TEXT NOT NULL,
+        kind TEXT NOT NULL,
+        plugin TEXT,
+        key TEXT,
+        message TEXT NOT NULL,
+        old,
+        new
+    )""",
+)
+
+# Tables whose rows belong to one preset (the preset column)
+_INDEX_PRESET_TABLES = ("plugins", "params", "source_params", "diagnostics")
+
+# Created after the first bulk load, which is much faster without them
+INDEX_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS plugins_by_name ON plugins (name, preset)",
+    "CREATE INDEX IF NOT EXISTS plugins_by_preset ON plugins (preset)",
+    "CREATE INDEX IF NOT EXISTS params_by_key ON params (plugin, key, value)",
+    "CREATE INDEX IF NOT EXISTS params_by_preset ON params (preset)",
+    "CREATE INDEX IF NOT EXISTS source_params_by_key"
+    " ON source_params (plugin, key, value)",
+    "CREATE INDEX IF NOT EXISTS source_params_by_preset ON source_params (preset)",
+    "CREATE INDEX IF NOT EXISTS diagnostics_by_kind ON diagnostics (kind, level)",
+    "CREATE INDEX IF NOT EXISTS diagnostics_by_preset ON diagnostics (preset)",
+)
+
+
+def _index_value(value):
+    """
+    Returns value as SQLite can store it: numbers, strings and None as
+    they are, anything else as JSON text.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return json.dumps(value)
+
+
+def _flat_params(data, prefix="", source=False):
+    """
+    Yields (key, value) for every setting of a plugin block. Nested keys
+    are joined with '.', e.g. 'left.band0.gain'. With source, the string
+    values of a PulseEffects block are read as numbers and booleans where
+    possible, so they compare like the converted ones.
+    """
+    for key, value in data.items():
+        if isinstance(value, dict):
+            yield from _flat_params(value, f"{prefix}{key}.", source)
+        else:
+            if source and isinstance(value, str):
+                value = _convert_string(value)
+            yield prefix + key, _index_value(value)
+
+
+def _index_record(pulse_data, options):
+    """
+    Converts one preset and returns what the index keeps of it:
+    (status, plugins_order, plugins, params, source_params, diagnostics).
+    params are the settings of the converted EasyEffects plugins,
+    source_params those of the PulseEffects preset as it was read.
+    """
+    result = convert_preset(pulse_data, options)
+    preset = result.preset
+    pe_output = pulse_data.get("output") if isinstance(pulse_data, dict) else None
+    plugins_order = []
+    source_params = []
+    if isinstance(pe_output, dict):
+        plugins_order = pe_output.get("plugins_order")
+        if not isinstance(plugins_order, list):
+            plugins_order = []
+        for plugin, block in pe_output.items():
+            if isinstance(block, dict):
+                source_params.extend(
+                    (plugin, key, value)
+                    for key, value in _flat_params(block, source=True)
+                )
+
+    # Which EE instance each PE plugin became, from the "convert" notes
+    converted_as = collections.defaultdict(collections.deque)
+    for note in result.diagnostics:
+        if note.kind == "convert":
+            converted_as[note.old].append(note.new)
+    plugins = []
+    for position, name in enumerate(plugins_order, 1):
+        instances = converted_as.get(name)
+        instance = instances.popleft() if instances else None
+        plugins.append((position, str(name), instance))
+
+    params = []
+    if preset is not None:
+        output = preset["output"]
+        for instance in output["plugins_order"]:
+            plugin = instance.split("#")[0]
+            params.extend(
+                (plugin, instance, key, value)
+                for key, value in _flat_params(output[instance])
+            )
+
+    diagnostics = [
+        (
+            note.level,
+            note.kind,
+            note.plugin,
+            note.key,
+            note.message,
+            _index_value(note.old),
+            _index_value(note.new),
+        )
+        for note in result.diagnostics
+    ]
+    status = "skipped" if preset is None else "converted"
+    return (
+        status,
+        json.dumps(plugins_order),
+        plugins,
+        params,
+        source_params,
+        diagnostics,
+    )
+
+
+def _failed_record(message):
+    diagnostic = ("error", "error", None, None, message, None, None)
+    return "failed", None, [], [], [], [diagnostic]
+
+
+def _index_file(path, known_source, options):
+    """
+    Reads and converts one preset for the index.
+    Returns (source_hash, record); record is None when the source still
+    matches known_source, and a "failed" record if it cannot be read.
+    """
+    try:
+        with open(path, "rb") as f:
+            source = f.read()
+    except OSError as e:
+        return None, _failed_record(f"Could not read {path}: {e}")
+    source_hash = _sha256(source)
+    if source_hash == known_source:
+        return source_hash, None
+    try:
+        pulse_data = _json_loads(source)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return source_hash, _failed_record(f"Failed to decode JSON from {path}.")
+    try:
+        return source_hash, _index_record(pulse_data, options)
+    except Exception as e:
+        return source_hash, _failed_record(
+            f"An unexpected error occurred for {path}: {e}"
+        )
+
+
+class _PresetIndex:
+    """
+    The --index database. Presets are keyed by absolute path and
+    re-converted only when their size, mtime, content or the conversion
+    options changed.
+    """
+
+    def __init__(self, path, read_only=False):
+        if read_only:
+            uri = "file:" + urllib.parse.quote(os.path.abspath(path)) + "?mode=ro"
+            self.conn = sqlite3.connect(uri, uri=True)
+            return
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != INDEX_VERSION:
+            with self.conn:
+                for table in ("presets",) + _INDEX_PRESET_TABLES:
+                    self.conn.execute(f"DROP TABLE IF EXISTS {table}")
+                for statement in INDEX_TABLES:
+                    self.conn.execute(statement)
+                self.conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+        else:
+            self.create_indexes()  # In case the first load was interrupted
+
+    def known(self):
+        """
+        Returns {path: (id, mtime_ns, size, source, options)}.
+        """
+        rows = self.conn.execute(
+            "SELECT path, id, mtime_ns, size, source, options FROM presets"
+        )
+        return {row[0]: row[1:] for row in rows}
+
+    def touch(self, preset_id, stat):
+        self.conn.execute(
+            "UPDATE presets SET mtime_ns = ?, size = ? WHERE id = ?",
+            (stat.st_mtime_ns, stat.st_size, preset_id),
+        )
+
+    def remove(self, preset_id):
+        for table in _INDEX_PRESET_TABLES:
+            self.conn.execute(f"DELETE FROM {table} WHERE preset = ?", (preset_id,))
+        self.conn.execute("DELETE FROM presets WHERE id = ?", (preset_id,))
+
+    def store(self, path, preset_id, stat, source_hash, options_key, record):
+        """
+        Replaces everything indexed for path with record.
+        """
+        status, plugins_order, plugins, params, source_params, diagnostics = record
+        if preset_id is not None:
+            self.remove(preset_id)
+        preset_id = self.conn.execute(
+            "INSERT INTO presets"
+            " (path, mtime_ns, size, source, options, status, plugins_order)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                path,
+                stat.st_mtime_ns,
+                stat.st_size,
+                source_hash or "",
+                options_key,
+                status,
+                plugins_order,
+            ),
+        ).lastrowid
+        self.conn.executemany(
+            "INSERT INTO plugins VALUES (?, ?, ?, ?)",
+            [(preset_id,) + row for row in plugins],
+        )
+        self.conn.executemany(
+            "INSERT INTO params VALUES (?, ?, ?, ?, ?)",
+            [(preset_id,) + row for row in params],
+        )
+        self.conn.executemany(
+            "INSERT INTO source_params VALUES (?, ?, ?, ?)",
+            [(preset_id,) + row for row in source_params],
+        )
+        self.conn.executemany(
+            "INSERT INTO diagnostics VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(preset_id,) + row for row in diagnostics],
+        )
+
+    def create_indexes(self):
+        with self.conn:
+            for statement in INDEX_INDEXES:
+                self.conn.execute(statement)
+
+    def close(self):
+        self.conn.close()
+
+
+def _index_options_key(options):
+    """
+    The options an index entry was built with. Unlike the manifest this
+    includes validate, which adds diagnostics to the index.
+    """
+    key = options.fingerprint()
+    key["validate"] = options.validate
+    return json.dumps(key, sort_keys=True)
+
+
+def _run_index(db_path, paths, args, jobs):
+    """
+    Brings the index at db_path up to date with the presets in paths.
+    Unchanged presets are only stat()ed; presets that vanished from an
+    indexed directory are removed. Returns the statuses as a Counter.
+    """
+    options = ConversionOptions.from_args(args)
+    options_key = _index_options_key(options)
+    index = _PresetIndex(db_path)
+    known = index.known()
+    summary = collections.Counter()
+
+    roots = [os.path.abspath(path) for path in paths if os.path.isdir(path)]
+    seen = set()
+    tasks = []  # (path, stat, source hash to compare with)
+    for input_file in _expand_inputs(paths, args.include, args.exclude):
+        if _is_archive(input_file) or not input_file.endswith(".json"):
+            _log(f"{ICON_INFO} Skipping non-JSON file: {input_file}")
+            continue
+        path = os.path.abspath(input_file)
+        if path in seen:
+            continue
+        seen.add(path)
+        try:
+            stat = os.stat(path)
+        except OSError as e:
+            _log(f" {ICON_ERROR} Could not read {input_file}: {e}", "error", path)
+            summary["failed"] += 1
+            continue
+        entry = known.get(path)
+        known_source = None
+        if entry and entry[4] == options_key:
+            if entry[1:3] == (stat.st_mtime_ns, stat.st_size):
+                summary["unchanged"] += 1
+                continue
+            known_source = entry[3]  # Re-read, but only convert if it changed
+        tasks.append((path, stat, known_source))
+
+    try:
+        arg_tuples = [(path, source, options) for path, _stat, source in tasks]
+        if jobs > 1 and len(tasks) > 1:
+            captured = _map_ordered(_index_file, arg_tuples, jobs)
+            results = (_replay(c) for c in captured)
+        else:
+            results = (_index_file(*task_args) for task_args in arg_tuples)
+        stored = 0
+        for (path, stat, _source), (source_hash, record) in zip(tasks, results):
+            entry = known.get(path)
+            preset_id = entry[0] if entry else None
+            if record is None:
+                index.touch(preset_id, stat)  # Only the mtime changed
+                summary["unchanged"] += 1
+            else:
+                index.store(path, preset_id, stat, source_hash, options_key, record)
+                if record[0] == "failed":
+                    message = record[-1][0][4]
+                    _log(f" {ICON_ERROR} Error: {message}", "error", path)
+                    summary["failed"] += 1
+                else:
+                    summary["indexed"] += 1
+            stored += 1
+            if stored % INDEX_COMMIT_EVERY == 0:
+                index.conn.commit()
+
+        for path, entry in known.items():
+            if path in seen:
+                continue
+            if any(path.startswith(os.path.join(root, "")) for root in roots):
+                index.remove(entry[0])
+                summary["removed"] += 1
+        index.conn.commit()
+        index.create_indexes()
+    finally:
+        index.close()
+    return summary
+
+
+def _run_index_query(db_path, sql):
+    """
+    Runs one SQL query against the index and prints the rows tab-separated
+    under a header line. Returns the number of rows.
+    """
+    index = _PresetIndex(db_path, read_only=True)
+    try:
+        start = time.perf_counter()
+        cursor = index.conn.execute(sql)
+        rows = cursor.fetchall()
+        elapsed = time.perf_counter() - start
+    finally:
+        index.close()
+    if cursor.description:
+        print("\t".join(column[0] for column in cursor.description))
+    for row in rows:
+        print("\t".join("" if value is None else str(value) for value in row))
+    print(f"{ICON_INFO} {len(rows)} rows in {elapsed * 1000:.1f}ms.", file=sys.stderr)
+    return len(rows)
+
+
+# --- HTTP Service (--serve) ---
+
+SERVE_QUEUE_PER_WORKER = 4  # Requests admitted per worker before 503
+SERVE_MAX_BODY = 32 * 1024 * 1024  # Bytes per request body
+SERVE_STATS_WINDOW = 2048  # Latest requests used for the latency percentiles
+SERVE_ENDPOINTS = ("/convert", "/convert/batch", "/stats")  # Others count as "other"
+
+_TRUE_WORDS = ("1", "true", "yes", "on")
+_FALSE_WORDS = ("", "0", "false", "no", "off")
+
+
+def _query_bool(query, name, default=False):
+    value = query.get(name, [None])[-1]
+    if value is None:
+        return default
+    if value.lower() in _TRUE_WORDS:
+        return True
+    if value.lower() in _FALSE_WORDS:
+        return False
+    raise ValueError(f"{name} must be true or false, not {value!r}")
+
+
+def _service_options(query):
+    """
+    Reads the conversion and output options from a parsed query string.
+    Returns (ConversionOptions, float_precision, compact); raises ValueError
+    for unknown or invalid parameters.
+    """
+    known = {
+        "volume_mode",
+        "eq_only",
+        "no_eq",
+        "plugins",
+        "plugin_include",
+        "plugin_exclude",
+        "eq_gain_offset",
+        "eq_normalize",
+        "eq_link",
+        "validate",
+        "float_precision",
+        "compact",
+    }
+    unknown = sorted(set(query) - known)
+    if unknown:
+        raise ValueError(f"Unknown parameter(s): {', '.join(unknown)}")
+
+    plugins = query.get("plugins", [None])[-1]
+    if plugins is not None:
+        plugins = [name.strip() for name in plugins.split(",") if name.strip()]
+    plugin_rules = [
+        (action, pattern.strip())
+        for action in PLUGIN_RULE_ACTIONS
+        for value in query.get(f"plugin_{action}", [])
+        for pattern in value.split(",")
+        if pattern.strip()
+    ]
+    options = ConversionOptions(
+        volume_mode=query.get("volume_mode", ["transparent"])[-1],
+        eq_only=_query_bool(query, "eq_only"),
+        no_eq=_query_bool(query, "no_eq"),
+        plugins=plugins,
+        plugin_rules=plugin_rules,
+        eq_gain_offset=float(query.get("eq_gain_offset", [0.0])[-1]),
+        eq_normalize=_query_bool(query, "eq_normalize"),
+        eq_link=_query_bool(query, "eq_link"),
+        validate=_query_bool(query, "validate"),
+    )
+
+    float_precision = query.get("float_precision", [None])[-1]
+    if float_precision is not None:
+        float_precision = int(float_precision)
+        if not 0 <= float_precision <= 15:
+            raise ValueError("float_precision must be between 0 and 15")
+    return options, float_precision, _query_bool(query, "compact", default=True)
+
+
+def _result_payload(result, float_precision):
+    preset = result.preset
+    if preset is not None and float_precision is not None:
+        preset = _round_floats(preset, float_precision)
+    return {
+        "preset": preset,
+        "diagnostics": [d.to_dict() for d in result.diagnostics],
+    }
+
+
+def _serve_payload(pulse_data, options, float_precision):
+    """
+    Converts one preset of a request to its response payload. A preset that
+    cannot be converted gives {"error": message} instead of raising.
+    """
+    try:
+        return _result_payload(convert_preset(pulse_data, options), float_precision)
+    except Exception as e:
+        return {"error": f"Could not convert preset: {e}"}
+
+
+def _serve_task(state, batch, body, options, float_precision, compact):
+    """
+    Worker entry point for the HTTP service. Converts one preset, or a JSON
+    array of presets when batch is set. Returns (http_status, body_bytes).
+    A malformed single preset is a 400; in a batch it only fails its item.
+    """
+    _apply_worker_state(state)
+    try:
+        data = _json_loads(body)
+    except (ValueError, UnicodeDecodeError) as e:
+        return 400, _json_dumps({"error": f"Invalid JSON: {e}"}, compact=True)
+
+    if batch:
+        if not isinstance(data, list):
+            return 400, _json_dumps(
+                {"error": "Expected a JSON array of presets"}, compact=True
+            )
+        payload = [
+            _serve_payload(pulse_data, options, float_precision) for pulse_data in data
+        ]
+    else:
+        payload = _serve_payload(data, options, float_precision)
+        if "error" in payload:
+            return 400, _json_dumps(payload, compact=True)
+    return 200, _json_dumps(payload, compact=compact)
+
+
+class _ServiceStats:
+    """
+    Request counters and a sliding window of latencies for GET /stats.
+    """
+
+    def __init__(self, workers, capacity):
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.workers = workers
+        self.capacity = capacity
+        self.in_flight = 0
+        self.requests = collections.Counter()  # endpoint -> count
+        self.statuses = collections.Counter()  # HTTP status -> count
+        self.latencies = collections.deque(maxlen=SERVE_STATS_WINDOW)
+
+    def record(self, endpoint, status, seconds=None):
+        """
+        Counts one request. Unknown paths share the "other" counter so the
+        counters stay bounded. Only requests given a duration (conversions)
+        enter the latency window.
+        """
+        if endpoint not in SERVE_ENDPOINTS:
+            endpoint = "other"
+        with self.lock:
+            self.requests[endpoint] += 1
+            self.statuses[str(status)] += 1
+            if seconds is not None:
+                self.latencies.append(seconds)
+
+    @staticmethod
+    def _percentile(ordered, fraction):
+        index = min(len(ordered) - 1, int(math.ceil(fraction * len(ordered))) - 1)
+        return round(ordered[max(index, 0)] * 1e3, 3)
+
+    def snapshot(self):
+        with self.lock:
+            ordered = sorted(self.latencies)
+            stats = {
+                "uptime_seconds": round(time.time() - self.started, 1),
+                "workers": self.workers,
+                "capacity": self.capacity,
+                "in_flight": self.in_flight,
+                "requests": dict(self.requests),
+                "statuses": dict(self.statuses),
+                "latency_ms": None,
+            }
+        if ordered:
+            stats["latency_ms"] = {
+                "window": len(ordered),
+                "p50": self._percentile(ordered, 0.50),
+                "p90": self._percentile(ordered, 0.90),
+                "p99": self._percentile(ordered, 0.99),
+                "max": round(ordered[-1] * 1e3, 3),
+            }
+        return stats
+
+
+class _ConversionHandler(http.server.BaseHTTPRequestHandler):
+    """
+    POST /convert        one PE preset in, {"preset", "diagnostics"} out
+    POST /convert/batch  a JSON array of PE presets in, an array of results out
+    GET  /stats          counters and latency percentiles
+
+    Options are query parameters named like the command-line flags:
+    volume_mode, eq_only, no_eq, plugins (comma-separated PE names),
+    float_precision and compact (default true).
+    """
+
+    protocol_version = "HTTP/1.1"
+    server_version = f"pulse2easy/{CONVERTER_VERSION}"
+
+    def _send(self, status, body, headers=()):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status, message, headers=()):
+        self._send(status, _json_dumps({"error": message}, compact=True), headers)
+
+    def do_GET(self):
+        path = urllib.parse.urlsplit(self.path).path
+        if path != "/stats":
+            self._send_error(404, f"Unknown endpoint: {path}")
+            self.server.stats.record(path, 404)
+            return
+        self._send(200, _json_dumps(self.server.stats.snapshot()))
+        self.server.stats.record(path, 200)
+
+    def do_POST(self):
+        start = time.perf_counter()
+        url = urllib.parse.urlsplit(self.path)
+        status = self._handle_post(url)
+        self.server.stats.record(url.path, status, time.perf_counter() - start)
+
+    def _handle_post(self, url):
+        """
+        Runs one conversion request and returns the HTTP status sent.
+        """
+        length = self.headers.get("Content-Length")
+        if length is None:
+            self.close_connection = True
+            self._send_error(411, "Content-Length is required")
+            return 411
+        try:
+            length = int(length)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.close_connection = True
+            self._send_error(400, "Content-Length must be a non-negative integer")
+            return 400
+        if length > SERVE_MAX_BODY:
+            self.close_connection = True
+            self._send_error(413, f"Request body is larger than {SERVE_MAX_BODY} bytes")
+            return 413
+        body = self.rfile.read(length)
+
+        if url.path not in ("/convert", "/convert/batch"):
+            self._send_error(404, f"Unknown endpoint: {url.path}")
+            return 404
+        try:
+            query = urllib.parse.parse_qs(url.query, keep_blank_values=True)
+            options, float_precision, compact = _service_options(query)
+        except ValueError as e:
+            self._send_error(400, str(e))
+            return 400
+
+        stats = self.server.stats
+        if not self.server.slots.acquire(blocking=False):
+            self._send_error(503, "Server busy, retry later", [("Retry-After", "1")])
+            return 503
+        with stats.lock:
+            stats.in_flight += 1
+        try:
+            future = self.server.pool.submit(
+                _serve_task,
+                self.server.worker_state,
+                url.path == "/convert/batch",
+                body,
+                options,
+                float_precision,
+                compact,
+            )
+            status, response = future.result()
+        except Exception as e:
+            status, response = 500, _json_dumps({"error": str(e)}, compact=True)
+        finally:
+            with stats.lock:
+                stats.in_flight -= 1
+            self.server.slots.release()
+        self._send(status, response)
+        return status
+
+    def log_message(self, format, *args):
+        sys.stderr.write(f"{self.address_string()} - {format % args}\n")
+
+
+class _ConversionServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    """
+    One thread per connection; the conversions themselves run on a process
+    pool. At most `capacity` requests are admitted at a time (running or
+    queued for a worker); the rest get 503 with Retry-After.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 128  # Pending connections; overload is answered with 503
+
+    def __init__(self, address, workers):
+        capacity = workers * SERVE_QUEUE_PER_WORKER
+        self.pool = ProcessPoolExecutor(max_workers=workers)
+        self.slots = threading.BoundedSemaphore(capacity)
+        self.stats = _ServiceStats(workers, capacity)
+        self.worker_state = _worker_state()
+        super().__init__(address, _ConversionHandler)
+
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown(wait=True)
+
+
+def _parse_address(value):
+    """
+    Parses '[HOST:]PORT' for --serve. The host defaults to 127.0.0.1.
+    """
+    host, _, port = value.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def _stop_on_signal(signum, frame):
+    raise KeyboardInterrupt
+
+
+def _run_server(address, jobs):
+    """
+    Serves conversions over HTTP until interrupted with Ctrl+C or SIGTERM.
+    """
+    signal.signal(signal.SIGTERM, _stop_on_signal)
+    try:
+        server = _ConversionServer(address, jobs)
+    except OSError as e:
+        print(f" {ICON_ERROR} Cannot listen on {address[0]}:{address[1]}: {e}")
+        sys.exit(1)
+    host, port = server.server_address[:2]
+    print(
+        f"{ICON_INFO} Serving on http://{host}:{port} with {jobs} worker(s). "
+        "Press Ctrl+C to stop."
+    )
+    print(f"{ICON_INFO} POST /convert, POST /convert/batch, GET /stats")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n{ICON_INFO} Shutting down.")
+    finally:
+        server.server_close()
+
+
+def _write_profile(path, files, start):
+    """
+    Writes the --profile stats JSON and prints a short stage summary.
+    """
+    stats = _profiler.report(files, time.perf_counter() - start)
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(stats, f, indent=2)
+    except OSError as e:
+        print(f" {ICON_ERROR} Could not write profile {path}: {e}", file=sys.stderr)
+        return
+
+    print(f"\n---   {ICON_INFO} PROFILE ---", file=sys.stderr)
+    for name, stage in stats["stages"].items():
+        print(
+            f"{name:<12}{stage['calls']:>9} calls{stage['seconds']:>11.3f}s",
+            file=sys.stderr,
+        )
+    print(
+        f"{stats['files_per_second']} files/s, peak memory "
+        f"{stats['peak_memory_kib']} KiB. Stats written to {path}",
+        file=sys.stderr,
+    )
+
+
+def main():
+    """
+    Main entry point. Parses command-line arguments and runs conversion.
     """
     parser = argparse.ArgumentParser(
         description="""Convert PulseEffects (PE) legacy presets to EasyEffects (EE) v7+ format.
@@ -1201,7 +5097,11 @@ https://github.com/Lukas-Alexander/pulse-effects-2-easy-effects-converter
         metavar="input.json",
         type=str,
         nargs="*",  # Allow zero or more files
-        help="One or more PE preset .json file(s) to convert.",
+        help="""One or more PE preset .json file(s) to convert.
+Archives (.zip, .tar, .tar.gz, .tgz) are converted member by member
+into a new '<name>_ee' archive of the same type.
+Directories are searched recursively for .json presets
+(e.g. ~/.config/PulseEffects with its output/ and input/ folders).""",
     )
 
     # --- Volume/Headroom Group ---
@@ -1261,59 +5161,394 @@ You may still need to manually adjust volumes after loading.""",
     filter_group.add_argument(
         "--selected",
         action="store_true",
-        help="Show an interactive menu to select which plugins to convert.",
+        help="""Show an interactive menu to select which plugins to convert.
+End a choice with '!' to reuse it for every remaining preset
+with the same plugins.""",
     )
 
-    # Default is now 'transparent'
-    parser.set_defaults(volume_mode="transparent")
+    parser.add_argument(
+        "--eq-gain-offset",
+        type=float,
+        default=0.0,
+        metavar="DB",
+        help="Add DB to every equalizer band gain (e.g. -3 for headroom).",
+    )
+    parser.add_argument(
+        "--eq-normalize",
+        action="store_true",
+        help="""Shift all equalizer band gains so the highest band sits at 0dB.
+Applied before --eq-gain-offset.""",
+    )
+    parser.add_argument(
+        "--eq-link",
+        action="store_true",
+        help="""Use the left equalizer bands for both channels
+(turns 'split-channels' off).""",
+    )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "--plugin-include",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="""Only convert plugins matching PATTERN: a position in the preset
+(1-based, as numbered by --selected) or a shell-style name
+pattern, e.g. 'equalizer' or 'multiband_*'. Works unattended,
+also with --jobs. May be given several times.""",
+    )
+    parser.add_argument(
+        "--plugin-exclude",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="""Skip plugins matching PATTERN (as for --plugin-include).
+May be given several times.""",
+    )
+    parser.add_argument(
+        "--plugin-rules",
+        dest="plugin_rules_file",
+        metavar="FILE",
+        help="""Read plugin rules from FILE, one 'include PATTERN' or
+'exclude PATTERN' per line ('#' starts a comment).
+Combined with --plugin-include/--plugin-exclude.""",
+    )
 
-    # Handle no arguments
-    if not args.input_files:
-        parser.print_help(sys.stderr)
-        sys.exit(1)
+    parser.add_argument(
+        "--include",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="""Only convert presets found in directories whose relative path
+or file name matches PATTERN (shell-style, e.g. 'output/*').
+May be given several times.""",
+    )
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="""Skip presets and subdirectories found in directories whose
+relative path or name matches PATTERN. May be given several times.""",
+    )
 
-    for input_file in args.input_files:
-        if not input_file.endswith(".json"):
-            print(f"{ICON_INFO} Skipping non-JSON file: {input_file}")
-            continue
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="""Convert N files in parallel worker processes (0 = one per CPU).
+Log output is still printed per file, in input order.""",
+    )
 
-        print(f"--- Converting: {input_file} ---")
-        try:
-            with open(input_file, "r", encoding="utf-8") as f:
-                pulse_data = json.load(f)
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=f"""Skip presets whose '_ee.json' is already up to date.
+Source and output hashes plus the conversion options are
+recorded in a '{MANIFEST_NAME}' file next to the outputs.""",
+    )
 
-            converted_data = convert_pulseeffects_to_easyeffects(pulse_data, args)
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="""Check every converted preset against the known EasyEffects
+settings (types, allowed values, ranges, band layouts) and
+report each problem as a warning.""",
+    )
 
-            if converted_data is None:  # Skipped due to filters
-                print(f"        {ICON_WARN} No preset file written for {input_file}.\n")
-                continue
-            if converted_data == "CANCELLED":  # User quit interactive prompt
-                break
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help=f"""Read the next {PIPELINE_DEPTH} presets and write finished outputs in
+background threads while the current preset converts.
+Speeds up serial runs on slow storage such as network home
+directories. Ignored with --jobs and --selected.""",
+    )
 
-            # Create a safe output filename
-            base_name = os.path.splitext(input_file)[0]
-            if base_name.endswith("_ee"):
-                base_name = base_name[:-3]
-            output_file = f"{base_name}_ee.json"
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="""Read one PE preset per line (NDJSON) from stdin and write one
+EE preset per line to stdout. Diagnostics go to stderr.
+Presets that cannot be converted are written as 'null'.""",
+    )
+
+    parser.add_argument(
+        "--watch",
+        metavar="DIR",
+        help=f"""Keep running and convert presets below DIR whenever they are
+created or changed (inotify on Linux, polling elsewhere).
+Changes are converted after {WATCH_DEBOUNCE}s without further writes.
+Combine with --incremental to first catch up on changes made
+while the watcher was not running. Stop with Ctrl+C.""",
+    )
+
+    parser.add_argument(
+        "--serve",
+        metavar="[HOST:]PORT",
+        help="""Run a local HTTP conversion service (default host 127.0.0.1):
+POST /convert, POST /convert/batch and GET /stats. Conversion
+options are query parameters, e.g. ?volume_mode=headroom_3.
+Requests run on --jobs worker processes.""",
+    )
+
+    parser.add_argument(
+        "--index",
+        metavar="DB",
+        help="""Load the given presets, their conversion results (plugins_order,
+every plugin setting) and all warnings into the SQLite file DB
+instead of writing '_ee.json' files. Re-running only converts
+presets that changed; presets gone from an indexed folder are
+dropped.""",
+    )
+    parser.add_argument(
+        "--index-query",
+        metavar="SQL",
+        help="""Run SQL against the --index database and print the rows,
+e.g. "SELECT path FROM presets JOIN plugins ON preset = id
+WHERE name = 'multiband_gate'". Runs after indexing any
+given presets.""",
+    )
+
+    parser.add_argument(
+        "--block-cache",
+        metavar="PATH",
+        help="""Keep converted plugin blocks in an SQLite file at PATH, so
+blocks shared between presets are reused across runs and workers.""",
+    )
+    parser.add_argument(
+        "--block-cache-size",
+        type=int,
+        default=BLOCK_CACHE_SIZE,
+        metavar="N",
+        help=f"""Converted plugin blocks kept in memory (default: {BLOCK_CACHE_SIZE}).
+0 turns the in-memory cache off.""",
+    )
+
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="""Write presets without indentation or spaces. Smaller and much
+faster to write; EasyEffects reads them the same way.""",
+    )
+    parser.add_argument(
+        "--float-precision",
+        type=int,
+        metavar="N",
+        help="Round all decimal values in the output to N digits (0-15).",
+    )
+
+    # --- Log Level Group ---
+    log_group = parser.add_mutually_exclusive_group()
+    log_group.add_argument(
+        "-q",
+        "--quiet",
+        dest="log_level",
+        action="store_const",
+        const="quiet",
+        help="Only print errors and the final summary.",
+    )
+    log_group.add_argument(
+        "-v",
+        "--verbose",
+        dest="log_level",
+        action="store_const",
+        const="verbose",
+        help="Also print the affected key with its old and new value.",
+    )
+    parser.add_argument(
+        "--event-log",
+        metavar="FILE",
+        help="""Write one JSON object per line to FILE for every conversion
+note (file, plugin, event, level, key, old, new, message)
+and for the result of every file.""",
+    )
 
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(converted_data, f, indent=4)
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="pulse2easy-profile.json",
+        metavar="STATS.json",
+        help="""Record time and call counts per stage and plugin type plus peak
+memory, show a live progress line and write the stats as JSON
+(default file: pulse2easy-profile.json).""",
+    )
+
+    # Default is now 'transparent'
+    parser.set_defaults(volume_mode="transparent", log_level="normal")
+
+    args = parser.parse_args()
+
+    if args.float_precision is not None and not 0 <= args.float_precision <= 15:
+        parser.error("--float-precision must be between 0 and 15")
+    if args.jobs < 0:
+        parser.error("--jobs must not be negative (0 = one per CPU)")
+
+    args.plugin_rules = []
+    if args.plugin_rules_file:
+        try:
+            args.plugin_rules = _read_plugin_rules(args.plugin_rules_file)
+        except (OSError, ValueError) as e:
+            parser.error(f"--plugin-rules: {e}")
+    args.plugin_rules += [("include", pattern) for pattern in args.plugin_include]
+    args.plugin_rules += [("exclude", pattern) for pattern in args.plugin_exclude]
+    if args.plugin_rules and args.selected:
+        parser.error(
+            "--selected cannot be combined with --plugin-include, "
+            "--plugin-exclude or --plugin-rules"
+        )
 
-            print(f"        {ICON_SUCCESS} Converted preset saved as: {output_file}\n")
+    if not math.isfinite(args.eq_gain_offset):
+        parser.error("--eq-gain-offset must be a finite number")
 
-        except json.JSONDecodeError:
+    if args.event_log and (args.serve or args.index):
+        parser.error("--event-log cannot be combined with --serve or --index")
+    try:
+        _configure_logging(args.log_level, args.event_log)
+    except OSError as e:
+        parser.error(f"--event-log: {e}")
+
+    if args.block_cache_size < 0:
+        parser.error("--block-cache-size must not be negative")
+    configure_block_cache(args.block_cache_size, args.block_cache)
+
+    profile_start = time.perf_counter()
+    if args.profile:
+        _start_profiler()
+
+    if args.index_query and not args.index:
+        parser.error("--index-query needs --index DB")
+    if args.index:
+        if args.selected or args.stream or args.watch or args.serve:
+            parser.error(
+                "--index cannot be combined with --selected, --stream, --watch "
+                "or --serve"
+            )
+        if not args.input_files and not args.index_query:
+            parser.error("--index needs presets to index or --index-query")
+        if args.input_files:
+            jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+            _buffer_stdout()
+            summary = _run_index(args.index, args.input_files, args, jobs)
+            if args.profile:
+                _write_profile(args.profile, sum(summary.values()), profile_start)
             print(
-                f" {ICON_ERROR} Error: Failed to decode JSON from {input_file}. Is it valid?"
+                f"{ICON_SUCCESS} Index {args.index} updated: "
+                f"{summary['indexed']} indexed, {summary['unchanged']} unchanged, "
+                f"{summary['removed']} removed, {summary['failed']} failed."
             )
-        except Exception as e:
-            print(f" {ICON_ERROR} An unexpected error occurred for {input_file}: {e}")
-            import traceback
+        if args.index_query:
+            try:
+                _run_index_query(args.index, args.index_query)
+            except sqlite3.Error as e:
+                print(f" {ICON_ERROR} Query failed: {e}", file=sys.stderr)
+                sys.exit(1)
+        return
+
+    if args.stream:
+        if args.input_files or args.selected or args.watch or args.serve:
+            parser.error(
+                "--stream reads stdin and cannot be combined with files, "
+                "--watch, --serve or --selected"
+            )
+        jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+        summary = _run_stream(args, jobs)
+        print(
+            f"{ICON_SUCCESS} Done. {summary['converted']} converted, "
+            f"{summary['skipped']} skipped, {summary['failed']} failed.",
+            file=sys.stderr,
+        )
+        if args.profile:
+            _write_profile(args.profile, sum(summary.values()), profile_start)
+        return
+
+    if args.serve:
+        if args.input_files or args.selected or args.watch:
+            parser.error("--serve cannot be combined with files, --watch or --selected")
+        try:
+            address = _parse_address(args.serve)
+        except ValueError:
+            parser.error(f"--serve: invalid [HOST:]PORT: {args.serve}")
+        jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+        _run_server(address, jobs)
+        return
+
+    if args.watch:
+        if args.input_files or args.selected:
+            parser.error("--watch cannot be combined with files or --selected")
+        if not os.path.isdir(args.watch):
+            parser.error(f"--watch: not a directory: {args.watch}")
+        jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+        manifest = _Manifest() if args.incremental else None
+        summary = collections.Counter()
+        if manifest:
+            catch_up = _walk_presets(args.watch, args.include, args.exclude)
+            for _name, status, _entry in _run_inputs(catch_up, args, jobs, manifest):
+                summary[status] += 1
+            manifest.save()
+        summary.update(_run_watch(args.watch, args, jobs, manifest))
+        if args.profile:
+            _write_profile(args.profile, sum(summary.values()), profile_start)
+        unchanged = f"{summary['unchanged']} unchanged, " if manifest else ""
+        print(
+            f"{ICON_INFO} {summary['converted']} converted, "
+            f"{summary['identical']} identical (not rewritten), {unchanged}"
+            f"{summary['skipped']} skipped, {summary['failed']} failed."
+        )
+        return
+
+    # Handle no arguments
+    if not args.input_files:
+        parser.print_help(sys.stderr)
+        sys.exit(1)
 
-            traceback.print_exc()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    if jobs > 1 and args.selected:
+        print(
+            f"{ICON_INFO} --selected needs the terminal; ignoring --jobs and converting serially."
+        )
+        jobs = 1
+    if args.pipeline and (jobs > 1 or args.selected):
+        print(f"{ICON_INFO} --pipeline only applies to serial runs; ignoring it.")
+        args.pipeline = False
+
+    manifest = _Manifest() if args.incremental else None
+
+    _buffer_stdout()
+    input_files = _expand_inputs(args.input_files, args.include, args.exclude)
+    results = _run_inputs(input_files, args, jobs, manifest)
+
+    # Archives and directories hold an unknown number of presets and are
+    # expanded lazily, so only plain file lists have a known total.
+    lazy = any(_is_archive(path) or os.path.isdir(path) for path in args.input_files)
+    total = None if lazy else len(args.input_files)
+    progress = _Progress(total) if args.profile else None
+
+    summary = collections.Counter()
+    for _name, status, _entry in results:
+        if status == "cancelled":  # User quit interactive prompt
+            break
+        summary[status] += 1
+        if progress:
+            progress.update()
+
+    if progress:
+        progress.finish()
+    if manifest:
+        manifest.save()
+    if args.profile:
+        _write_profile(args.profile, sum(summary.values()), profile_start)
 
     print(f"{ICON_SUCCESS} Done.")
+    unchanged = f"{summary['unchanged']} unchanged, " if args.incremental else ""
+    print(
+        f"{ICON_INFO} {summary['converted']} converted, "
+        f"{summary['identical']} identical (not rewritten), {unchanged}"
+        f"{summary['skipped']} skipped, {summary['failed']} failed."
+    )
+    if not _shown("info"):
+        return
 
     # Add final message for all volume-forcing modes
     if args.volume_mode == "transparent":
@@ -1321,14 +5556,8 @@ You may still need to manually adjust volumes after loading.""",
         print(
             f"{ICON_INFO} Presets were converted in default transparent mode (-6.0dB headroom)."
         )
-    elif args.volume_mode in ["headroom_0", "headroom_3", "headroom_6", "reset_1"]:
-        FORCE_SET_DB_MAP = {
-            "headroom_0": "0.0dB",
-            "headroom_3": "-3.0dB",
-            "headroom_6": "-6.0dB",
-            "reset_1": "-1.0dB",
-        }
-        db_val = FORCE_SET_DB_MAP[args.volume_mode]
+    elif args.volume_mode in FORCE_SET_DB_MAP:
+        db_val = f"{FORCE_SET_DB_MAP[args.volume_mode]}dB"
         print(f"\n---   {ICON_WARN} IMPORTANT ---")
         print(
             f"{ICON_INFO} You used a volume-forcing mode. All gain levels have been set to {db_val}."
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Checks that the JSON backend gives the same data and bytes with orjson as
+with the stdlib alone. The stdlib side always runs; the orjson side is
+skipped when orjson is not installed.
+
+Usage: python3 -m unittest discover tests
+"""
+import argparse
+import importlib.util
+import json
+import os
+import unittest
+from unittest import mock
+
+SCRIPT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "convert-pulse2easy.py"
+)
+
+
+def load_converter():
+    # The hyphen in the script name rules out a plain import.
+    spec = importlib.util.spec_from_file_location("pulse2easy", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+converter = load_converter()
+
+# Documents where orjson alone would read something else or nothing at all.
+DOCUMENTS = [
+    '{"gain": 18446744073709551616}',  # 2**64
+    '{"gain": -9223372036854775809}',  # -2**63 - 1
+    '{"gain": 123456789012345678901234567890}',
+    '{"gain": 9223372036854775807, "min": -9223372036854775808}',
+    '{"a": 1e16, "b": 1E+16, "c": 1e-7, "d": 0.00001, "e": 5e-324}',
+    '{"a": 1.7976931348623157e308, "b": -0.0, "c": 2.5E-3}',
+    '{"a": NaN, "b": Infinity, "c": -Infinity}',
+    '{"name": "\\u007f", "raw": "\x7f"}',
+    '{"name": "Stra\\u00dfe", "raw": "Straße éè \U0001f3a7"}',
+    '{"pair": "\\ud83c\\udfa7", "lone": "\\ud800", "sep": "\u2028"}',
+    '{"output": {"plugins_order": ["equalizer"], "equalizer": {"state": "true"}}}',
+    '[null, true, false, 0, -1, 1.5, "", [], {}]',
+]
+
+# Values where orjson's compact output alone would differ from json.dumps().
+VALUES = [
+    {"gain": 2 ** 64, "min": -(2 ** 63) - 1, "big": 10 ** 30},
+    {"max": 2 ** 63 - 1, "min": -(2 ** 63)},
+    {"a": 1e16, "b": 1e-5, "c": 1e-7, "d": 0.0001, "e": 5e-324, "f": 1.5e300},
+    {"a": float("nan"), "b": float("inf"), "c": float("-inf"), "d": -0.0},
+    {"del": "\x7f", "latin": "Straße", "emoji": "\U0001f3a7"},
+    {"sep": "\u2028", "lone": "\ud800", "ctrl": "\x00\x1f"},
+    {"output": {"plugins_order": [], "blocklist": []}, "flag": None},
+    [0.1, 0.123456789, 1 / 3, 100.0, -3.25, True, False, None],
+]
+
+
+def stdlib_compact(data):
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+class JsonBackendCases:
+    """
+    The checks shared by both backends. Expected results always come from
+    the json module directly.
+    """
+
+    def test_loads_matches_stdlib(self):
+        for document in DOCUMENTS:
+            expected = repr(json.loads(document))
+            for data in (document, document.encode("utf-8")):
+                with self.subTest(data=data):
+                    self.assertEqual(repr(converter._json_loads(data)), expected)
+
+    def test_loads_rejects_invalid_utf8(self):
+        with self.assertRaises((ValueError, UnicodeDecodeError)):
+            converter._json_loads(b'{"name": "\xff"}')
+
+    def test_compact_dumps_matches_stdlib(self):
+        for data in VALUES:
+            with self.subTest(data=data):
+                self.assertEqual(
+                    converter._json_dumps(data, compact=True), stdlib_compact(data)
+                )
+
+    def test_indented_dumps_matches_stdlib(self):
+        for data in VALUES:
+            with self.subTest(data=data):
+                self.assertEqual(
+                    converter._json_dumps(data),
+                    json.dumps(data, indent=4).encode("utf-8"),
+                )
+
+    def test_output_options_match_stdlib(self):
+        for compact in (False, True):
+            for float_precision in (None, 0, 3, 15):
+                args = argparse.Namespace(
+                    compact=compact, float_precision=float_precision
+                )
+                for data in VALUES:
+                    with self.subTest(data=data, args=args):
+                        if float_precision is not None:
+                            rounded = converter._round_floats(data, float_precision)
+                        else:
+                            rounded = data
+                        if compact:
+                            expected = stdlib_compact(rounded)
+                        else:
+                            expected = json.dumps(rounded, indent=4).encode("utf-8")
+                        self.assertEqual(converter._serialize(data, args), expected)
+
+    def test_round_trip(self):
+        for document in DOCUMENTS:
+            with self.subTest(document=document):
+                data = converter._json_loads(document.encode("utf-8"))
+                self.assertEqual(
+                    converter._json_dumps(data, compact=True), stdlib_compact(data)
+                )
+
+
+class StdlibBackendTest(JsonBackendCases, unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(converter, "orjson", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+@unittest.skipIf(converter.orjson is None, "orjson is not installed")
+class OrjsonBackendTest(JsonBackendCases, unittest.TestCase):
+    pass
+
+
+if __name__ == "__main__":
+    unittest.main()